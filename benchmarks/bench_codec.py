@@ -0,0 +1,98 @@
+"""Measure ETHM-1 frame decoding throughput.
+
+Decodes a capture of the answers the panel sends while monitoring, cut into
+TCP sized chunks, with :class:`FrameDecoder` and with the split, verify and
+bit listing done by ``satel_integra``.  No recordings ship with the
+repository, so the capture is synthesized with ``encode_frame``; pass the
+path of a raw byte dump to decode a real one instead.  Run from the
+repository root::
+
+    python benchmarks/bench_codec.py [capture.bin]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from satel_integra.satel_integra import list_set_bits, verify_and_strip  # noqa: E402
+
+from custom_components.satel.codec import FrameDecoder, encode_frame, iter_ids  # noqa: E402
+
+FRAMES = 20000
+CHUNK = 1460
+ROUNDS = 5
+
+# Command and answer length of the state queries sent while monitoring.
+_ANSWERS = ((0x00, 32), (0x17, 32), (0x09, 4), (0x0A, 4), (0x2A, 4), (0x7F, 5))
+
+
+def _capture() -> bytes:
+    rnd = random.Random(1)
+    frames = []
+    for _ in range(FRAMES):
+        command, length = rnd.choice(_ANSWERS)
+        data = bytes(rnd.getrandbits(8) if rnd.random() < 0.1 else 0 for _ in range(length))
+        frames.append(encode_frame(command, data))
+        if rnd.random() < 0.05:
+            frames.append(encode_frame(0xEF, b"\x00"))
+    return b"".join(frames)
+
+
+def _chunks(capture: bytes) -> list[bytes]:
+    return [capture[pos : pos + CHUNK] for pos in range(0, len(capture), CHUNK)]
+
+
+def _decoder(chunks: list[bytes]) -> int:
+    decoder = FrameDecoder()
+    ids = 0
+    for chunk in chunks:
+        for frame in decoder.feed(chunk):
+            if frame.command < 0x80:
+                ids += sum(1 for _ in iter_ids(frame.mask))
+    return decoder.frames
+
+
+def _library(chunks: list[bytes]) -> int:
+    # satel_integra reads up to each FE 0D with StreamReader.readuntil.
+    pending = b""
+    frames = 0
+    for chunk in chunks:
+        pending += chunk
+        *complete, pending = pending.split(b"\xfe\x0d")
+        for raw in complete:
+            data = verify_and_strip(raw + b"\xfe\x0d")
+            frames += 1
+            if data[0] < 0x80:
+                list_set_bits(data, len(data) - 1)
+    return frames
+
+
+def _rate(decode, chunks: list[bytes]) -> tuple[int, float]:
+    best = float("inf")
+    frames = 0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        frames = decode(chunks)
+        best = min(best, time.perf_counter() - start)
+    return frames, frames / best
+
+
+def main() -> None:
+    capture = Path(sys.argv[1]).read_bytes() if len(sys.argv) > 1 else _capture()
+    chunks = _chunks(capture)
+    print(f"capture={len(capture)} bytes chunks={len(chunks)} x {CHUNK} B")
+    for name, decode in (
+        ("FrameDecoder ", _decoder),
+        ("satel_integra", _library),
+    ):
+        frames, rate = _rate(decode, chunks)
+        print(f"{name}: {frames} frames, {rate:10.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measure the cost of integration key encryption per frame.
+
+Times wrapping a query and unwrapping the answer for typical monitoring
+frames with the session's cached key schedule, and the same work when the
+AES key is expanded again for every frame.  Run from the repository root::
+
+    python benchmarks/bench_encryption.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.satel.codec import encode_frame  # noqa: E402
+from custom_components.satel.encryption import EncryptedSession  # noqa: E402
+
+KEY = "secret"
+NUMBER = 20000
+
+FRAMES = {
+    "query 0x00        ": encode_frame(0x00),
+    "zones answer 0x00 ": encode_frame(0x00, bytes(32)),
+    "arm 0x80 + code   ": encode_frame(0x80, bytes(8) + b"\x01\x00\x00\x00"),
+}
+
+
+def _pair() -> tuple[EncryptedSession, EncryptedSession]:
+    client = EncryptedSession(KEY)
+    panel = EncryptedSession(KEY)
+    panel.id_r = client.id_s
+    return client, panel
+
+
+def main() -> None:
+    print(f"frames={NUMBER}")
+    for name, frame in FRAMES.items():
+        client, panel = _pair()
+        pdu = panel.wrap(frame)[1:]
+
+        def cached() -> None:
+            client.wrap(frame)
+            client.unwrap(pdu)
+
+        def expanded() -> None:
+            session = EncryptedSession(KEY)
+            session.id_s = client.id_s
+            session.wrap(frame)
+            session.unwrap(pdu)
+
+        for label, step in (("cached schedule", cached), ("per-frame setup", expanded)):
+            elapsed = timeit.timeit(step, number=NUMBER) / NUMBER * 1e6
+            print(
+                f"{name} {label}: {elapsed:6.2f} us/frame "
+                f"({1e6 / elapsed:9.0f} frames/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
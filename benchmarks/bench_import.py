@@ -0,0 +1,85 @@
+"""Measure the import time of the integration with ``python -X importtime``.
+
+Loading the integration or opening its config flow imports the package, the
+config flow and the platforms.  The protocol library, the encryption layer
+and the proxy are only imported once a hub connects; the second line times
+what importing them up front used to add.  Each import runs in a fresh
+interpreter and the best of several runs is reported.  Run from the
+repository root::
+
+    python benchmarks/bench_import.py
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+RUNS = 5
+
+INTEGRATION = [
+    "custom_components.satel",
+    "custom_components.satel.config_flow",
+    "custom_components.satel.alarm_control_panel",
+    "custom_components.satel.binary_sensor",
+    "custom_components.satel.sensor",
+    "custom_components.satel.switch",
+]
+PROTOCOL = [
+    "satel_integra.satel_integra",
+    "custom_components.satel.transport",
+    "custom_components.satel.encryption",
+    "custom_components.satel.proxy",
+]
+
+
+def _import_times(modules: list[str]) -> dict[str, tuple[int, int]]:
+    """Return the self and cumulative import time of every module, in us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def _measure(modules: list[str]) -> tuple[float, float]:
+    """Return the best total and integration-only import time in ms."""
+    best_total = best_own = float("inf")
+    for _ in range(RUNS):
+        times = _import_times(modules)
+        total = sum(own for own, _ in times.values())
+        own = sum(
+            own
+            for name, (own, _) in times.items()
+            if name.startswith(("custom_components.satel", "satel_integra"))
+        )
+        best_total = min(best_total, total / 1000)
+        best_own = min(best_own, own / 1000)
+    return best_total, best_own
+
+
+def main() -> None:
+    # Home Assistant's own modules dominate the total; they are loaded
+    # anyway when the integration is set up.
+    for name, modules in (
+        ("integration (lazy)     ", INTEGRATION),
+        ("integration + protocol ", INTEGRATION + PROTOCOL),
+    ):
+        total, own = _measure(modules)
+        print(f"{name}: {total:7.1f} ms total, {own:6.1f} ms in satel modules")
+
+
+if __name__ == "__main__":
+    main()
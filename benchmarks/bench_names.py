@@ -0,0 +1,94 @@
+"""Measure name discovery time on a simulated INTEGRA 256 PLUS.
+
+The simulated panel answers one query at a time, taking 1 ms per query,
+behind a 4 ms network round trip.  48 of its 256 zones, 24 outputs and 4
+partitions are in use.  Reading every name request-then-response pays the
+round trip for each of the 544 ids; the pipelined reader writes the
+queries of a window of ids at once and pays it once per window.  Run from
+the repository root::
+
+    python benchmarks/bench_names.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.satel.codec import FrameDecoder  # noqa: E402
+from custom_components.satel.names import (  # noqa: E402
+    MAX_PARTITIONS,
+    NAME_OUTPUT,
+    NAME_PARTITION,
+    NAME_ZONE,
+    NameReader,
+)
+
+RTT = 0.004
+PROCESS = 0.001
+ZONES = 256
+USED = {
+    NAME_ZONE: range(1, 49),
+    NAME_OUTPUT: range(1, 25),
+    NAME_PARTITION: range(1, 5),
+}
+
+
+class SimulatedPanel:
+    """Answer name queries in order after the network and panel delays."""
+
+    def __init__(self) -> None:
+        self.reader: NameReader | None = None
+        self.queries = 0
+        self._busy_until = 0.0
+        self._decoder = FrameDecoder()
+
+    async def exchange(self, frames: bytes, answered: asyncio.Future) -> object:
+        loop = asyncio.get_running_loop()
+        for frame in self._decoder.feed(frames):
+            self.queries += 1
+            self._busy_until = max(loop.time() + RTT / 2, self._busy_until) + PROCESS
+            loop.call_at(self._busy_until + RTT / 2, self._answer, *frame.data)
+        return await answered
+
+    def _answer(self, kind: int, number: int) -> None:
+        if number in USED[kind]:
+            name = f"Device {number}".encode().ljust(16)
+            self.reader.handle(bytes((0xEE, kind, number, 1)) + name)
+        else:
+            self.reader.handle(b"\xef\x08")
+
+
+async def _sequential() -> tuple[float, int, int]:
+    panel = SimulatedPanel()
+    panel.reader = reader = NameReader(panel.exchange, "utf-8", depth=1)
+    start = time.perf_counter()
+    found = [
+        await reader.read(NAME_ZONE, ZONES),
+        await reader.read(NAME_OUTPUT, ZONES),
+        await reader.read(NAME_PARTITION, MAX_PARTITIONS),
+    ]
+    return time.perf_counter() - start, panel.queries, sum(map(len, found))
+
+
+async def _pipelined() -> tuple[float, int, int]:
+    panel = SimulatedPanel()
+    panel.reader = reader = NameReader(panel.exchange, "utf-8")
+    start = time.perf_counter()
+    found = await reader.read_all(72)
+    return time.perf_counter() - start, panel.queries, sum(map(len, found.values()))
+
+
+def main() -> None:
+    print(f"zones={ZONES} rtt={RTT * 1000:.0f} ms panel={PROCESS * 1000:.0f} ms/query")
+    for name, run in (("request-response", _sequential), ("pipelined       ", _pipelined)):
+        elapsed, queries, found = asyncio.run(run())
+        print(f"{name}: {elapsed * 1000:7.1f} ms, {queries} queries, {found} names")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Time the partition callback at 32 partitions.
+
+The library calls the partition callback after every partition state frame,
+each carrying one alarm state.  The former callback gathered every partition
+from all state lists and derived each one with up to eight list lookups,
+rewriting all of them; the bitmask version derives only the partitions
+whose bits changed.  Run from the repository root::
+
+    python benchmarks/bench_partitions.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from satel_integra.satel_integra import AlarmState  # noqa: E402
+
+from custom_components.satel.codec import ids_to_mask  # noqa: E402
+from custom_components.satel.state import PartitionMasks, SatelState  # noqa: E402
+
+PARTITIONS = 32
+FRAMES = 2000
+
+
+def _legacy_callback(states, partitions, state: SatelState) -> int:
+    """The former derivation; returns how many partitions it evaluated."""
+    candidates: set[int] = set()
+    for part_list in states.values():
+        candidates.update(part_list)
+    candidates &= partitions
+    for part in candidates:
+        if part in states.get(AlarmState.TRIGGERED, []) or part in states.get(
+            AlarmState.TRIGGERED_FIRE, []
+        ):
+            alarm = "TRIGGERED"
+        elif part in states.get(AlarmState.ENTRY_TIME, []) or part in states.get(
+            AlarmState.EXIT_COUNTDOWN_OVER_10, []
+        ) or part in states.get(AlarmState.EXIT_COUNTDOWN_UNDER_10, []):
+            alarm = "PENDING"
+        elif part in states.get(AlarmState.ARMED_MODE1, []):
+            alarm = "ARMED_HOME"
+        elif part in states.get(AlarmState.ARMED_MODE2, []):
+            alarm = "ARMED_NIGHT"
+        elif part in states.get(AlarmState.ARMED_MODE0, []):
+            alarm = "ARMED_AWAY"
+        else:
+            alarm = "DISARMED"
+        state.set_partition(part, alarm)
+    return len(candidates)
+
+
+def _frames(rng: random.Random) -> list[dict]:
+    """Return the partition states after each frame of a busy panel."""
+    groups = list(AlarmState)
+    states = {group: [] for group in groups}
+    states[AlarmState.ARMED_MODE0] = list(range(1, PARTITIONS + 1, 2))
+    frames = []
+    for _ in range(FRAMES):
+        group = rng.choice(groups[:-1])
+        current = set(states[group])
+        current ^= {rng.randint(1, PARTITIONS)}
+        states = {**states, group: sorted(current)}
+        frames.append(states)
+    return frames
+
+
+def main() -> None:
+    frames = _frames(random.Random(1))
+    partitions = frozenset(range(1, PARTITIONS + 1))
+    wanted = ids_to_mask(partitions)
+
+    def legacy() -> int:
+        state = SatelState()
+        return sum(_legacy_callback(states, partitions, state) for states in frames)
+
+    def masks() -> int:
+        state = SatelState()
+        derive = PartitionMasks().update
+        evaluated = 0
+        for states in frames:
+            for part, alarm in derive(states, wanted):
+                evaluated += 1
+                state.set_partition(part, alarm)
+        return evaluated
+
+    print(f"partitions={PARTITIONS} frames={FRAMES}")
+    for name, func in (("list lookups", legacy), ("bitmasks", masks)):
+        evaluated = func()
+        best = min(timeit.repeat(func, number=1, repeat=5)) / FRAMES
+        print(
+            f"{name:12s}: {best * 1e6:6.2f} us per frame,"
+            f" {evaluated / FRAMES:5.2f} partitions derived per frame"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Count recorder rows written per zone change for each zone entity layout.
+
+Replays zone changes, mostly violations with some tamper and bypass
+changes, against the zone entities of each layout and counts what the
+recorder stores: a ``states`` row for every entity whose state or
+attributes changed and a ``state_attributes`` row for every attribute set
+not stored before.  The former layout wrote both zone entities with four
+attributes each; diagnostic entities are disabled by default and write
+nothing.  Run from the repository root::
+
+    python benchmarks/bench_recorder.py
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.satel.binary_sensor import SatelZoneBinarySensor  # noqa: E402
+from custom_components.satel.sensor import SatelZoneSensor  # noqa: E402
+from custom_components.satel.state import (  # noqa: E402
+    ATTR_ALARM_MEMORY,
+    ATTR_BYPASS,
+    ATTR_TAMPER,
+    ATTR_TROUBLES,
+    ATTR_VIOLATION,
+    ZONE_ATTRIBUTES,
+    SatelState,
+)
+
+ZONES = 64
+CHANGES = 5000
+
+
+def _legacy_attributes(state: SatelState, zone: int) -> dict[str, bool | None]:
+    return {
+        "troubles": state.zone(ATTR_TROUBLES, zone),
+        "tamper": state.zone(ATTR_TAMPER, zone),
+        "bypass": state.zone(ATTR_BYPASS, zone),
+        "alarm_memory": state.zone(ATTR_ALARM_MEMORY, zone),
+    }
+
+
+def _entities(layout: str, coordinator: SimpleNamespace, zone: int) -> list:
+    hub = SimpleNamespace(zone_record=coordinator.data.zone_record)
+    binary = SatelZoneBinarySensor(hub, coordinator, str(zone), "Zone")
+    status = SatelZoneSensor(hub, coordinator, str(zone), "Zone")
+    return {
+        "binary": [binary],
+        "status": [status],
+        "both": [binary, status],
+        "former (both + attributes)": [binary, status],
+    }[layout]
+
+
+def _record(entity, layout: str, state: SatelState, zone: int) -> tuple[str, str]:
+    value = entity.is_on if hasattr(entity, "is_on") else entity.native_value
+    if layout.startswith("former"):
+        attributes = _legacy_attributes(state, zone)
+    else:
+        attributes = entity.extra_state_attributes or {}
+    return str(value), json.dumps(attributes, sort_keys=True)
+
+
+def _changes(rng: random.Random) -> list[tuple[str, int, bool]]:
+    changes = []
+    for _ in range(CHANGES):
+        zone = rng.randint(1, ZONES)
+        attr = rng.choices(
+            (ATTR_VIOLATION, ATTR_TAMPER, ATTR_BYPASS), weights=(90, 5, 5)
+        )[0]
+        changes.append((attr, zone, rng.random() < 0.5))
+    return changes
+
+
+def _replay(
+    layout: str, changes: list[tuple[str, int, bool]]
+) -> tuple[int, int, int]:
+    state = SatelState(ZONES, 0)
+    for attr in ZONE_ATTRIBUTES:
+        state.update_zones(attr, {zone: False for zone in range(1, ZONES + 1)})
+    coordinator = SimpleNamespace(data=state)
+    entities = {zone: _entities(layout, coordinator, zone) for zone in range(1, ZONES + 1)}
+    written = {
+        id(entity): _record(entity, layout, state, zone)
+        for zone, group in entities.items()
+        for entity in group
+    }
+    stored_attributes = {attributes for _, attributes in written.values()}
+    applied = states_rows = attribute_rows = 0
+    for attr, zone, value in changes:
+        if not state.set_zone(attr, zone, value):
+            continue
+        applied += 1
+        for entity in entities[zone]:
+            record = _record(entity, layout, state, zone)
+            if record == written[id(entity)]:
+                continue
+            written[id(entity)] = record
+            states_rows += 1
+            if record[1] not in stored_attributes:
+                stored_attributes.add(record[1])
+                attribute_rows += 1
+    return applied, states_rows, attribute_rows
+
+
+def main() -> None:
+    changes = _changes(random.Random(1))
+    print(f"zones={ZONES} changes={CHANGES}")
+    for layout in ("former (both + attributes)", "both", "status", "binary"):
+        applied, states_rows, attribute_rows = _replay(layout, changes)
+        rows = states_rows + attribute_rows
+        print(
+            f"{layout:27s}: {states_rows:5d} states + {attribute_rows:3d} attribute"
+            f" rows, {rows / applied:.2f} rows per zone change"
+        )
+
+
+if __name__ == "__main__":
+    main()
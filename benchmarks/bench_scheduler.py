@@ -0,0 +1,80 @@
+"""Measure disarm latency behind a burst of output commands.
+
+An automation toggles outputs while a disarm is requested.  Sending every
+command in arrival order makes the disarm wait for the whole burst; the
+scheduler sends it right after the command in flight and drops superseded
+toggles of the same output.  Each panel write is simulated as 2 ms.  Run
+from the repository root::
+
+    python benchmarks/bench_scheduler.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.satel.scheduler import (  # noqa: E402
+    PRIORITY_DISARM,
+    PRIORITY_OUTPUT,
+    CommandScheduler,
+)
+
+WRITE = 0.002
+OUTPUTS = 20
+TOGGLES = 2
+
+
+async def _write() -> None:
+    await asyncio.sleep(WRITE)
+
+
+async def _fifo() -> tuple[float, int]:
+    lock = asyncio.Lock()
+    sent = 0
+
+    async def send() -> None:
+        nonlocal sent
+        async with lock:
+            await _write()
+            sent += 1
+
+    burst = [asyncio.ensure_future(send()) for _ in range(OUTPUTS * TOGGLES)]
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await send()
+    latency = time.perf_counter() - start
+    await asyncio.gather(*burst)
+    return latency, sent
+
+
+async def _scheduled() -> tuple[float, int]:
+    scheduler = CommandScheduler(timeout=10)
+    burst = [
+        asyncio.ensure_future(
+            scheduler.submit(PRIORITY_OUTPUT, _write, key=("output", output))
+        )
+        for _ in range(TOGGLES)
+        for output in range(1, OUTPUTS + 1)
+    ]
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await scheduler.submit(PRIORITY_DISARM, _write)
+    latency = time.perf_counter() - start
+    await asyncio.gather(*burst)
+    return latency, scheduler.sent
+
+
+def main() -> None:
+    print(f"outputs={OUTPUTS} toggles={TOGGLES} write={WRITE * 1000:.0f} ms")
+    for name, run in (("arrival order", _fifo), ("scheduler    ", _scheduled)):
+        latency, sent = asyncio.run(run())
+        print(f"{name}: disarm after {latency * 1000:6.1f} ms, {sent} frames sent")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Measure allocations per monitor event for publishing coordinator data.
+
+Compares the former full copy of the state with versioned snapshots that
+share unchanged attributes.  Run from the repository root::
+
+    python benchmarks/bench_snapshot.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.satel.state import (  # noqa: E402
+    ATTR_VIOLATION,
+    ZONE_ATTRIBUTES,
+    SatelState,
+)
+
+ZONES = 256
+OUTPUTS = 256
+EVENTS = 1000
+
+
+def _populated() -> SatelState:
+    state = SatelState(ZONES, OUTPUTS)
+    for attr in ZONE_ATTRIBUTES:
+        state.update_zones(attr, {zone: False for zone in range(1, ZONES + 1)})
+    state.update_outputs({out: False for out in range(1, OUTPUTS + 1)})
+    for part in range(1, 33):
+        state.set_partition(part, "DISARMED")
+    return state
+
+
+def _legacy_dicts() -> dict[str, dict[str, str]]:
+    keys = ("alarm", "zones", "outputs", "troubles", "tamper", "bypass", "alarm_memory")
+    state = {key: {} for key in keys}
+    for key in keys[1:]:
+        for index in range(1, ZONES + 1):
+            state[key][str(index)] = "OFF"
+    for part in range(1, 33):
+        state["alarm"][str(part)] = "DISARMED"
+    return state
+
+
+def _allocations(publish, event) -> float:
+    """Return the bytes allocated by ``publish`` per event."""
+    total = 0
+    result = None
+    tracemalloc.start()
+    for index in range(EVENTS):
+        event(index)
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = publish()
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - base
+    tracemalloc.stop()
+    del result
+    return total / EVENTS
+
+
+def _timing(publish, event) -> float:
+    """Return the time of one event plus publish in microseconds."""
+    counter = iter(range(10**9))
+
+    def step() -> None:
+        event(next(counter))
+        publish()
+
+    return timeit.timeit(step, number=EVENTS) / EVENTS * 1e6
+
+
+def main() -> None:
+    legacy = _legacy_dicts()
+
+    def legacy_event(index: int) -> None:
+        violated = (index // ZONES) % 2 == 0
+        legacy["zones"][str(index % ZONES + 1)] = "ON" if violated else "OFF"
+
+    def legacy_publish() -> dict[str, dict[str, str]]:
+        return {key: value.copy() for key, value in legacy.items()}
+
+    copied = _populated()
+    snapshotted = _populated()
+
+    def copy_event(index: int) -> None:
+        copied.set_zone(ATTR_VIOLATION, index % ZONES + 1, (index // ZONES) % 2 == 0)
+
+    def snapshot_event(index: int) -> None:
+        snapshotted.set_zone(ATTR_VIOLATION, index % ZONES + 1, (index // ZONES) % 2 == 0)
+
+    print(f"zones={ZONES} outputs={OUTPUTS} events={EVENTS}")
+    for name, publish, event in (
+        ("legacy dict copy ", legacy_publish, legacy_event),
+        ("SatelState.copy  ", copied.copy, copy_event),
+        ("snapshot         ", snapshotted.snapshot, snapshot_event),
+    ):
+        size = _allocations(publish, event)
+        elapsed = _timing(publish, event)
+        print(f"{name}: {size:9.1f} B allocated/event, {elapsed:7.2f} us/event")
+    size = _allocations(snapshotted.snapshot, lambda index: None)
+    elapsed = _timing(snapshotted.snapshot, lambda index: None)
+    print(f"snapshot unchanged: {size:9.1f} B allocated/event, {elapsed:7.2f} us/event")
+
+
+if __name__ == "__main__":
+    main()
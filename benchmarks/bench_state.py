@@ -0,0 +1,113 @@
+"""Compare the bit-packed state store with the former string dictionaries.
+
+Run from the repository root::
+
+    python benchmarks/bench_state.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.satel.state import (  # noqa: E402
+    ATTR_OUTPUTS,
+    ZONE_ATTRIBUTES,
+    ZONE_STATUS_KEYS,
+    SatelState,
+)
+
+ZONES = 256
+OUTPUTS = 256
+ROUNDS = 200
+
+
+def _legacy_state() -> dict[str, dict[str, str]]:
+    state: dict[str, dict[str, str]] = {key: {} for key in ZONE_STATUS_KEYS}
+    state["outputs"] = {}
+    for key in ZONE_STATUS_KEYS:
+        for zone in range(1, ZONES + 1):
+            state[key][str(zone)] = "ON" if zone % 2 else "OFF"
+    for out in range(1, OUTPUTS + 1):
+        state["outputs"][str(out)] = "ON" if out % 2 else "OFF"
+    return state
+
+
+def _packed_state() -> SatelState:
+    state = SatelState(ZONES, OUTPUTS)
+    for attr in ZONE_ATTRIBUTES:
+        for zone in range(1, ZONES + 1):
+            state.set_zone(attr, zone, bool(zone % 2))
+    for out in range(1, OUTPUTS + 1):
+        state.set_output(out, bool(out % 2))
+    return state
+
+
+def _measure(factory) -> int:
+    tracemalloc.start()
+    obj = factory()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def main() -> None:
+    zone_status = {
+        key: {zone: zone % 3 == 0 for zone in range(1, ZONES + 1)}
+        for key in ZONE_STATUS_KEYS
+    }
+    output_status = {out: out % 3 == 0 for out in range(1, OUTPUTS + 1)}
+
+    legacy = _legacy_state()
+    packed = _packed_state()
+
+    def legacy_ingest() -> None:
+        for key, values in zone_status.items():
+            target = legacy[key]
+            for zone, value in values.items():
+                target[str(zone)] = "ON" if value else "OFF"
+        for out, value in output_status.items():
+            legacy["outputs"][str(out)] = "ON" if value else "OFF"
+
+    def packed_ingest() -> None:
+        for key, attr in ZONE_STATUS_KEYS.items():
+            packed.update_zones(attr, zone_status[key])
+        packed.update_outputs(output_status)
+
+    zone_ids = [str(zone) for zone in range(1, ZONES + 1)]
+    output_ids = [str(out) for out in range(1, OUTPUTS + 1)]
+
+    def legacy_read() -> None:
+        # Mirrors the former entity properties reading ``coordinator.data``.
+        for zone in zone_ids:
+            legacy.get("zones", {}).get(zone).upper() == "ON"  # noqa: B015
+        for out in output_ids:
+            legacy.get("outputs", {}).get(out).upper() == "ON"  # noqa: B015
+
+    def packed_read() -> None:
+        for zone in range(1, ZONES + 1):
+            packed.zone_violated(zone)
+        for out in range(1, OUTPUTS + 1):
+            packed.output(out)
+
+    print(f"zones={ZONES} outputs={OUTPUTS} attributes={len(ZONE_ATTRIBUTES) + 1}")
+    print(f"memory  legacy dicts : {_measure(_legacy_state):>8} bytes")
+    print(f"memory  bit arrays   : {_measure(_packed_state):>8} bytes "
+          f"({packed.nbytes} payload, {ATTR_OUTPUTS} included)")
+    for name, func in (
+        ("ingest  legacy dicts ", legacy_ingest),
+        ("ingest  bit arrays   ", packed_ingest),
+        ("read    legacy dicts ", legacy_read),
+        ("read    bit arrays   ", packed_read),
+    ):
+        elapsed = timeit.timeit(func, number=ROUNDS) / ROUNDS
+        print(f"{name}: {elapsed * 1e6:8.1f} us per full pass")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Measure how soon a zone violation reaches an automation trigger.
+
+Feeds zone violations to the hub's monitor callback, as the protocol library
+does for every frame, on a running Home Assistant core and times three
+points after the callback starts: the ``satel_zone_violated`` event
+reaching an event trigger listener, the coalesced coordinator update
+reaching the zone entity, and the state change that entity writes reaching
+a state trigger listener.  The last one is how intrusion and doorbell
+automations were triggered before the hub fired events.  Run from the
+repository root::
+
+    python benchmarks/bench_zone_events.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import Event, HomeAssistant, callback  # noqa: E402
+from homeassistant.helpers.event import async_track_state_change_event  # noqa: E402
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator  # noqa: E402
+
+from custom_components.satel import SatelHub  # noqa: E402
+from custom_components.satel.const import EVENT_ZONE_VIOLATED  # noqa: E402
+from custom_components.satel.dispatch import DISPATCH_ZONE  # noqa: E402
+
+ZONES = 64
+ROUNDS = 2000
+ENTITY_ID = "binary_sensor.satel_zone"
+
+
+class _Panel:
+    """Stand-in for the protocol library handing frames to the callbacks."""
+
+    connected = True
+
+    def __init__(self) -> None:
+        self.partition_states: dict[Any, list[int]] = {}
+        self.callbacks: dict[str, Any] = {}
+
+    async def monitor_status(self, **callbacks: Any) -> None:
+        self.callbacks = callbacks
+        await asyncio.Event().wait()
+
+    def close(self) -> None:
+        pass
+
+
+def _percentiles(samples: list[int]) -> str:
+    ordered = sorted(samples)
+    p99 = ordered[int(len(ordered) * 0.99)]
+    return (
+        f"median {statistics.median(ordered) / 1000:7.1f} us,"
+        f" p99 {p99 / 1000:7.1f} us"
+    )
+
+
+async def _run() -> dict[str, list[int]]:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        panel = _Panel()
+        hub = SatelHub("bench", 7094)
+        hub._satel = panel
+        hub.use_devices({"zones": [{"id": str(zone)} for zone in range(1, ZONES + 1)]})
+        coordinator = DataUpdateCoordinator(
+            hass, logging.getLogger(__name__), name="satel", config_entry=None
+        )
+        coordinator.async_set_updated_data(hub.state.snapshot())
+        await hub.start_monitoring(hass, coordinator)
+        await asyncio.sleep(0)
+        zone_cb = panel.callbacks["zone_changed_callback"]
+
+        started = 0
+        times: dict[str, list[int]] = {"event": [], "entity": [], "state": []}
+        zone = 1
+
+        @callback
+        def _event(event: Event) -> None:
+            if event.data["zone"] == zone:
+                times["event"].append(time.perf_counter_ns() - started)
+
+        @callback
+        def _entity() -> None:
+            # What the zone entity does: write its state.
+            if hub.state.zone_violated(zone):
+                times["entity"].append(time.perf_counter_ns() - started)
+            hass.states.async_set(
+                ENTITY_ID, "on" if hub.state.zone_violated(zone) else "off"
+            )
+
+        @callback
+        def _state(event: Event) -> None:
+            if event.data["new_state"].state == "on":
+                times["state"].append(time.perf_counter_ns() - started)
+
+        hass.bus.async_listen(EVENT_ZONE_VIOLATED, _event)
+        async_track_state_change_event(hass, ENTITY_ID, _state)
+        for index in range(1, ZONES + 1):
+            hub.async_subscribe(DISPATCH_ZONE, index, _entity)
+
+        for round_ in range(ROUNDS):
+            zone = round_ % ZONES + 1
+            started = time.perf_counter_ns()
+            zone_cb({"zones": {zone: 1}})
+            for _ in range(3):
+                await asyncio.sleep(0)
+            zone_cb({"zones": {zone: 0}})
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+        await hub.async_close()
+        await hass.async_stop(force=True)
+    return times
+
+
+def main() -> None:
+    times = asyncio.run(_run())
+    print(f"zones={ZONES} violations={ROUNDS}")
+    for name, label in (
+        ("event", "callback -> event trigger  "),
+        ("entity", "callback -> zone entity    "),
+        ("state", "callback -> state trigger  "),
+    ):
+        print(f"{label}: {_percentiles(times[name])} ({len(times[name])} samples)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Time evaluating the zone entity properties Home Assistant reads per write.
+
+Home Assistant evaluates the state and attributes of an entity every time it
+writes its state.  The former status sensor looped over four zone attributes
+with a bit lookup each and built an attribute dict of four more lookups; the
+zone entities now read the per-zone record the state store keeps up to date
+as changes are ingested.  Run from the repository root::
+
+    python benchmarks/bench_zone_properties.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.satel.binary_sensor import SatelZoneBinarySensor  # noqa: E402
+from custom_components.satel.sensor import SatelZoneSensor  # noqa: E402
+from custom_components.satel.state import (  # noqa: E402
+    ATTR_ALARM_MEMORY,
+    ATTR_BYPASS,
+    ATTR_TAMPER,
+    ATTR_TROUBLES,
+    ZONE_ATTRIBUTES,
+    SatelState,
+)
+
+ZONES = 256
+ROUNDS = 200
+
+_LEGACY_PRECEDENCE = (
+    (ATTR_TAMPER, "tamper"),
+    (ATTR_TROUBLES, "trouble"),
+    (ATTR_BYPASS, "bypass"),
+    (ATTR_ALARM_MEMORY, "alarm_memory"),
+)
+
+
+def _legacy_status(data: SatelState, zone: int) -> tuple[str | None, dict]:
+    value = None
+    for attr, status in _LEGACY_PRECEDENCE:
+        if data.zone(attr, zone):
+            value = status
+            break
+    else:
+        violated = data.zone_violated(zone)
+        if violated is not None:
+            value = "on" if violated else "off"
+    attributes = {
+        "troubles": data.zone(ATTR_TROUBLES, zone),
+        "tamper": data.zone(ATTR_TAMPER, zone),
+        "bypass": data.zone(ATTR_BYPASS, zone),
+        "alarm_memory": data.zone(ATTR_ALARM_MEMORY, zone),
+    }
+    return value, attributes
+
+
+def _state() -> SatelState:
+    state = SatelState()
+    for attr in ZONE_ATTRIBUTES:
+        state.update_zones(
+            attr, {zone: zone % 7 == 0 for zone in range(1, ZONES + 1)}
+        )
+    return state
+
+
+def main() -> None:
+    state = _state()
+    hub = SimpleNamespace(zone_record=state.zone_record)
+    coordinator = SimpleNamespace(data=state)
+    sensors = [
+        SatelZoneSensor(hub, coordinator, str(zone), "Zone")
+        for zone in range(1, ZONES + 1)
+    ]
+    binaries = [
+        SatelZoneBinarySensor(hub, coordinator, str(zone), "Zone")
+        for zone in range(1, ZONES + 1)
+    ]
+    zones = range(1, ZONES + 1)
+
+    def legacy() -> None:
+        for zone in zones:
+            _legacy_status(state, zone)
+            state.zone_violated(zone)
+
+    def records() -> None:
+        for sensor in sensors:
+            sensor.native_value
+        for binary in binaries:
+            binary.is_on
+
+    print(f"zones={ZONES}, status and binary sensor evaluated per zone")
+    for name, func in (("lookups + attributes", legacy), ("records", records)):
+        best = min(timeit.repeat(func, number=ROUNDS, repeat=5)) / ROUNDS
+        print(
+            f"{name:21s}: {best * 1e6:8.1f} us per pass,"
+            f" {best * 1e9 / ZONES:6.0f} ns per zone"
+        )
+
+
+if __name__ == "__main__":
+    main()
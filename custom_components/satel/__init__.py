@@ -3,26 +3,39 @@
 The integration communicates with the alarm via the encrypted ETHM-1
 protocol and receives realtime updates for zones, outputs and alarm
 states instead of periodically polling simple STATUS/STATE/LIST
-commands.
+commands.  The coordinator never polls on its own; the panel state is
+only re-queried when the push stream is stale or reconnecting.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from contextlib import suppress
+import time
+from contextlib import asynccontextmanager, contextmanager, suppress
 from datetime import timedelta
-from typing import Any, Callable
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+)
 from dataclasses import dataclass
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-
-from satel_integra.satel_integra import AsyncSatel, AlarmState
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     CONF_CODE,
@@ -33,6 +46,9 @@ from .const import (
     CONF_TIMEOUT,
     CONF_RECONNECT_DELAY,
     CONF_ENCRYPTION_METHOD,
+    CONF_COALESCE_WINDOW,
+    CONF_PROXY_HOST,
+    CONF_PROXY_PORT,
     DEFAULT_ENCODING,
     DEFAULT_HOST,
     DEFAULT_PORT,
@@ -40,12 +56,85 @@ from .const import (
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_RECONNECT_DELAY,
     DEFAULT_ENCRYPTION_METHOD,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_PROXY_HOST,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_RESYNC_INTERVAL,
+    DOMAIN,
+    ENCRYPTION_METHOD_INTEGRATION_KEY,
+)
+from .cache import DEVICE_KINDS, DeviceCache, changed_devices, selected_devices
+from .changes import ChangePoller
+from .codec import code_to_bytes, encode_frame, ids_to_mask, iter_ids, mask_to_bytes
+from .coalesce import UpdateCoalescer
+from .dispatch import (
+    DISPATCH_OUTPUT,
+    DISPATCH_PARTITION,
+    DISPATCH_ZONE,
+    ChangeDispatcher,
+)
+from .events import ChangeEvents
+from .handoff import async_claim_hub
+from .names import NAME_OUTPUT, NAME_PARTITION, NAME_ZONE, NameReader
+from .optimistic import PendingCommands
+from .reconnect import ReconnectBackoff
+from .scheduler import (
+    PRIORITY_ARM,
+    PRIORITY_DISARM,
+    PRIORITY_OUTPUT,
+    PRIORITY_QUERY,
+    CommandScheduler,
 )
+from .services import async_setup_services
+from .state import (
+    ATTR_OUTPUTS,
+    ATTR_VIOLATION,
+    PARTITION_QUERIES,
+    QUERY_GROUPS,
+    STATE_QUERIES,
+    ZONE_STATUS_KEYS,
+    PartitionMasks,
+    SatelSnapshot,
+    SatelState,
+    ZoneRecord,
+)
+
+# The protocol library, the encryption layer and the proxy are imported when
+# a hub connects, keeping them off the import path of the config flow and of
+# Home Assistant's startup.
+if TYPE_CHECKING:
+    from satel_integra.satel_integra import AlarmState, AsyncSatel
+
+    from .proxy import SatelProxy
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[str] = ["sensor", "binary_sensor", "switch", "alarm_control_panel"]
 
+# Query returning the panel type and firmware version.
+CMD_VERSION = 0x7E
+# Asks which state groups changed since they were last read.
+CMD_NEW_DATA = 0x7F
+
+# Partition commands taking the user code and a 4-byte partition mask; the
+# arming command of mode ``n`` is ``CMD_ARM + n``.
+CMD_ARM = 0x80
+CMD_DISARM = 0x84
+CMD_CLEAR_ALARM = 0x85
+CMD_RESULT = 0xEF
+
+# Results of ``0xEF`` accepting a command.
+RESULT_ACCEPTED = (0x00, 0xFF)
+
+# Commands switching the outputs of a bitmask on and off.
+CMD_OUTPUTS_ON = 0x88
+CMD_OUTPUTS_OFF = 0x89
+
+# Derived partition state confirming each arming mode.
+ARM_MODE_STATES = {0: "ARMED_AWAY", 1: "ARMED_HOME", 2: "ARMED_NIGHT"}
+
+# Derived partition state of an alarm, never held back for a pending command.
+ALARM_STATE = "TRIGGERED"
 
 class SatelHub:
     """Wrapper around :class:`AsyncSatel` providing Home Assistant helpers."""
@@ -63,6 +152,7 @@ class SatelHub:
         timeout: int = DEFAULT_TIMEOUT,
         reconnect_delay: int = DEFAULT_RECONNECT_DELAY,
         encryption_method: str = DEFAULT_ENCRYPTION_METHOD,
+        coalesce_window: int = DEFAULT_COALESCE_WINDOW,
     ) -> None:
         self._host = host
         self._port = port
@@ -71,26 +161,116 @@ class SatelHub:
         self._encryption_key = encryption_key
         self._encoding = encoding
         self._update_interval = update_interval
+        self._resync_interval = update_interval or DEFAULT_RESYNC_INTERVAL
         self._timeout = timeout
         self._reconnect_delay = reconnect_delay
         self._encryption_method = encryption_method
         self._satel: AsyncSatel | None = None
         self._monitor_task: asyncio.Task | None = None
         self._coordinator: DataUpdateCoordinator | None = None
-        self._state: dict[str, Any] = {
-            "alarm": {},
-            "zones": {},
-            "outputs": {},
-            "troubles": {},
-            "tamper": {},
-            "bypass": {},
-            "alarm_memory": {},
-        }
+        self._unsub_coordinator: Callable[[], None] | None = None
+        self._unsub_watchdog: Callable[[], None] | None = None
+        self._poll_task: asyncio.Task | None = None
+        self._poller = ChangePoller()
+        self._flag_listeners: list[Callable[[bytes], None]] = []
+        self._last_frame: float | None = None
+        self._resyncs = 0
+        self._available = True
+        self._backoff = ReconnectBackoff(reconnect_delay)
+        # Set while the library's monitor loop reads frames.
+        self._reading = False
+        self._lost_at: float | None = None
+        self._reconnects = 0
+        self._consistent_ms: float | None = None
+        self._state = SatelState()
+        self._partitions: frozenset[int] = frozenset()
+        self._partition_mask = 0
+        self._partition_masks = PartitionMasks()
+        # Duration of each setup stage in milliseconds.
+        self.startup: dict[str, float] = {}
+        # Panel type and firmware version last read from the panel.
+        self.fingerprint: str | None = None
+        self._dispatcher = ChangeDispatcher()
+        self._events = ChangeEvents(host)
+        self._commands = CommandScheduler(timeout)
+        self._pending = PendingCommands(timeout)
+        self._coalescer = UpdateCoalescer(
+            self._push_update, max(coalesce_window, 0) / 1000
+        )
 
     @property
     def host(self) -> str:  # pragma: no cover - trivial
         return self._host
 
+    @property
+    def connected(self) -> bool:
+        """Return whether the connection to the panel is open."""
+        return bool(self._satel and self._satel.connected)
+
+    @property
+    def state(self) -> SatelState:
+        """Return the live state store updated by the monitor."""
+        return self._state
+
+    def zone_record(self, zone_id: int) -> ZoneRecord:
+        """Return the live record of a zone, updated as changes arrive."""
+        return self._state.zone_record(zone_id)
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return runtime counters of the hub."""
+        return {
+            "encryption": getattr(self._satel, "encryption_stats", None),
+            "frames": getattr(self._satel, "frame_stats", None),
+            "commands": self._commands.stats,
+            "coalescer": self._coalescer.stats,
+            "dispatch": self._dispatcher.stats,
+            "events": self._events.stats,
+            "startup_ms": dict(self.startup),
+            "push": {
+                "healthy": self.push_healthy,
+                "last_frame_age": (
+                    round(time.monotonic() - self._last_frame, 3)
+                    if self._last_frame is not None
+                    else None
+                ),
+                "resync_interval": self._resync_interval,
+                "resyncs": self._resyncs,
+            },
+            "changes": self._poller.stats,
+            "confirmations": self._pending.stats,
+            "reconnect": {
+                **self._backoff.stats,
+                "reconnects": self._reconnects,
+                "disconnected": self._lost_at is not None,
+                "time_to_consistent_ms": self._consistent_ms,
+            },
+        }
+
+    @property
+    def partition_states(self) -> Mapping[AlarmState, Iterable[int]]:
+        """Return the partitions in each alarm state as reported by the panel."""
+        if not self._satel:
+            return {}
+        return self._satel.partition_states
+
+    @property
+    def push_healthy(self) -> bool:
+        """Return whether the monitor is connected and frames keep arriving."""
+        task = self._monitor_task
+        if not self._satel or task is None or task.done():
+            return False
+        if not self._satel.connected or self._last_frame is None:
+            return False
+        return time.monotonic() - self._last_frame < self._resync_interval
+
+    @callback
+    def async_subscribe(
+        self, kind: str, index: int, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Call ``update_callback`` when the given zone/output/partition changes."""
+        return self._dispatcher.subscribe(kind, index, update_callback)
+
     @property
     def monitored_zones(self) -> list[int]:
         """Return list of zone IDs monitored for state changes."""
@@ -123,15 +303,42 @@ class SatelHub:
         else:
             self._satel._monitored_outputs = outputs
 
+    @property
+    def monitored_partitions(self) -> frozenset[int]:
+        """Return the partitions in use, empty until they are discovered."""
+        return self._partitions
+
+    def set_monitored_partitions(self, partitions: Iterable[int]) -> None:
+        """Only track the state of ``partitions``."""
+        self._partitions = frozenset(partitions)
+        self._partition_mask = ids_to_mask(self._partitions)
+        if self._satel is not None and hasattr(self._satel, "_partitions"):
+            self._satel._partitions = sorted(self._partitions)
+
     async def connect(self) -> None:
-        """Create connection to the alarm using the official protocol."""
+        """Create connection to the alarm using the official protocol.
+
+        Raises ``ValueError`` when the integration key is missing or invalid.
+        """
         loop = asyncio.get_running_loop()
-        self._satel = AsyncSatel(self._host, self._port, loop)
+        if self._encryption_method == ENCRYPTION_METHOD_INTEGRATION_KEY:
+            if not self._encryption_key:
+                raise ValueError("Integration key encryption needs a key")
+            from .encryption import EncryptedSatel
+
+            self._satel = EncryptedSatel(
+                self._host, self._port, loop, self._encryption_key
+            )
+        else:
+            from .transport import FramedSatel
+
+            self._satel = FramedSatel(self._host, self._port, loop)
         # Apply network tuning if available on the underlying library
         if hasattr(self._satel, "_keep_alive_timeout"):
             self._satel._keep_alive_timeout = self._timeout
         if hasattr(self._satel, "_reconnection_timeout"):
-            self._satel._reconnection_timeout = self._reconnect_delay
+            # Reconnection attempts are paced by the hub's supervisor.
+            self._satel._reconnection_timeout = 0
         connected = await self._satel.connect()
         if not connected:
             raise ConnectionError("Unable to connect to Satel panel")
@@ -145,78 +352,413 @@ class SatelHub:
             raise ConnectionError("Not connected")
 
         self._coordinator = coordinator
+        self._available = coordinator.last_update_success
+        self._unsub_coordinator = coordinator.async_add_listener(
+            self._handle_coordinator_update
+        )
+        dispatcher = self._dispatcher
+        # Events reach automations before the entities are updated.
+        self._events.attach(hass.bus.async_fire)
 
         def _schedule_update() -> None:
-            if self._coordinator:
-                data = {
-                    "alarm": self._state["alarm"],
-                    "zones": self._state["zones"].copy(),
-                    "outputs": self._state["outputs"].copy(),
-                    "troubles": self._state["troubles"].copy(),
-                    "tamper": self._state["tamper"].copy(),
-                    "bypass": self._state["bypass"].copy(),
-                    "alarm_memory": self._state["alarm_memory"].copy(),
-                }
-                self._coordinator.async_set_updated_data(data)
+            self._last_frame = time.monotonic()
+            # Callbacks without changes are still absorbed by a pending flush.
+            if dispatcher.pending or self._coalescer.pending:
+                self._coalescer.schedule()
 
         def zone_cb(status: dict[str, Any]) -> None:
-            for zone, value in status.get("zones", {}).items():
-                self._state["zones"][str(zone)] = "ON" if value else "OFF"
-            for zone, value in status.get("troubles", {}).items():
-                self._state["troubles"][str(zone)] = "ON" if value else "OFF"
-            for zone, value in status.get("tamper", {}).items():
-                self._state["tamper"][str(zone)] = "ON" if value else "OFF"
-            for zone, value in status.get("bypass", {}).items():
-                self._state["bypass"][str(zone)] = "ON" if value else "OFF"
-            for zone, value in status.get("alarm_memory", {}).items():
-                self._state["alarm_memory"][str(zone)] = "ON" if value else "OFF"
+            for key, attr in ZONE_STATUS_KEYS.items():
+                if values := status.get(key):
+                    self._apply_zones(attr, values)
             _schedule_update()
 
         def output_cb(status: dict[str, Any]) -> None:
-            for out, value in status.get("outputs", {}).items():
-                self._state["outputs"][str(out)] = "ON" if value else "OFF"
+            if values := status.get("outputs"):
+                self._apply_outputs(values)
             _schedule_update()
 
         def alarm_cb() -> None:
-            if not self._satel:
+            # The library also calls this callback when the link drops.
+            if not self._satel or not self._satel.connected:
+                self._link_lost()
                 return
-            states = self._satel.partition_states
-            partitions: set[int] = set()
-            for part_list in states.values():
-                partitions.update(part_list)
-            for part in partitions:
-                key = str(part)
-                if part in states.get(AlarmState.TRIGGERED, []) or part in states.get(
-                    AlarmState.TRIGGERED_FIRE, []
-                ):
-                    self._state["alarm"][key] = "TRIGGERED"
-                elif part in states.get(AlarmState.ENTRY_TIME, []) or part in states.get(
-                    AlarmState.EXIT_COUNTDOWN_OVER_10, []
-                ) or part in states.get(AlarmState.EXIT_COUNTDOWN_UNDER_10, []):
-                    self._state["alarm"][key] = "PENDING"
-                elif part in states.get(AlarmState.ARMED_MODE1, []):
-                    self._state["alarm"][key] = "ARMED_HOME"
-                elif part in states.get(AlarmState.ARMED_MODE2, []):
-                    self._state["alarm"][key] = "ARMED_NIGHT"
-                elif part in states.get(AlarmState.ARMED_MODE0, []):
-                    self._state["alarm"][key] = "ARMED_AWAY"
-                else:
-                    self._state["alarm"][key] = "DISARMED"
+            state = self._state
+            pending = self._pending
+            for part, alarm in self._partition_masks.update(
+                self._satel.partition_states, self._partition_mask
+            ):
+                key = (DISPATCH_PARTITION, part)
+                if alarm == ALARM_STATE:
+                    # Shown at once, ending the wait for any command.
+                    pending.discard(key)
+                elif pending and not pending.reconcile(key, alarm):
+                    continue
+                if state.set_partition(part, alarm):
+                    dispatcher.mark(DISPATCH_PARTITION, (part,))
             _schedule_update()
 
+        # Set before the task runs so nothing else starts reading answers.
+        self._reading = True
         self._monitor_task = hass.async_create_background_task(
-            self._satel.monitor_status(
+            self._async_supervise(
                 alarm_status_callback=alarm_cb,
                 zone_changed_callback=zone_cb,
                 output_changed_callback=output_cb,
             ),
             name="satel-monitor",
         )
+        if hasattr(self._satel, "_message_handlers"):
+            self._poll_task = hass.async_create_background_task(
+                self._async_poll_loop(), name="satel-change-poll"
+            )
+        self._unsub_watchdog = async_track_time_interval(
+            hass,
+            self._async_check_push,
+            timedelta(seconds=self._resync_interval),
+            name="satel-push-watchdog",
+        )
 
         return self._monitor_task
 
+    async def _async_supervise(self, **callbacks: Callable[..., None]) -> None:
+        """Run the library's monitor loop and reconnect when the link drops.
+
+        The monitor loop is left when the link drops (see :meth:`_link_lost`);
+        the panel is then reconnected with exponential backoff, its whole
+        state is read back in one batch and monitoring resumes.
+        """
+        satel = self._satel
+        try:
+            while True:
+                if not satel.connected:
+                    self._reading = False
+                    await self._async_reconnect()
+                    await self._async_resync_after_reconnect()
+                    if not satel.connected:
+                        continue
+                session = time.monotonic()
+                self._reading = True
+                await satel.monitor_status(**callbacks)
+                if self._lost_at is None:
+                    return
+                # A session that delivered frames closed cleanly: retry at once.
+                if self._last_frame is not None and self._last_frame >= session:
+                    self._backoff.reset()
+        finally:
+            self._reading = False
+
+    @callback
+    def _link_lost(self) -> None:
+        """Leave the library's monitor loop so the supervisor reconnects."""
+        if self._satel is None:
+            return
+        if self._lost_at is None:
+            self._lost_at = time.monotonic()
+            _LOGGER.warning("Connection to the Satel panel lost")
+        # Stops the library from reconnecting on its own.
+        self._satel.closed = True
+
+    async def _async_reconnect(self) -> None:
+        """Connect again, backing off while attempts fail."""
+        satel = self._satel
+        while True:
+            if delay := self._backoff.next_delay():
+                _LOGGER.debug("Reconnecting to the Satel panel in %.1f s", delay)
+                await asyncio.sleep(delay)
+            satel.closed = False
+            if await satel.connect():
+                self._reconnects += 1
+                return
+
+    async def _async_resync_after_reconnect(self) -> None:
+        """Read back the state missed while disconnected."""
+        try:
+            async with self._reading_answers():
+                await self.async_full_resync()
+        except ConnectionError as err:
+            _LOGGER.debug("Resync after reconnect failed: %s", err)
+            return
+        if self._lost_at is not None:
+            self._consistent_ms = round((time.monotonic() - self._lost_at) * 1000, 3)
+            _LOGGER.info(
+                "Satel panel state consistent %.0f ms after the connection dropped",
+                self._consistent_ms,
+            )
+        self._lost_at = None
+
+    async def async_full_resync(self) -> None:
+        """Read every zone, output and partition state group in one batch.
+
+        All queries go out in a single write; their answers are applied to
+        the state together and published as one update.
+        """
+        satel = self._satel
+        if not satel or not satel.connected:
+            raise ConnectionError("Not connected")
+        answers = await self._async_query_groups(self._state_queries())
+        self._resyncs += 1
+        self._apply_answers(answers)
+
+    async def async_poll_changes(self) -> list[int]:
+        """Read the state groups the panel flags as changed.
+
+        The change flags are read first and only the flagged groups are
+        queried, in one batch.  Returns the commands that were queried.
+        """
+        flags = await self.async_request(CMD_NEW_DATA)
+        self._last_frame = time.monotonic()
+        self._poller.account("change_flags", b"", flags)
+        for listener in self._flag_listeners:
+            listener(flags[1:])
+        mask = int.from_bytes(flags[1:], "little")
+        queries = {
+            command: data
+            for command, data in self._state_queries().items()
+            if (mask >> command) & 1
+        }
+        self._poller.record_poll(bool(queries))
+        if queries:
+            self._apply_answers(await self._async_query_groups(queries))
+        return list(queries)
+
+    @property
+    def polling_changes(self) -> bool:
+        """Return whether the change flags are being polled."""
+        return self._poll_task is not None and not self._poll_task.done()
+
+    @callback
+    def async_listen_change_flags(
+        self, listener: Callable[[bytes], None]
+    ) -> Callable[[], None]:
+        """Call ``listener`` with the change flags read by every poll."""
+        self._flag_listeners.append(listener)
+        return partial(self._flag_listeners.remove, listener)
+
+    def apply_state_answer(self, answer: bytes) -> None:
+        """Apply the answer to a state query read on behalf of another client.
+
+        Reading a state group clears its change flag, so the poller would not
+        read the change again.  ``answer`` starts with its command byte.
+        """
+        if answer and answer[0] in QUERY_GROUPS:
+            self._apply_answers({answer[0]: answer})
+
+    async def _async_poll_loop(self) -> None:
+        """Poll the change flags at the pace the poller sets."""
+        poller = self._poller
+        while True:
+            await asyncio.sleep(poller.interval)
+            # Answers are only read while the monitor runs.
+            if not self._reading or not self.connected:
+                continue
+            try:
+                await self.async_poll_changes()
+            except ConnectionError as err:
+                _LOGGER.debug("Could not poll the change flags: %s", err)
+
+    def _state_queries(self) -> dict[int, bytes]:
+        """Return every state query with the data it is sent with."""
+        zones = self.monitored_zones
+        outputs = self.monitored_outputs
+        # 256 zone panels answer with 32 bytes to queries carrying 0xFF.
+        long_zones = b"\xff" if max(zones, default=0) > 128 else b""
+        long_outputs = b"\xff" if max(outputs, default=0) > 128 else b""
+        queries = {
+            command: long_outputs if attr == ATTR_OUTPUTS else long_zones
+            for command, attr in STATE_QUERIES.items()
+        }
+        queries.update(dict.fromkeys(PARTITION_QUERIES, b""))
+        return queries
+
+    async def _async_query_groups(self, queries: Mapping[int, bytes]) -> dict[int, bytes]:
+        """Send state ``queries`` in one batch, counting the traffic per group."""
+        answers = await self._async_request_batch(queries)
+        for command, data in queries.items():
+            self._poller.account(QUERY_GROUPS[command], data, answers[command])
+        return answers
+
+    def _apply_answers(self, answers: Mapping[int, bytes]) -> None:
+        """Apply the answers to state queries and publish what changed."""
+        satel = self._satel
+        dispatcher = self._dispatcher
+        zones = self.monitored_zones
+        outputs = self.monitored_outputs
+        for command, attr in STATE_QUERIES.items():
+            if (answer := answers.get(command)) is None:
+                continue
+            mask = int.from_bytes(answer[1:], "little")
+            if attr == ATTR_OUTPUTS:
+                self._apply_outputs(
+                    {output: (mask >> (output - 1)) & 1 for output in outputs}
+                )
+            else:
+                self._apply_zones(
+                    attr, {zone: (mask >> (zone - 1)) & 1 for zone in zones}
+                )
+        if partitions := {
+            group: answers[command]
+            for command, group in PARTITION_QUERIES.items()
+            if command in answers
+        }:
+            from satel_integra.satel_integra import AlarmState
+
+            satel.partition_states.update(
+                {
+                    AlarmState[group]: list(
+                        iter_ids(int.from_bytes(answer[1:], "little"))
+                    )
+                    for group, answer in partitions.items()
+                }
+            )
+            # The partition callback derives and publishes the partition states.
+            if callback_ := getattr(satel, "_alarm_status_callback", None):
+                callback_()
+                return
+        if dispatcher.pending:
+            self._coalescer.schedule()
+
+    def _apply_zones(self, attr: str, values: Mapping[int, Any]) -> None:
+        """Apply reported zone states, firing violation events first."""
+        changed = self._state.update_zones(attr, values)
+        if changed and attr == ATTR_VIOLATION:
+            self._events.zones_violated(changed, values)
+        self._dispatcher.mark(DISPATCH_ZONE, changed)
+
+    def _apply_outputs(self, values: Mapping[int, Any]) -> None:
+        """Apply reported output states, holding back unconfirmed ones.
+
+        Outputs shown on or off since a command are only reported as changed
+        once the panel confirms them.
+        """
+        confirmed: list[int] = []
+        if pending := self._pending:
+            confirmed = [
+                output for output in values if (DISPATCH_OUTPUT, output) in pending
+            ]
+            values = {
+                output: value
+                for output, value in values.items()
+                if pending.reconcile((DISPATCH_OUTPUT, output), bool(value))
+            }
+        changed = self._state.update_outputs(values)
+        if confirmed:
+            confirmed = [
+                output
+                for output in confirmed
+                if output in values and output not in changed
+            ]
+        self._events.outputs_changed(changed + confirmed, values)
+        self._dispatcher.mark(DISPATCH_OUTPUT, changed)
+
+    def _expect_outputs(self, values: Mapping[int, bool]) -> None:
+        """Show the requested output states until the panel confirms them."""
+        state = self._state
+        for output, value in values.items():
+            self._pending.expect(
+                (DISPATCH_OUTPUT, output),
+                (value,),
+                state.output(output),
+                partial(self._rollback_output, output),
+            )
+        if changed := state.update_outputs(values):
+            self._dispatcher.mark(DISPATCH_OUTPUT, changed)
+            self._coalescer.schedule()
+
+    def _rollback_output(self, output: int, value: bool | None) -> None:
+        _LOGGER.debug("The panel did not confirm the state of output %s", output)
+        if value is not None and self._state.set_output(output, bool(value)):
+            self._dispatcher.mark(DISPATCH_OUTPUT, (output,))
+            self._coalescer.schedule()
+
+    def _expect_partitions(
+        self, parts: Iterable[int], target: str, accepted: Collection[str]
+    ) -> None:
+        """Show partitions in ``target`` until the panel reports an accepted state."""
+        state = self._state
+        self._track_partitions(parts)
+        for part in parts:
+            self._pending.expect(
+                (DISPATCH_PARTITION, part),
+                accepted,
+                state.partition(part),
+                partial(self._rollback_partition, part),
+            )
+            if state.set_partition(part, target):
+                self._dispatcher.mark(DISPATCH_PARTITION, (part,))
+        if self._dispatcher.pending:
+            self._coalescer.schedule()
+
+    def _rollback_partition(self, part: int, alarm: str | None) -> None:
+        _LOGGER.debug("The panel did not confirm the state of partition %s", part)
+        if alarm is not None and self._state.set_partition(part, alarm):
+            self._dispatcher.mark(DISPATCH_PARTITION, (part,))
+            self._coalescer.schedule()
+
+    async def _async_request_batch(self, queries: Mapping[int, bytes]) -> dict[int, bytes]:
+        """Send ``queries`` in one write and return the answer to each command."""
+        loop = asyncio.get_running_loop()
+        answers: dict[int, asyncio.Future[bytes]] = {
+            command: loop.create_future() for command in queries
+        }
+
+        def _handler(command: int) -> Callable[[bytes], None]:
+            def _handle(msg: bytes) -> None:
+                if not answers[command].done():
+                    answers[command].set_result(bytes(msg))
+
+            return _handle
+
+        payload = b"".join(
+            encode_frame(command, data) for command, data in queries.items()
+        )
+        try:
+            await self._async_exchange(
+                PRIORITY_QUERY,
+                lambda satel: satel._send_data(payload),
+                {bytes((command,)): _handler(command) for command in queries},
+                asyncio.gather(*answers.values()),
+                chain=False,
+            )
+        finally:
+            for future in answers.values():
+                future.cancel()
+        return {command: future.result() for command, future in answers.items()}
+
+    async def _async_check_push(self, _now: Any = None) -> None:
+        """Fall back to a resync poll while push updates are stale."""
+        if self._coordinator and not self.push_healthy:
+            await self._coordinator.async_refresh()
+
+    def _push_update(self) -> None:
+        """Publish the current state and notify entities of changed ids."""
+        if self._coordinator:
+            self._coordinator.async_set_updated_data(self._state.snapshot())
+        self._dispatcher.flush()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh every subscribed entity when availability flips."""
+        if not self._coordinator:
+            return
+        available = self._coordinator.last_update_success
+        if available != self._available:
+            self._available = available
+            self._dispatcher.notify_all()
+
     async def async_close(self) -> None:
         """Stop monitoring and close connection."""
+        self._coalescer.cancel()
+        self._pending.cancel()
+        await self._commands.async_close()
+        if self._unsub_watchdog:
+            self._unsub_watchdog()
+            self._unsub_watchdog = None
+        if self._poll_task:
+            self._poll_task.cancel()
+            self._poll_task = None
+        if self._unsub_coordinator:
+            self._unsub_coordinator()
+            self._unsub_coordinator = None
         if self._monitor_task:
             self._monitor_task.cancel()
             with suppress(asyncio.CancelledError):
@@ -226,88 +768,497 @@ class SatelHub:
             self._satel.close()
             self._satel = None
 
-    async def get_overview(self) -> dict[str, Any]:
-        """Return current known state."""
-        return {
-            "alarm": self._state["alarm"].copy(),
-            "zones": self._state["zones"].copy(),
-            "outputs": self._state["outputs"].copy(),
-            "troubles": self._state["troubles"].copy(),
-            "tamper": self._state["tamper"].copy(),
-            "bypass": self._state["bypass"].copy(),
-            "alarm_memory": self._state["alarm_memory"].copy(),
-        }
+    async def get_overview(self) -> SatelSnapshot:
+        """Return a read-only snapshot of the current known state.
+
+        While push updates flow this does no I/O at all.  When they are stale
+        and the monitor is running, every state group is read back first; a
+        dropped connection marks the data as failed.
+        """
+        task = self._monitor_task
+        if task is not None and not task.done() and not self.push_healthy:
+            try:
+                await self.async_full_resync()
+            except ConnectionError as err:
+                raise UpdateFailed("Satel panel is reconnecting") from err
+        return self._state.snapshot()
+
+    async def async_query(self, command: int, data: bytes = b"") -> bytes:
+        """Send a query and return the data of the panel's answer."""
+        return (await self.async_request(command, data))[1:]
+
+    async def async_request(
+        self,
+        command: int,
+        data: bytes = b"",
+        answers: Iterable[int] | None = None,
+        priority: int = PRIORITY_QUERY,
+    ) -> bytes:
+        """Send a command and return the first frame answering it.
+
+        The answer is the first frame whose command byte is in ``answers``
+        (``command`` itself by default), returned with its command byte.
+        Answers are read by the running monitor, which passes frames to the
+        handler registered for their command byte; handlers already
+        registered for those bytes still see every frame.
+        """
+        satel = self._satel
+        if not satel or not hasattr(satel, "_message_handlers"):
+            raise ConnectionError("Not connected")
+        answer: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+
+        def _handle(msg: bytes) -> None:
+            if not answer.done():
+                answer.set_result(bytes(msg))
+
+        return await self._async_exchange(
+            priority,
+            lambda satel: satel._send_data(encode_frame(command, data)),
+            {bytes((key,)): _handle for key in (answers or (command,))},
+            answer,
+        )
+
+    async def _async_exchange(
+        self,
+        priority: int,
+        send: Callable[[AsyncSatel], Awaitable[Any]],
+        handlers: Mapping[bytes, Callable[[bytes], None]],
+        answered: asyncio.Future[Any],
+        *,
+        key: tuple[str, int] | None = None,
+        chain: bool = True,
+    ) -> Any:
+        """Send a command and return the result of ``answered`` once it is done.
+
+        ``handlers`` see the frames read meanwhile, in front of the handlers
+        already registered for their command bytes, which still see every
+        frame unless ``chain`` is false.  The scheduler runs one exchange at
+        a time, from its write to its answer, so every answer, ``0xEF``
+        results included, is matched to the command that caused it.
+        """
+
+        async def _exchange(satel: AsyncSatel) -> Any:
+            registered = satel._message_handlers
+            previous = {byte: registered.get(byte) for byte in handlers}
+
+            def _handler(byte: bytes) -> Callable[[bytes], None]:
+                handle = handlers[byte]
+                chained = previous[byte] if chain else None
+                if chained is None:
+                    return handle
+
+                def _handle(msg: bytes) -> None:
+                    handle(msg)
+                    chained(msg)
+
+                return _handle
+
+            installed = {byte: _handler(byte) for byte in handlers}
+            registered.update(installed)
+            try:
+                await send(satel)
+                return await answered
+            finally:
+                for byte, handle in installed.items():
+                    if registered.get(byte) is not handle:
+                        continue
+                    if previous[byte] is None:
+                        del registered[byte]
+                    else:
+                        registered[byte] = previous[byte]
+
+        try:
+            return await self._send_command(priority, _exchange, key=key)
+        finally:
+            answered.cancel()
+
+    async def _async_command(
+        self,
+        priority: int,
+        send: Callable[[AsyncSatel], Awaitable[Any]],
+        frames: int = 1,
+        *,
+        key: tuple[str, int] | None = None,
+    ) -> list[bytes]:
+        """Send a command of ``frames`` frames and return the result of each.
+
+        The panel answers every command frame with ``0xEF``; the data of
+        each answer, its result code, is returned in the order of the frames.
+        """
+        results: list[bytes] = []
+        answered: asyncio.Future[list[bytes]] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+        def _handle(msg: bytes) -> None:
+            results.append(bytes(msg[1:]))
+            if len(results) == frames and not answered.done():
+                answered.set_result(results)
+
+        return await self._async_exchange(
+            priority, send, {bytes((CMD_RESULT,)): _handle}, answered, key=key
+        )
+
+    async def async_fingerprint(self) -> str | None:
+        """Return the panel type and firmware version, if the panel answers."""
+        try:
+            self.fingerprint = (await self.async_query(CMD_VERSION)).hex()
+        except ConnectionError as err:
+            _LOGGER.debug("Could not read the panel version: %s", err)
+            return None
+        return self.fingerprint
+
+    async def async_keep_alive(self, interval: float) -> None:
+        """Keep an unmonitored connection open by querying the panel version."""
+        async with self._reading_answers():
+            while self.connected:
+                await asyncio.sleep(interval)
+                await self.async_fingerprint()
+
+    def use_devices(self, devices: dict[str, Any]) -> None:
+        """Only monitor the zones, outputs and partitions of ``devices``."""
+        zones = [int(zone["id"]) for zone in devices.get("zones", [])]
+        outputs = [int(output["id"]) for output in devices.get("outputs", [])]
+        self.set_monitored_zones(zones)
+        self.set_monitored_outputs(outputs)
+        self.set_monitored_partitions(
+            int(part["id"]) for part in devices.get("partitions", [])
+        )
 
     async def discover_devices(self) -> dict[str, list[dict[str, Any]]]:
-        """Return lists of zones, outputs and partitions available on the panel."""
+        """Return lists of zones, outputs and partitions available on the panel.
+
+        Nothing is monitored until the devices in use are passed to
+        :meth:`use_devices`.
+        """
         if not self._satel:
             raise ConnectionError("Not connected")
 
-        # The ``satel-integra`` library exposes helpers to fetch configuration
-        # of the device.  They return mappings indexed by id, e.g.
-        # ``{1: "Zone 1"}``.  Some older versions of the library didn't expose
-        # the helpers we rely on, so verify they are available before
-        # attempting to use them and provide a helpful error message if not.
-        if not all(
+        # Backends may expose helpers returning the names indexed by id, e.g.
+        # ``{1: "Zone 1"}``.  satel_integra itself does not, so the names are
+        # read with pipelined queries over its connection instead.
+        partitions_raw: dict[int, str] = {}
+        if all(
             hasattr(self._satel, meth)
             for meth in ("get_zone_names", "get_output_names")
         ):
+            zones_raw = await self._satel.get_zone_names()
+            outputs_raw = await self._satel.get_output_names()
+            if hasattr(type(self._satel), "get_partition_names"):
+                partitions_raw = await self._satel.get_partition_names()
+        elif hasattr(self._satel, "_message_handlers"):
+            async with self._reading_answers():
+                fingerprint = await self.async_fingerprint()
+                names = await self._async_read_names(
+                    int(fingerprint[:2], 16) if fingerprint else None
+                )
+            zones_raw = names[NAME_ZONE]
+            outputs_raw = names[NAME_OUTPUT]
+            partitions_raw = names[NAME_PARTITION]
+        else:
             raise RuntimeError(
                 "The installed satel_integra library is incompatible: missing "
                 "get_zone_names/get_output_names helpers."
             )
 
-        zones_raw: dict[int, str] = await self._satel.get_zone_names()
-        outputs_raw: dict[int, str] = await self._satel.get_output_names()
+        # Without names the panel is assumed to have the single partition
+        # commands default to.
+        if not partitions_raw:
+            partitions_raw = {1: "Partition 1"}
 
         zones = [{"id": str(zid), "name": name} for zid, name in sorted(zones_raw.items())]
         outputs = [{"id": str(oid), "name": name} for oid, name in sorted(outputs_raw.items())]
+        partitions = [
+            {"id": str(pid), "name": name or f"Partition {pid}"}
+            for pid, name in sorted(partitions_raw.items())
+        ]
 
-        # Remember which entities should be monitored for state changes
-        self.set_monitored_zones(list(zones_raw.keys()))
-        self.set_monitored_outputs(list(outputs_raw.keys()))
+        return {"zones": zones, "outputs": outputs, "partitions": partitions}
 
-        return {
-            "zones": zones,
-            "outputs": outputs,
-            "partitions": [
-                {"id": str(i), "name": f"Partition {i}"} for i in range(1, 33)
-            ],
-        }
+    @asynccontextmanager
+    async def _reading_answers(self) -> AsyncIterator[None]:
+        """Read answers from the panel while the monitor is not running yet."""
+        satel = self._satel
+        if self._reading or not hasattr(satel, "_update_status"):
+            yield
+            return
 
-    async def set_output(self, output_id: str, state: bool) -> None:
-        """Turn given output on or off."""
-        if not self._satel:
-            raise ConnectionError("Not connected")
-        await self._satel.set_output(self._code, int(output_id), state)
+        async def _pump() -> None:
+            while satel.connected:
+                await satel._update_status()
 
-    async def arm(self, partition: int | None = None) -> None:
-        if not self._satel:
-            raise ConnectionError("Not connected")
-        parts = [partition] if partition else [1]
-        await self._satel.arm(self._code, parts, mode=0)
+        pump = asyncio.create_task(_pump(), name="satel-answers")
+        try:
+            yield
+        finally:
+            pump.cancel()
+            with suppress(asyncio.CancelledError):
+                await pump
 
-    async def arm_home(self, partition: int | None = None) -> None:
+    async def _async_read_names(self, panel_type: int | None) -> dict[int, dict[int, str]]:
+        """Read zone, output and partition names with pipelined queries."""
         if not self._satel:
             raise ConnectionError("Not connected")
-        parts = [partition] if partition else [1]
-        await self._satel.arm(self._code, parts, mode=1)
+        reader: NameReader
 
-    async def arm_night(self, partition: int | None = None) -> None:
-        if not self._satel:
-            raise ConnectionError("Not connected")
-        parts = [partition] if partition else [1]
-        await self._satel.arm(self._code, parts, mode=2)
+        def _exchange(frames: bytes, answered: asyncio.Future[Any]) -> Awaitable[Any]:
+            return self._async_exchange(
+                PRIORITY_QUERY,
+                lambda satel: satel._send_data(frames),
+                {b"\xee": reader.handle, b"\xef": reader.handle},
+                answered,
+            )
+
+        reader = NameReader(_exchange, self._encoding)
+        start = time.monotonic()
+        names = await reader.read_all(panel_type)
+        _LOGGER.debug(
+            "Read %s names with %s queries in %.3fs",
+            sum(len(kind) for kind in names.values()),
+            reader.queries,
+            time.monotonic() - start,
+        )
+        return names
 
-    async def disarm(self, partition: int | None = None) -> None:
+    async def _send_command(
+        self,
+        priority: int,
+        send: Callable[[AsyncSatel], Awaitable[Any]],
+        *,
+        key: tuple[str, int] | None = None,
+    ) -> Any:
+        """Queue a command for the panel on the hub's scheduler and return its result."""
         if not self._satel:
             raise ConnectionError("Not connected")
-        parts = [partition] if partition else [1]
-        await self._satel.disarm(self._code, parts)
 
-    async def disarm_partition(self, partition: int) -> None:
+        async def _send() -> Any:
+            if not self._satel:
+                raise ConnectionError("Not connected")
+            return await send(self._satel)
+
+        return await self._commands.submit(priority, _send, key=key)
+
+    async def set_output(self, output_id: str, state: bool) -> None:
+        """Turn given output on or off.
+
+        The new state is shown right away and confirmed by the panel's
+        next output report, or rolled back if none confirms it in time.
+        """
+        output = int(output_id)
+        await self._async_switch_outputs(
+            lambda satel: satel.set_output(self._code, output, state),
+            [{output: bool(state)}],
+            key=(DISPATCH_OUTPUT, output),
+        )
+
+    async def set_outputs(self, outputs: Mapping[int | str, bool]) -> None:
+        """Switch many outputs with at most one "on" and one "off" frame.
+
+        The outputs are packed into the 16-byte output mask, or the 32-byte
+        one when an output above 128 is involved, and their states are
+        shown optimistically until the panel confirms them.
+        """
+        values = {int(output): bool(state) for output, state in outputs.items()}
+        if not values:
+            return
+        length = 32 if max(values) > 128 else 16
+        code = code_to_bytes(self._code)
+        groups = {
+            command: {output: state for output, state in values.items() if state is on}
+            for command, on in ((CMD_OUTPUTS_ON, True), (CMD_OUTPUTS_OFF, False))
+        }
+        groups = {command: group for command, group in groups.items() if group}
+        frames = [
+            encode_frame(command, code + mask_to_bytes(ids_to_mask(group), length))
+            for command, group in groups.items()
+        ]
+
+        async def _send(satel: AsyncSatel) -> None:
+            for frame in frames:
+                await satel._send_data(frame)
+
+        await self._async_switch_outputs(_send, list(groups.values()))
+
+    async def _async_switch_outputs(
+        self,
+        send: Callable[[AsyncSatel], Awaitable[Any]],
+        groups: list[dict[int, bool]],
+        *,
+        key: tuple[str, int] | None = None,
+    ) -> None:
+        """Send one frame per group of outputs, showing their states until confirmed.
+
+        The outputs of a frame the panel rejects, or of a command it does not
+        answer, are rolled back at once.
+        """
+        self._expect_outputs({out: state for group in groups for out, state in group.items()})
+        try:
+            results = await self._async_command(
+                PRIORITY_OUTPUT, send, len(groups), key=key
+            )
+        except ConnectionError:
+            self._pending.reject(
+                [(DISPATCH_OUTPUT, output) for group in groups for output in group]
+            )
+            raise
+        for group, result in zip(groups, results):
+            if _accepted(result):
+                continue
+            _LOGGER.warning(
+                "The panel rejected switching outputs %s: %s", sorted(group), result.hex()
+            )
+            self._pending.reject([(DISPATCH_OUTPUT, output) for output in group])
+
+    async def arm(self, partition: int | str | None = None) -> None:
+        await self._async_arm(partition, 0)
+
+    async def arm_home(self, partition: int | str | None = None) -> None:
+        await self._async_arm(partition, 1)
+
+    async def arm_night(self, partition: int | str | None = None) -> None:
+        await self._async_arm(partition, 2)
+
+    async def _async_arm(self, partition: int | str | None, mode: int) -> None:
+        """Arm a partition, showing it armed until the panel confirms."""
+        parts = _partition_list(partition)
+        target = ARM_MODE_STATES[mode]
+        self._expect_partitions(parts, target, (target, "PENDING"))
+        await self._async_partition_command(CMD_ARM + mode, parts, PRIORITY_ARM)
+
+    async def disarm(self, partition: int | str | None = None) -> None:
+        """Disarm a partition, showing it disarmed until the panel confirms."""
+        parts = _partition_list(partition)
+        self._expect_partitions(parts, "DISARMED", ("DISARMED",))
+        await self._async_partition_command(CMD_DISARM, parts, PRIORITY_DISARM)
+
+    async def disarm_partition(self, partition: int | str) -> None:
         await self.disarm(partition)
 
+    async def arm_partitions(
+        self, partitions: Iterable[int | str], mode: int = 0
+    ) -> dict[int, dict[str, Any]]:
+        """Arm several partitions with one command.
+
+        Returns the state of every partition once the panel reported it armed
+        (or counting down to arm), or when the hub timeout elapsed.
+        """
+        parts = sorted({int(part) for part in partitions})
+        return await self._async_confirm_partitions(
+            parts, {ARM_MODE_STATES[mode], "PENDING"}, CMD_ARM + mode, PRIORITY_ARM
+        )
+
+    async def disarm_partitions(
+        self, partitions: Iterable[int | str]
+    ) -> dict[int, dict[str, Any]]:
+        """Disarm several partitions with one command and report their states."""
+        parts = sorted({int(part) for part in partitions})
+        return await self._async_confirm_partitions(
+            parts, {"DISARMED"}, CMD_DISARM, PRIORITY_DISARM
+        )
+
+    async def _async_confirm_partitions(
+        self,
+        parts: list[int],
+        expected: set[str],
+        command: int,
+        priority: int,
+    ) -> dict[int, dict[str, Any]]:
+        """Send a partition command and wait until each one reaches ``expected``.
+
+        A command the panel rejects is not waited for.
+        """
+        if not parts:
+            return {}
+        self._track_partitions(parts)
+        state = self._state
+        confirmed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        @callback
+        def _check() -> None:
+            if not confirmed.done() and all(
+                state.partition(part) in expected for part in parts
+            ):
+                confirmed.set_result(None)
+
+        unsubs = [
+            self._dispatcher.subscribe(DISPATCH_PARTITION, part, _check)
+            for part in parts
+        ]
+        try:
+            accepted = await self._async_partition_command(command, parts, priority)
+            _check()
+            if accepted:
+                with suppress(TimeoutError):
+                    async with asyncio.timeout(self._timeout):
+                        await confirmed
+        finally:
+            for unsub in unsubs:
+                unsub()
+        return {
+            part: {
+                "state": state.partition(part),
+                "confirmed": state.partition(part) in expected,
+            }
+            for part in parts
+        }
+
+    async def clear_alarm(self, partition: int | str | None = None) -> None:
+        """Clear the alarm of a partition."""
+        await self._async_partition_command(
+            CMD_CLEAR_ALARM, _partition_list(partition), PRIORITY_DISARM
+        )
+
+    async def _async_partition_command(
+        self, command: int, parts: list[int], priority: int
+    ) -> bool:
+        """Send ``command`` for ``parts`` and return whether the panel accepted it.
+
+        The frame is built here rather than by the library, whose partition
+        mask cannot address partition 32.  Partitions shown in the expected
+        state are rolled back as soon as the panel rejects the command or it
+        goes unanswered.
+        """
+        keys = [(DISPATCH_PARTITION, part) for part in parts]
+        frame = encode_frame(
+            command, code_to_bytes(self._code) + mask_to_bytes(ids_to_mask(parts), 4)
+        )
+        try:
+            (result,) = await self._async_command(
+                priority, lambda satel: satel._send_data(frame)
+            )
+        except ConnectionError:
+            self._pending.reject(keys)
+            raise
+        if _accepted(result):
+            return True
+        _LOGGER.warning(
+            "The panel rejected command %#04x for partitions %s: %s",
+            command,
+            parts,
+            result.hex(),
+        )
+        self._pending.reject(keys)
+        return False
+
+    def _track_partitions(self, parts: Iterable[int]) -> None:
+        """Derive the state of commanded ``parts`` even if they are not in use.
+
+        Without partitions in use the state of every partition is derived
+        already.
+        """
+        if self._partition_mask:
+            self._partition_mask |= ids_to_mask(parts)
+
+
+def _accepted(result: bytes) -> bool:
+    """Return whether the data of a ``0xEF`` answer accepts the command."""
+    return bool(result) and result[0] in RESULT_ACCEPTED
+
+
+def _partition_list(partition: int | str | None) -> list[int]:
+    """Return the partition list for a single partition command."""
+    return [int(partition)] if partition else [1]
+
 
 @dataclass
 class SatelRuntimeData:
@@ -315,10 +1266,12 @@ class SatelRuntimeData:
 
     hub: SatelHub
     devices: dict[str, Any]
-    coordinator: DataUpdateCoordinator[dict[str, Any]] | None
+    coordinator: DataUpdateCoordinator[SatelSnapshot] | None
+    proxy: SatelProxy | None = None
 
 
-async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # pragma: no cover - YAML not supported
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    async_setup_services(hass)
     return True
 
 
@@ -327,7 +1280,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     port = entry.data.get(CONF_PORT, DEFAULT_PORT)
     code = entry.data.get(CONF_CODE)
     user_code = entry.data.get(CONF_USER_CODE)
-    encryption_key = entry.data.get(CONF_ENCRYPTION_KEY)
+    encryption_key = entry.options.get(
+        CONF_ENCRYPTION_KEY, entry.data.get(CONF_ENCRYPTION_KEY)
+    )
     encoding = entry.data.get(CONF_ENCODING, DEFAULT_ENCODING)
     update_interval = entry.options.get(
         CONF_UPDATE_INTERVAL,
@@ -343,53 +1298,211 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         CONF_ENCRYPTION_METHOD,
         entry.data.get(CONF_ENCRYPTION_METHOD, DEFAULT_ENCRYPTION_METHOD),
     )
+    coalesce_window = entry.options.get(
+        CONF_COALESCE_WINDOW,
+        entry.data.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW),
+    )
 
-    hub = SatelHub(
-        host,
-        port,
-        code,
-        user_code=user_code,
-        encryption_key=encryption_key,
-        encoding=encoding,
-        update_interval=update_interval,
-        timeout=timeout,
-        reconnect_delay=reconnect_delay,
-        encryption_method=encryption_method,
+    options = {
+        "user_code": user_code,
+        "encryption_key": encryption_key,
+        "encoding": encoding,
+        "update_interval": update_interval,
+        "timeout": timeout,
+        "reconnect_delay": reconnect_delay,
+        "encryption_method": encryption_method,
+        "coalesce_window": coalesce_window,
+    }
+    stages: dict[str, float] = {}
+    # A new entry takes over the connection its config flow opened.
+    claimed = await async_claim_hub(
+        hass, {"host": host, "port": port, "code": code, **options}
     )
-    try:
-        await hub.connect()
-    except ConnectionError as err:
-        await hub.async_close()
-        raise ConfigEntryNotReady from err
+    if claimed is not None:
+        hub, flow_devices = claimed
+    else:
+        hub = SatelHub(host, port, code, **options)
+        flow_devices = None
+        with _stage(stages, "connect"):
+            try:
+                await hub.connect()
+            except ConnectionError as err:
+                await hub.async_close()
+                raise ConfigEntryNotReady from err
+            except ValueError as err:
+                # Retrying cannot fix a missing or malformed integration key.
+                await hub.async_close()
+                raise ConfigEntryError(f"Invalid integration key: {err}") from err
+    hub.startup = stages
 
     coordinator = DataUpdateCoordinator[
-        dict[str, Any]
+        SatelSnapshot
     ](
         hass,
         _LOGGER,
         name="satel",
         update_method=hub.get_overview,
-        update_interval=timedelta(seconds=update_interval),
+        # Push only: the hub triggers resync refreshes itself when stale.
+        update_interval=None,
         config_entry=entry,
     )
-    await coordinator.async_config_entry_first_refresh()
-    monitor_task = await hub.start_monitoring(hass, coordinator)
+    with _stage(stages, "first_refresh"):
+        await coordinator.async_config_entry_first_refresh()
+    with _stage(stages, "monitoring"):
+        monitor_task = await hub.start_monitoring(hass, coordinator)
     entry.async_on_unload(monitor_task.cancel)
 
+    # Entities come from the devices the config flow just discovered, from
+    # the last discovery or from the selection made in the config flow; in
+    # the latter cases the panel is asked for its devices in the background.
+    # Only the devices selected in the config flow are monitored and get
+    # entities.
+    cache = DeviceCache(hass, host)
+    platforms_ready = asyncio.Event()
+    with _stage(stages, "load_devices"):
+        if flow_devices is not None:
+            known = flow_devices
+            await cache.async_save(hub.fingerprint, known)
+        elif stored := await cache.async_load_last():
+            cached_fingerprint, known = stored
+        else:
+            cached_fingerprint, known = None, _entry_devices(entry)
+    devices = selected_devices(known, entry.data)
+    if any(devices.values()):
+        hub.use_devices(devices)
+
     entry.runtime_data = SatelRuntimeData(
         hub=hub,
-        devices=await hub.discover_devices(),
+        devices=devices,
         coordinator=coordinator,
     )
+    if flow_devices is None:
+        entry.async_create_background_task(
+            hass,
+            _async_discover_devices(
+                hass, entry, cache, cached_fingerprint, known, platforms_ready
+            ),
+            "satel-discover-devices",
+        )
+
+    proxy_port = entry.options.get(
+        CONF_PROXY_PORT, entry.data.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT)
+    )
+    if proxy_port:
+        from .proxy import SatelProxy
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        proxy_host = entry.options.get(
+            CONF_PROXY_HOST, entry.data.get(CONF_PROXY_HOST, DEFAULT_PROXY_HOST)
+        )
+        proxy = SatelProxy(hub, proxy_port, proxy_host)
+        try:
+            await proxy.async_start()
+        except OSError as err:
+            _LOGGER.warning(
+                "Could not start the ETHM-1 proxy on %s:%s: %s",
+                proxy_host,
+                proxy_port,
+                err,
+            )
+        else:
+            entry.runtime_data.proxy = proxy
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    with _stage(stages, "platforms"):
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    platforms_ready.set()
     return True
 
 
+@contextmanager
+def _stage(stages: dict[str, float], name: str) -> Iterator[None]:
+    """Record how long a startup stage takes, in milliseconds."""
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        stages[name] = round((time.monotonic() - start) * 1000, 3)
+        _LOGGER.debug("Startup stage %s took %.1f ms", name, stages[name])
+
+
+def _entry_devices(entry: ConfigEntry) -> dict[str, list[dict[str, Any]]]:
+    """Return the devices selected in the config flow, without names."""
+    return {
+        kind: [{"id": str(device_id)} for device_id in entry.data.get(kind) or []]
+        for kind in DEVICE_KINDS
+    }
+
+
+def signal_devices_updated(entry_id: str) -> str:
+    """Return the dispatcher signal sent with freshly discovered devices."""
+    return f"{DOMAIN}_devices_updated_{entry_id}"
+
+
+async def _async_discover_devices(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    cache: DeviceCache,
+    cached_fingerprint: str | None,
+    cached_devices: dict[str, Any],
+    platforms_ready: asyncio.Event,
+) -> None:
+    """Read the devices of the panel and bring the entities in line.
+
+    The whole device list is cached; entities and monitoring follow the
+    devices selected in the config flow.  Entities of added devices are
+    added in place and those of devices not found are shown unavailable;
+    renamed devices reload the entry so entities pick up their new names.
+    """
+    data: SatelRuntimeData = entry.runtime_data
+    hub = data.hub
+    with _stage(hub.startup, "discovery"):
+        try:
+            fingerprint = await hub.async_fingerprint()
+            fresh = await hub.discover_devices()
+        except (ConnectionError, RuntimeError) as err:
+            _LOGGER.debug("Could not discover devices: %s", err)
+            return
+    if changed_devices(cached_devices, fresh) or fingerprint != cached_fingerprint:
+        await cache.async_save(fingerprint, fresh)
+    selected = selected_devices(fresh, entry.data)
+    if not (changed := changed_devices(data.devices, selected)):
+        return
+    _LOGGER.info("Devices changed on the panel: %s", changed)
+    await platforms_ready.wait()
+    if _renamed_devices(data.devices, selected):
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+    data.devices = selected
+    hub.use_devices(selected)
+    async_dispatcher_send(hass, signal_devices_updated(entry.entry_id), selected)
+
+
+def _renamed_devices(cached: dict[str, Any], fresh: dict[str, Any]) -> bool:
+    """Return whether a device present in both lists changed its name."""
+    for kind in DEVICE_KINDS:
+        old = {item["id"]: item.get("name") for item in cached.get(kind) or []}
+        for item in fresh.get(kind) or []:
+            if item["id"] in old and old[item["id"]] != item.get("name"):
+                return True
+    return False
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so changed options take effect."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok and entry.runtime_data:
+        if entry.runtime_data.proxy is not None:
+            await entry.runtime_data.proxy.async_stop()
         await entry.runtime_data.hub.async_close()
         entry.runtime_data = None
     return unload_ok
 
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the device cache of a removed entry."""
+    await DeviceCache(hass, entry.data.get(CONF_HOST, DEFAULT_HOST)).async_remove()
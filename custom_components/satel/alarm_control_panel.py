@@ -18,7 +18,8 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 
 from . import SatelHub, SatelRuntimeData
-from .entity import SatelEntity
+from .dispatch import DISPATCH_PARTITION
+from .entity import SatelEntity, async_track_devices
 
 
 async def async_setup_entry(
@@ -28,9 +29,25 @@ async def async_setup_entry(
     data: SatelRuntimeData = entry.runtime_data
     hub: SatelHub = data.hub
     coordinator = data.coordinator
-    partitions = entry.data.get("partitions") or ["1"]
-    async_add_entities(
-        [SatelAlarmPanel(hub, coordinator, part) for part in partitions]
+    selected = set(entry.data.get("partitions") or ["1"])
+    # Entries created before partitions were discovered selected all 32, so
+    # only partitions found on the panel get a panel.
+    if not data.devices.get("partitions"):
+        async_add_entities(
+            [SatelAlarmPanel(hub, coordinator, part) for part in sorted(selected, key=int)]
+        )
+        return
+
+    async_track_devices(
+        hass,
+        entry,
+        async_add_entities,
+        "partitions",
+        lambda part: (
+            [SatelAlarmPanel(hub, coordinator, part["id"])]
+            if part["id"] in selected
+            else []
+        ),
     )
 
 
@@ -47,31 +64,26 @@ class SatelAlarmPanel(SatelEntity, AlarmControlPanelEntity):
     def __init__(self, hub: SatelHub, coordinator, partition: str) -> None:
         super().__init__(hub, coordinator)
         self._partition = partition
+        self._dispatch_key = (DISPATCH_PARTITION, int(partition))
         self._attr_unique_id = f"satel_alarm_{partition}"
         self._attr_state = STATE_ALARM_DISARMED
         self._attr_translation_placeholders = {"partition": partition}
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
         await self._hub.arm(self._partition)
-        await self.coordinator.async_request_refresh()
 
     async def async_alarm_arm_home(self, code: str | None = None) -> None:
         await self._hub.arm_home(self._partition)
-        await self.coordinator.async_request_refresh()
 
     async def async_alarm_arm_night(self, code: str | None = None) -> None:
         await self._hub.arm_night(self._partition)
-        await self.coordinator.async_request_refresh()
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         await self._hub.disarm_partition(self._partition)
-        await self.coordinator.async_request_refresh()
 
     @property
     def state(self) -> str:
-        alarm = (
-            self.coordinator.data.get("alarm", {}).get(str(self._partition), "")
-        ).upper()
+        alarm = self.coordinator.data.partition(int(self._partition))
         if alarm == "ARMED_AWAY":
             return STATE_ALARM_ARMED_AWAY
         if alarm == "ARMED_HOME":
@@ -9,10 +9,34 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 
 from . import SatelHub, SatelRuntimeData
-from .entity import SatelEntity
+from .const import ZONE_ENTITIES_STATUS
+from .dispatch import DISPATCH_ZONE
+from .entity import (
+    SatelEntity,
+    async_remove_entities,
+    async_track_devices,
+    zone_entity_layout,
+)
+from .state import (
+    ATTR_ALARM_MEMORY,
+    ATTR_BYPASS,
+    ATTR_TAMPER,
+    ATTR_TROUBLES,
+    ZONE_RECORD_FIELDS,
+)
+
+# Zone attributes exposed as diagnostic entities, disabled by default, with
+# their translation key and device class.
+_ZONE_DIAGNOSTICS = (
+    (ATTR_TAMPER, "zone_tamper", BinarySensorDeviceClass.TAMPER),
+    (ATTR_TROUBLES, "zone_trouble", BinarySensorDeviceClass.PROBLEM),
+    (ATTR_BYPASS, "zone_bypass", None),
+    (ATTR_ALARM_MEMORY, "zone_alarm_memory", None),
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,18 +49,31 @@ async def async_setup_entry(
     hub: SatelHub = data.hub
     devices = data.devices or {}
     coordinator = data.coordinator
-
-    entities: list[BinarySensorEntity] = []
-    zones = devices.get("zones") or []
-    if zones:
-        entities.extend(
-            SatelZoneBinarySensor(hub, coordinator, zone["id"], zone.get("name", zone["id"]))
-            for zone in zones
+    with_zone = zone_entity_layout(entry) != ZONE_ENTITIES_STATUS
+
+    if not devices.get("zones"):
+        async_add_entities([SatelAlarmBinarySensor(hub, coordinator)])
+    if not with_zone:
+        async_remove_entities(
+            hass,
+            "binary_sensor",
+            (f"satel_zone_{zone['id']}" for zone in devices.get("zones") or []),
         )
-    else:
-        entities.append(SatelAlarmBinarySensor(hub, coordinator))
 
-    async_add_entities(entities)
+    def _zone_entities(zone: dict) -> list[SatelEntity]:
+        zone_id = zone["id"]
+        name = zone.get("name", zone_id)
+        entities: list[SatelEntity] = [
+            SatelZoneDiagnosticBinarySensor(
+                hub, coordinator, zone_id, name, attr, key, device_class
+            )
+            for attr, key, device_class in _ZONE_DIAGNOSTICS
+        ]
+        if with_zone:
+            entities.insert(0, SatelZoneBinarySensor(hub, coordinator, zone_id, name))
+        return entities
+
+    async_track_devices(hass, entry, async_add_entities, "zones", _zone_entities)
 
 
 class SatelZoneBinarySensor(SatelEntity, BinarySensorEntity):
@@ -50,25 +87,46 @@ class SatelZoneBinarySensor(SatelEntity, BinarySensorEntity):
     ) -> None:
         super().__init__(hub, coordinator)
         self._zone_id = zone_id
+        self._zone = int(zone_id)
+        self._record = hub.zone_record(self._zone)
+        self._dispatch_key = (DISPATCH_ZONE, self._zone)
         self._attr_unique_id = f"satel_zone_{zone_id}"
         self._attr_translation_placeholders = {"zone": name}
 
     @property
     def is_on(self) -> bool | None:
-        status = self.coordinator.data.get("zones", {}).get(self._zone_id)
-        if status is None:
-            return None
-        return status.upper() == "ON"
+        return self._record.violation
+
+
+class SatelZoneDiagnosticBinarySensor(SatelEntity, BinarySensorEntity):
+    """Tamper, trouble, bypass or alarm memory flag of a Satel zone."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        hub: SatelHub,
+        coordinator,
+        zone_id: str,
+        name: str,
+        attr: str,
+        translation_key: str,
+        device_class: BinarySensorDeviceClass | None,
+    ) -> None:
+        super().__init__(hub, coordinator)
+        self._zone = int(zone_id)
+        self._record = hub.zone_record(self._zone)
+        self._field = ZONE_RECORD_FIELDS[attr]
+        self._dispatch_key = (DISPATCH_ZONE, self._zone)
+        self._attr_unique_id = f"satel_zone_{attr}_{zone_id}"
+        self._attr_translation_key = translation_key
+        self._attr_translation_placeholders = {"zone": name}
+        self._attr_device_class = device_class
 
     @property
-    def extra_state_attributes(self) -> dict[str, str | None]:
-        data = self.coordinator.data
-        return {
-            "troubles": data.get("troubles", {}).get(self._zone_id),
-            "tamper": data.get("tamper", {}).get(self._zone_id),
-            "bypass": data.get("bypass", {}).get(self._zone_id),
-            "alarm_memory": data.get("alarm_memory", {}).get(self._zone_id),
-        }
+    def is_on(self) -> bool | None:
+        return getattr(self._record, self._field)
 
 
 class SatelAlarmBinarySensor(SatelEntity, BinarySensorEntity):
@@ -82,8 +140,6 @@ class SatelAlarmBinarySensor(SatelEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool:
-        alarm = self.coordinator.data.get("alarm")
-        if isinstance(alarm, dict):
-            return any(state.upper() == "TRIGGERED" for state in alarm.values())
-        return str(alarm).upper() == "ALARM"
-
+        return any(
+            state == "TRIGGERED" for state in self.coordinator.data.alarm.values()
+        )
@@ -0,0 +1,81 @@
+"""Persistent cache of the zone, output and partition names of a panel."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+
+DEVICE_KINDS = ("zones", "outputs", "partitions")
+
+
+class DeviceCache:
+    """Device lists discovered on a panel, stored per host.
+
+    The lists are stored with the ``fingerprint`` (panel type and firmware
+    version) they were read with.  Setup starts from the last stored lists
+    while discovery reads the panel again.
+    """
+
+    def __init__(self, hass: HomeAssistant, host: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.devices_{slugify(host)}"
+        )
+        self._host = host
+
+    async def async_load_last(self) -> tuple[str | None, dict[str, Any]] | None:
+        """Return the fingerprint and devices last stored for the host."""
+        data = await self._store.async_load()
+        if not data or data.get("host") != self._host:
+            return None
+        return data.get("fingerprint"), data["devices"]
+
+    async def async_save(self, fingerprint: str | None, devices: dict[str, Any]) -> None:
+        """Store ``devices`` for ``fingerprint``."""
+        await self._store.async_save(
+            {"host": self._host, "fingerprint": fingerprint, "devices": devices}
+        )
+
+    async def async_remove(self) -> None:
+        """Drop the cached devices."""
+        await self._store.async_remove()
+
+
+def changed_devices(cached: dict[str, Any], fresh: dict[str, Any]) -> dict[str, list[str]]:
+    """Return per kind the ids added, renamed or removed since ``cached``."""
+    changed: dict[str, list[str]] = {}
+    for kind in DEVICE_KINDS:
+        old = {item["id"]: item.get("name") for item in cached.get(kind, [])}
+        new = {item["id"]: item.get("name") for item in fresh.get(kind, [])}
+        if ids := sorted(
+            (key for key in old.keys() | new.keys() if old.get(key) != new.get(key)),
+            key=int,
+        ):
+            changed[kind] = ids
+    return changed
+
+
+def selected_devices(
+    devices: dict[str, Any], selection: Mapping[str, Any]
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the ``devices`` picked in the config flow.
+
+    ``selection`` holds the chosen ids per kind, as stored in the entry
+    data; kinds it does not mention are kept whole.
+    """
+    selected: dict[str, list[dict[str, Any]]] = {}
+    for kind in DEVICE_KINDS:
+        items = devices.get(kind) or []
+        if (ids := selection.get(kind)) is None:
+            selected[kind] = list(items)
+        else:
+            wanted = {str(device_id) for device_id in ids}
+            selected[kind] = [item for item in items if item["id"] in wanted]
+    return selected
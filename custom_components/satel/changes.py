@@ -0,0 +1,82 @@
+"""Pacing and accounting of the panel's change flag polls."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+FAST_INTERVAL = 0.5
+SLOW_INTERVAL = 5.0
+# Polls without any flag set before the interval starts growing again.
+COOLDOWN_POLLS = 4
+
+# Bytes framing a command and its data: the two byte header, the checksum
+# and the two byte trailer.  Byte stuffing is not counted.
+FRAME_OVERHEAD = 6
+
+
+class ChangePoller:
+    """Pace the change flag polls and count the queries they lead to.
+
+    The panel flags every state group that changed since it was last read.
+    While polls find flags set the next poll follows after ``fast``
+    seconds; after ``cooldown`` quiet polls the interval doubles up to
+    ``slow`` seconds.  Commands and bytes exchanged are counted per group.
+    """
+
+    def __init__(
+        self,
+        fast: float = FAST_INTERVAL,
+        slow: float = SLOW_INTERVAL,
+        cooldown: int = COOLDOWN_POLLS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fast = fast
+        self._slow = max(slow, fast)
+        self._cooldown = cooldown
+        self._clock = clock
+        self._started = clock()
+        self._quiet = 0
+        self._groups: dict[str, list[int]] = {}
+        self.interval = fast
+        self.polls = 0
+        self.hot_polls = 0
+
+    def record_poll(self, flagged: bool) -> None:
+        """Adapt the interval to whether the last poll found flags set."""
+        self.polls += 1
+        if flagged:
+            self.hot_polls += 1
+            self._quiet = 0
+            self.interval = self._fast
+            return
+        self._quiet += 1
+        if self._quiet > self._cooldown:
+            self.interval = min(self.interval * 2, self._slow)
+
+    def account(self, group: str, data: bytes, answer: bytes) -> None:
+        """Count one query of ``group`` with ``data`` and its ``answer``.
+
+        ``answer`` is the answer frame's command byte followed by its data.
+        """
+        counters = self._groups.setdefault(group, [0, 0])
+        counters[0] += 1
+        counters[1] += 1 + len(data) + len(answer) + 2 * FRAME_OVERHEAD
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        elapsed = max(self._clock() - self._started, 1e-9)
+        return {
+            "interval": self.interval,
+            "polls": self.polls,
+            "hot_polls": self.hot_polls,
+            "groups": {
+                group: {
+                    "commands": commands,
+                    "bytes": size,
+                    "commands_per_s": round(commands / elapsed, 3),
+                    "bytes_per_s": round(size / elapsed, 1),
+                }
+                for group, (commands, size) in self._groups.items()
+            },
+        }
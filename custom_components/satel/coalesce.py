@@ -0,0 +1,75 @@
+"""Coalescing of bursts of monitor callbacks into single updates."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable
+
+
+class UpdateCoalescer:
+    """Merge update requests arriving close together into one flush.
+
+    With a window of ``0`` every request made during the same event loop
+    iteration is merged; a positive window (in seconds) additionally merges
+    requests arriving until the window elapses.
+    """
+
+    def __init__(self, flush: Callable[[], None], window: float = 0) -> None:
+        self._flush = flush
+        self._window = window
+        self._handle: asyncio.Handle | None = None
+        self.requests = 0
+        self.flushes = 0
+
+    @property
+    def window(self) -> float:
+        """Return the coalescing window in seconds."""
+        return self._window
+
+    @property
+    def pending(self) -> bool:
+        """Return whether a flush is scheduled."""
+        return self._handle is not None
+
+    @property
+    def merged(self) -> int:
+        """Return how many requests were absorbed by an earlier one."""
+        return self.requests - self.flushes - (1 if self._handle else 0)
+
+    def schedule(self) -> None:
+        """Request a flush, merging with an already scheduled one."""
+        self.requests += 1
+        if self._handle is not None:
+            return
+        loop = asyncio.get_running_loop()
+        if self._window > 0:
+            self._handle = loop.call_later(self._window, self._run)
+        else:
+            self._handle = loop.call_soon(self._run)
+
+    def flush(self) -> None:
+        """Run a pending flush immediately."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._run()
+
+    def cancel(self) -> None:
+        """Drop a pending flush."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _run(self) -> None:
+        self._handle = None
+        self.flushes += 1
+        self._flush()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return counters describing how much work was merged."""
+        return {
+            "window_ms": round(self._window * 1000, 3),
+            "requests": self.requests,
+            "flushes": self.flushes,
+            "merged": self.merged,
+        }
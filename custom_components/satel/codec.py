@@ -0,0 +1,184 @@
+"""Incremental codec for ETHM-1 integration protocol frames.
+
+A frame on the wire is ``FE FE <payload> <crc hi> <crc lo> FE 0D`` where
+every ``FE`` byte of payload and checksum is sent as ``FE F0``.  The payload
+starts with the command byte; answers to the state commands
+``0x00``-``0x7F`` carry a little endian bitmask of zones, outputs or
+partitions, which is decoded straight into a Python ``int``.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+SYNC = b"\xfe\xfe"
+END = b"\xfe\x0d"
+STUFFED = b"\xfe\xf0"
+ESCAPE = b"\xfe"
+
+CRC_INIT = 0x147A
+
+# Frames longer than this are treated as garbage; the longest frames of the
+# protocol (32-byte bitmasks with a user code) are well below it.
+MAX_FRAME = 256
+
+_crc_table: array | None = None
+
+
+def _build_crc_table() -> array:
+    """Return the byte independent part of every checksum step.
+
+    Each step of the Satel checksum rotates the 16-bit value left, inverts it
+    and adds its own high byte before adding the data byte, so everything but
+    the final addition is looked up by the current value.
+    """
+    global _crc_table  # noqa: PLW0603 - built lazily on first use
+    if _crc_table is None:
+        table = array("H", bytes(0x20000))
+        for crc in range(0x10000):
+            step = (((crc << 1) & 0xFFFF) | (crc >> 15)) ^ 0xFFFF
+            table[crc] = (step + (step >> 8)) & 0xFFFF
+        _crc_table = table
+    return _crc_table
+
+
+def checksum(data: bytes | bytearray | memoryview) -> int:
+    """Return the Satel checksum of ``data``."""
+    table = _crc_table or _build_crc_table()
+    crc = CRC_INIT
+    for byte in data:
+        crc = (table[crc] + byte) & 0xFFFF
+    return crc
+
+
+def encode_frame(command: int, data: bytes = b"") -> bytes:
+    """Return a complete frame for ``command`` followed by ``data``."""
+    payload = bytes((command,)) + data
+    crc = checksum(payload)
+    body = payload + bytes((crc >> 8, crc & 0xFF))
+    return SYNC + body.replace(ESCAPE, STUFFED) + END
+
+
+class Frame(NamedTuple):
+    """A decoded frame: command byte and the data following it."""
+
+    command: int
+    data: bytes
+
+    @property
+    def mask(self) -> int:
+        """Return the data of a state answer as a bitmask (bit 0 = id 1)."""
+        return int.from_bytes(self.data, "little")
+
+
+def iter_ids(mask: int) -> Iterator[int]:
+    """Yield the 1-based ids of the bits set in ``mask``."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length()
+        mask ^= low
+
+
+def ids_to_mask(ids: Any) -> int:
+    """Return the bitmask with the bits of the given 1-based ids set."""
+    mask = 0
+    for index in ids:
+        mask |= 1 << (int(index) - 1)
+    return mask
+
+
+def mask_to_bytes(mask: int, length: int) -> bytes:
+    """Return ``mask`` as the little endian byte list used by commands."""
+    return mask.to_bytes(length, "little")
+
+
+def code_to_bytes(code: str) -> bytes:
+    """Return the 8-byte user code field, padded with ``F`` digits."""
+    return bytes.fromhex(code.ljust(16, "F"))
+
+
+class FrameDecoder:
+    """Split a byte stream into verified frames.
+
+    Data is appended to an internal buffer and scanned through a
+    ``memoryview``; complete frames are unstuffed and checksum verified in
+    one pass of C level operations, and partial frames stay buffered until
+    the rest arrives.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self.frames = 0
+        self.crc_errors = 0
+        self.discarded = 0
+
+    def feed(self, data: bytes | bytearray | memoryview) -> list[Frame]:
+        """Add received bytes and return every frame they completed."""
+        buffer = self._buffer
+        buffer += data
+        frames: list[Frame] = []
+        start = 0
+        view = memoryview(buffer)
+        try:
+            while True:
+                sync = buffer.find(SYNC, start)
+                if sync < 0:
+                    # Keep a trailing FE, it may be the first half of a sync.
+                    keep = len(buffer) - 1 if buffer.endswith(ESCAPE) else len(buffer)
+                    self.discarded += keep - start
+                    start = keep
+                    break
+                if sync > start:
+                    self.discarded += sync - start
+                # Skip repeated sync bytes, a frame body never starts with FE.
+                body = sync + 2
+                while buffer.startswith(ESCAPE, body) and not buffer.startswith(
+                    STUFFED, body
+                ):
+                    body += 1
+                end = buffer.find(END, body)
+                if end < 0:
+                    if len(buffer) - sync > MAX_FRAME:
+                        self.discarded += len(buffer) - sync
+                        start = len(buffer)
+                    else:
+                        start = sync
+                    break
+                start = end + 2
+                frame = self._decode(view[body:end])
+                if frame is not None:
+                    frames.append(frame)
+        finally:
+            view.release()
+        del buffer[:start]
+        return frames
+
+    def _decode(self, raw: memoryview) -> Frame | None:
+        body = raw.tobytes()
+        if STUFFED in body:
+            body = body.replace(STUFFED, ESCAPE)
+        if len(body) < 3:
+            self.crc_errors += 1
+            return None
+        crc = (body[-2] << 8) | body[-1]
+        if checksum(memoryview(body)[:-2]) != crc:
+            self.crc_errors += 1
+            return None
+        self.frames += 1
+        return Frame(body[0], body[1:-2])
+
+    @property
+    def buffered(self) -> int:
+        """Return the number of bytes waiting for the rest of a frame."""
+        return len(self._buffer)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return decoder counters."""
+        return {
+            "frames": self.frames,
+            "crc_errors": self.crc_errors,
+            "discarded_bytes": self.discarded,
+        }
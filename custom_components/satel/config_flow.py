@@ -8,15 +8,18 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
 from . import SatelHub
+from .handoff import async_discard_hub, async_park_hub
 from .const import (
     DOMAIN,
     DEFAULT_HOST,
     DEFAULT_PORT,
     CONF_CODE,
+    CONF_ENCRYPTION_KEY,
     DEFAULT_ENCODING,
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
@@ -27,11 +30,37 @@ from .const import (
     CONF_ENCRYPTION_METHOD,
     DEFAULT_ENCRYPTION_METHOD,
     ENCRYPTION_METHODS,
+    ZONE_ENTITY_LAYOUTS,
+    ENCRYPTION_METHOD_NONE,
+    CONF_COALESCE_WINDOW,
+    CONF_PROXY_HOST,
+    CONF_PROXY_PORT,
+    CONF_ZONE_ENTITIES,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_PROXY_HOST,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_ZONE_ENTITIES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _encryption_key_error(method: str, key: str | None) -> str | None:
+    """Return the form error for a key unusable with encryption ``method``."""
+    if method == ENCRYPTION_METHOD_NONE:
+        return None
+    # Imported here: it loads the cipher and the protocol library.
+    from .encryption import integration_key_to_aes_key
+
+    try:
+        if not key:
+            raise ValueError("Missing integration key")
+        integration_key_to_aes_key(key)
+    except ValueError:
+        return "invalid_encryption_key"
+    return None
+
+
 class SatelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Satel."""
 
@@ -45,29 +74,42 @@ class SatelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._host = user_input[CONF_HOST]
             self._port = user_input[CONF_PORT]
             self._user_code = None
-            self._encryption_key = None
+            self._encryption_key = user_input.get(CONF_ENCRYPTION_KEY)
             self._encoding = DEFAULT_ENCODING
             self._update_interval = DEFAULT_UPDATE_INTERVAL
             self._timeout = DEFAULT_TIMEOUT
             self._reconnect_delay = DEFAULT_RECONNECT_DELAY
-            self._encryption_method = DEFAULT_ENCRYPTION_METHOD
+            self._encryption_method = user_input.get(
+                CONF_ENCRYPTION_METHOD, DEFAULT_ENCRYPTION_METHOD
+            )
             self._code = user_input[CONF_CODE]
 
             await self.async_set_unique_id(self._host)
             self._abort_if_unique_id_configured()
 
-            hub = SatelHub(
-                self._host,
-                self._port,
-                self._code,
-                user_code=self._user_code,
-                encryption_key=self._encryption_key,
-                encoding=self._encoding,
-                update_interval=self._update_interval,
-                timeout=self._timeout,
-                reconnect_delay=self._reconnect_delay,
-                encryption_method=self._encryption_method,
-            )
+            if error := _encryption_key_error(
+                self._encryption_method, self._encryption_key
+            ):
+                errors[CONF_ENCRYPTION_KEY] = error
+
+        if user_input is not None and not errors:
+            # The same settings the entry will be set up with, so the entry
+            # can take over this connection.
+            options = {
+                "user_code": self._user_code,
+                "encryption_key": (
+                    self._encryption_key
+                    if self._encryption_method != ENCRYPTION_METHOD_NONE
+                    else None
+                ),
+                "encoding": self._encoding,
+                "update_interval": self._update_interval,
+                "timeout": self._timeout,
+                "reconnect_delay": self._reconnect_delay,
+                "encryption_method": self._encryption_method,
+                "coalesce_window": DEFAULT_COALESCE_WINDOW,
+            }
+            hub = SatelHub(self._host, self._port, self._code, **options)
             try:
                 await hub.connect()
                 self._devices = await hub.discover_devices()
@@ -79,35 +121,64 @@ class SatelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
                 _LOGGER.exception("Unexpected exception: %s", err)
             else:
+                async_park_hub(
+                    self.hass,
+                    hub,
+                    {"host": self._host, "port": self._port, "code": self._code, **options},
+                    self._devices,
+                )
+                self._parked = True
                 return await self.async_step_select()
-            finally:
-                await hub.async_close()
+            await hub.async_close()
 
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_HOST, default=DEFAULT_HOST): selector.TextSelector(),
                 vol.Required(CONF_PORT, default=DEFAULT_PORT): selector.NumberSelector(),
                 vol.Required(CONF_CODE): selector.TextSelector(),
+                vol.Optional(
+                    CONF_ENCRYPTION_METHOD, default=DEFAULT_ENCRYPTION_METHOD
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=ENCRYPTION_METHODS,
+                        translation_key=CONF_ENCRYPTION_METHOD,
+                    )
+                ),
+                vol.Optional(CONF_ENCRYPTION_KEY): selector.TextSelector(
+                    selector.TextSelectorConfig(
+                        type=selector.TextSelectorType.PASSWORD
+                    )
+                ),
             }
         )
         return self.async_show_form(
             step_id="user", data_schema=data_schema, errors=errors
         )
 
+    @callback
+    def async_remove(self) -> None:
+        """Close the parked connection unless the new entry took it over.
+
+        A created entry has been set up by the time the flow is removed.
+        """
+        if getattr(self, "_parked", False):
+            self.hass.async_create_task(async_discard_hub(self.hass, self._host))
+
     async def async_step_select(self, user_input: dict | None = None) -> FlowResult:
         """Handle zone and output selection."""
         if user_input is not None:
-            return self.async_create_entry(
-                title=f"Satel {self._host}",
-                data={
-                    CONF_HOST: self._host,
-                    CONF_PORT: self._port,
-                    CONF_CODE: self._code,
-                    "zones": user_input.get("zones", []),
-                    "outputs": user_input.get("outputs", []),
-                    "partitions": user_input.get("partitions", []),
-                },
-            )
+            data = {
+                CONF_HOST: self._host,
+                CONF_PORT: self._port,
+                CONF_CODE: self._code,
+                "zones": user_input.get("zones", []),
+                "outputs": user_input.get("outputs", []),
+                "partitions": user_input.get("partitions", []),
+            }
+            if self._encryption_method != ENCRYPTION_METHOD_NONE:
+                data[CONF_ENCRYPTION_METHOD] = self._encryption_method
+                data[CONF_ENCRYPTION_KEY] = self._encryption_key
+            return self.async_create_entry(title=f"Satel {self._host}", data=data)
 
         zone_values = [z["id"] for z in self._devices.get("zones", [])]
         zone_options = [
@@ -168,8 +239,18 @@ class SatelOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input: dict | None = None) -> FlowResult:
         """Manage Satel options."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            # Without a key in the options the one from setup is used.
+            if error := _encryption_key_error(
+                user_input.get(CONF_ENCRYPTION_METHOD, DEFAULT_ENCRYPTION_METHOD),
+                user_input.get(
+                    CONF_ENCRYPTION_KEY, self._config_entry.data.get(CONF_ENCRYPTION_KEY)
+                ),
+            ):
+                errors[CONF_ENCRYPTION_KEY] = error
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
         data = {**self._config_entry.data, **self._config_entry.options}
         data_schema = vol.Schema(
@@ -191,7 +272,29 @@ class SatelOptionsFlow(config_entries.OptionsFlow):
                         CONF_ENCRYPTION_METHOD, DEFAULT_ENCRYPTION_METHOD
                     ),
                 ): vol.In(ENCRYPTION_METHODS),
+                vol.Optional(
+                    CONF_ENCRYPTION_KEY,
+                    description={"suggested_value": data.get(CONF_ENCRYPTION_KEY)},
+                ): str,
+                vol.Optional(
+                    CONF_COALESCE_WINDOW,
+                    default=data.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW),
+                ): vol.All(int, vol.Range(min=0, max=1000)),
+                vol.Optional(
+                    CONF_PROXY_PORT,
+                    default=data.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT),
+                ): vol.All(int, vol.Range(min=0, max=65535)),
+                vol.Optional(
+                    CONF_PROXY_HOST,
+                    default=data.get(CONF_PROXY_HOST, DEFAULT_PROXY_HOST),
+                ): str,
+                vol.Optional(
+                    CONF_ZONE_ENTITIES,
+                    default=data.get(CONF_ZONE_ENTITIES, DEFAULT_ZONE_ENTITIES),
+                ): vol.In(ZONE_ENTITY_LAYOUTS),
             }
         )
-        return self.async_show_form(step_id="init", data_schema=data_schema)
+        return self.async_show_form(
+            step_id="init", data_schema=data_schema, errors=errors
+        )
 
@@ -7,9 +7,23 @@ DEFAULT_PORT = 7094
 DEFAULT_ENCODING = "utf-8"
 DEFAULT_TIMEOUT = 10
 DEFAULT_UPDATE_INTERVAL = 0
+# Resync interval used while push updates are stale and no explicit
+# ``update_interval`` is configured.
+DEFAULT_RESYNC_INTERVAL = 60
 DEFAULT_RECONNECT_DELAY = 15
+DEFAULT_COALESCE_WINDOW = 0
+DEFAULT_PROXY_PORT = 0
+# The proxy speaks the unencrypted protocol, so it only listens locally unless
+# another interface is configured.
+DEFAULT_PROXY_HOST = "127.0.0.1"
+ZONE_ENTITIES_BINARY = "binary"
+ZONE_ENTITIES_STATUS = "status"
+ZONE_ENTITIES_BOTH = "both"
+ZONE_ENTITY_LAYOUTS = [ZONE_ENTITIES_BINARY, ZONE_ENTITIES_STATUS, ZONE_ENTITIES_BOTH]
+DEFAULT_ZONE_ENTITIES = ZONE_ENTITIES_BOTH
 ENCRYPTION_METHOD_NONE = "none"
-ENCRYPTION_METHODS = [ENCRYPTION_METHOD_NONE]
+ENCRYPTION_METHOD_INTEGRATION_KEY = "integration_key"
+ENCRYPTION_METHODS = [ENCRYPTION_METHOD_NONE, ENCRYPTION_METHOD_INTEGRATION_KEY]
 DEFAULT_ENCRYPTION_METHOD = ENCRYPTION_METHOD_NONE
 
 CONF_CODE = "code"
@@ -20,4 +34,26 @@ CONF_UPDATE_INTERVAL = "update_interval"
 CONF_TIMEOUT = "timeout"
 CONF_RECONNECT_DELAY = "reconnect_delay"
 CONF_ENCRYPTION_METHOD = "encryption_method"
+CONF_COALESCE_WINDOW = "coalesce_window"
+CONF_PROXY_PORT = "proxy_port"
+CONF_PROXY_HOST = "proxy_host"
+CONF_ZONE_ENTITIES = "zone_entities"
 
+
+SERVICE_ARM_PARTITIONS = "arm_partitions"
+SERVICE_DISARM_PARTITIONS = "disarm_partitions"
+SERVICE_SET_OUTPUTS = "set_outputs"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_PARTITIONS = "partitions"
+ATTR_MODE = "mode"
+ATTR_TURN_ON = "turn_on"
+ATTR_TURN_OFF = "turn_off"
+
+# Arming modes accepted by the ``arm_partitions`` service.
+ARM_MODES = {"away": 0, "home": 1, "night": 2}
+
+# Bus events fired straight from the monitor callbacks, ahead of the entity
+# updates.
+EVENT_ZONE_VIOLATED = "satel_zone_violated"
+EVENT_OUTPUT_CHANGED = "satel_output_changed"
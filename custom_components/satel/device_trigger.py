@@ -0,0 +1,111 @@
+"""Device triggers for Satel zones and outputs."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.device_automation import (
+    DEVICE_TRIGGER_BASE_SCHEMA,
+    InvalidDeviceAutomationConfig,
+)
+from homeassistant.components.homeassistant.triggers import event as event_trigger
+from homeassistant.const import (
+    CONF_DEVICE_ID,
+    CONF_DOMAIN,
+    CONF_PLATFORM,
+    CONF_TYPE,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from .const import DOMAIN, EVENT_OUTPUT_CHANGED, EVENT_ZONE_VIOLATED
+
+CONF_SUBTYPE = "subtype"
+
+TRIGGER_ZONE_VIOLATED = "zone_violated"
+TRIGGER_OUTPUT_ON = "output_turned_on"
+TRIGGER_OUTPUT_OFF = "output_turned_off"
+
+# Device kind each trigger type is offered for, with the event it listens to
+# and the event data matched besides the host and id.
+TRIGGER_TYPES: dict[str, tuple[str, str, dict[str, Any]]] = {
+    TRIGGER_ZONE_VIOLATED: ("zones", EVENT_ZONE_VIOLATED, {}),
+    TRIGGER_OUTPUT_ON: ("outputs", EVENT_OUTPUT_CHANGED, {"on": True}),
+    TRIGGER_OUTPUT_OFF: ("outputs", EVENT_OUTPUT_CHANGED, {"on": False}),
+}
+
+# Event data key holding the id of each device kind.
+_ID_KEYS = {"zones": "zone", "outputs": "output"}
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES),
+        vol.Required(CONF_SUBTYPE): cv.string,
+    }
+)
+
+
+def _panel_host(hass: HomeAssistant, device_id: str) -> str | None:
+    """Return the host of the panel behind ``device_id``."""
+    if (device := dr.async_get(hass).async_get(device_id)) is None:
+        return None
+    return next(
+        (value for domain, value in device.identifiers if domain == DOMAIN), None
+    )
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """List a trigger per zone and output state of the panel."""
+    if (host := _panel_host(hass, device_id)) is None:
+        return []
+    triggers = []
+    for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+        if entry.runtime_data.hub.host != host:
+            continue
+        devices = entry.runtime_data.devices or {}
+        for trigger_type, (kind, _, _) in TRIGGER_TYPES.items():
+            triggers.extend(
+                {
+                    CONF_PLATFORM: "device",
+                    CONF_DEVICE_ID: device_id,
+                    CONF_DOMAIN: DOMAIN,
+                    CONF_TYPE: trigger_type,
+                    CONF_SUBTYPE: str(device["id"]),
+                }
+                for device in devices.get(kind) or []
+            )
+    return triggers
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Listen for the zone or output event of a trigger."""
+    if (host := _panel_host(hass, config[CONF_DEVICE_ID])) is None:
+        raise InvalidDeviceAutomationConfig(
+            f"Unknown Satel device {config[CONF_DEVICE_ID]}"
+        )
+    kind, event_type, data = TRIGGER_TYPES[config[CONF_TYPE]]
+    event_config = event_trigger.TRIGGER_SCHEMA(
+        {
+            event_trigger.CONF_PLATFORM: "event",
+            event_trigger.CONF_EVENT_TYPE: event_type,
+            event_trigger.CONF_EVENT_DATA: {
+                "host": host,
+                _ID_KEYS[kind]: int(config[CONF_SUBTYPE]),
+                **data,
+            },
+        }
+    )
+    return await event_trigger.async_attach_trigger(
+        hass, event_config, action, trigger_info, platform_type="device"
+    )
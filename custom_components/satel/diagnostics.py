@@ -0,0 +1,30 @@
+"""Diagnostics support for the Satel integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_CODE, CONF_ENCRYPTION_KEY, CONF_USER_CODE
+
+TO_REDACT = {CONF_CODE, CONF_USER_CODE, CONF_ENCRYPTION_KEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        }
+    }
+    if entry.runtime_data:
+        data["metrics"] = entry.runtime_data.hub.metrics
+        if entry.runtime_data.proxy is not None:
+            data["proxy"] = entry.runtime_data.proxy.stats
+    return data
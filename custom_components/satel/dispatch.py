@@ -0,0 +1,72 @@
+"""Per-id change dispatch from the hub to the entities that display it."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, Callable
+
+DISPATCH_ZONE = "zone"
+DISPATCH_OUTPUT = "output"
+DISPATCH_PARTITION = "partition"
+
+DISPATCH_KINDS = (DISPATCH_ZONE, DISPATCH_OUTPUT, DISPATCH_PARTITION)
+
+
+class ChangeDispatcher:
+    """Collect changed ids and notify only the subscribers of those ids."""
+
+    def __init__(self) -> None:
+        self._subscribers: dict[tuple[str, int], list[Callable[[], None]]] = {}
+        self._changed: dict[str, set[int]] = {kind: set() for kind in DISPATCH_KINDS}
+        self.dispatched = 0
+
+    def subscribe(
+        self, kind: str, index: int, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Register ``update_callback`` for changes of ``kind``/``index``."""
+        key = (kind, index)
+        callbacks = self._subscribers.setdefault(key, [])
+        callbacks.append(update_callback)
+
+        def _unsubscribe() -> None:
+            callbacks.remove(update_callback)
+            if not callbacks:
+                self._subscribers.pop(key, None)
+
+        return _unsubscribe
+
+    def mark(self, kind: str, indices: Iterable[int]) -> None:
+        """Record ids of ``kind`` whose state changed."""
+        self._changed[kind].update(indices)
+
+    @property
+    def pending(self) -> bool:
+        """Return whether there are changes waiting to be dispatched."""
+        return any(self._changed.values())
+
+    def flush(self) -> None:
+        """Notify subscribers of every id changed since the last flush."""
+        subscribers = self._subscribers
+        for kind, changed in self._changed.items():
+            if not changed:
+                continue
+            indices = list(changed)
+            changed.clear()
+            for index in indices:
+                for update_callback in tuple(subscribers.get((kind, index), ())):
+                    self.dispatched += 1
+                    update_callback()
+
+    def notify_all(self) -> None:
+        """Notify every subscriber, e.g. when availability changes."""
+        for callbacks in list(self._subscribers.values()):
+            for update_callback in list(callbacks):
+                update_callback()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return counters describing the dispatch work."""
+        return {
+            "subscriptions": sum(len(c) for c in self._subscribers.values()),
+            "dispatched": self.dispatched,
+        }
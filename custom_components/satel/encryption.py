@@ -0,0 +1,184 @@
+"""ETHM-1 integration key encryption.
+
+With encryption enabled every frame is sent as a PDU ``<length> <encrypted
+block>`` where the encrypted block is a 6-byte header followed by the plain
+frame.  The header carries two random bytes, a rolling counter and the
+``id_s``/``id_r`` pair: each side picks an ``id_s`` for the PDUs it sends
+and echoes the last ``id_s`` it received as ``id_r``.  Our ``id_s`` is
+picked once per connection so answers to pipelined queries all match it.
+
+The panel uses AES-192 in CBC mode with an all-zero block encrypted under
+the key as initial vector; a trailing partial block is XORed with the
+encryption of the last cipher block.  The AES key schedule lives in the
+``cryptography`` cipher contexts, created once per connection.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+from typing import Any
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from .codec import END
+from .transport import FramedSatel
+
+_LOGGER = logging.getLogger(__name__)
+
+BLOCK = 16
+KEY_LENGTH = 12
+HEADER = struct.Struct(">2sHBB")
+
+
+def integration_key_to_aes_key(integration_key: str) -> bytes:
+    """Return the 24-byte AES key for an integration key of up to 12 chars."""
+    key = integration_key.encode("ascii")
+    if len(key) > KEY_LENGTH:
+        raise ValueError("Integration key is longer than 12 characters")
+    key = key.ljust(KEY_LENGTH, b" ")
+    return key + key
+
+
+def _xor(data: Any, pad: Any) -> bytes:
+    size = len(data)
+    return (int.from_bytes(data, "big") ^ int.from_bytes(pad, "big")).to_bytes(
+        size, "big"
+    )
+
+
+class SatelCipher:
+    """Encrypt and decrypt PDU payloads with an expanded integration key."""
+
+    __slots__ = ("_decrypt", "_encrypt", "_iv")
+
+    def __init__(self, integration_key: str) -> None:
+        cipher = Cipher(
+            algorithms.AES(integration_key_to_aes_key(integration_key)), modes.ECB()
+        )
+        # ECB contexts are stateless per block, so one of each is reused for
+        # every block of the connection.
+        self._encrypt = cipher.encryptor().update
+        self._decrypt = cipher.decryptor().update
+        self._iv = self._encrypt(bytes(BLOCK))
+
+    def encrypt(self, data: bytes | bytearray) -> bytearray:
+        """Return ``data`` encrypted, zero padded to at least one block."""
+        if len(data) < BLOCK:
+            data = bytes(data) + bytes(BLOCK - len(data))
+        encrypt = self._encrypt
+        size = len(data)
+        full = size - size % BLOCK
+        view = memoryview(data)
+        out = bytearray(size)
+        cv = self._iv
+        for pos in range(0, full, BLOCK):
+            cv = encrypt(_xor(view[pos : pos + BLOCK], cv))
+            out[pos : pos + BLOCK] = cv
+        if full < size:
+            cv = encrypt(cv)
+            out[full:] = _xor(view[full:], cv[: size - full])
+        return out
+
+    def decrypt(self, data: bytes | bytearray) -> bytearray:
+        """Return the plain text of an encrypted PDU payload."""
+        decrypt = self._decrypt
+        size = len(data)
+        full = size - size % BLOCK
+        view = memoryview(data)
+        out = bytearray(size)
+        cv: Any = self._iv
+        for pos in range(0, full, BLOCK):
+            block = view[pos : pos + BLOCK]
+            out[pos : pos + BLOCK] = _xor(decrypt(block), cv)
+            cv = block
+        if full < size:
+            cv = self._encrypt(cv)
+            out[full:] = _xor(view[full:], cv[: size - full])
+        return out
+
+
+class EncryptedSession:
+    """Wrap and unwrap frames of one encrypted connection."""
+
+    __slots__ = ("_cipher", "counter", "id_r", "id_s", "received", "rejected", "sent")
+
+    def __init__(self, integration_key: str) -> None:
+        self._cipher = SatelCipher(integration_key)
+        self.counter = 0
+        self.id_s = os.urandom(1)[0]
+        self.id_r = 0
+        self.sent = 0
+        self.received = 0
+        self.rejected = 0
+
+    def wrap(self, frame: bytes | bytearray) -> bytes:
+        """Return the length prefixed PDU carrying ``frame``."""
+        plain = bytearray(HEADER.size + len(frame))
+        HEADER.pack_into(plain, 0, os.urandom(2), self.counter, self.id_s, self.id_r)
+        plain[HEADER.size :] = frame
+        self.counter = (self.counter + 1) & 0xFFFF
+        self.sent += 1
+        pdu = self._cipher.encrypt(plain)
+        pdu[0:0] = bytes((len(pdu),))
+        return bytes(pdu)
+
+    def unwrap(self, pdu: bytes | bytearray) -> bytes | None:
+        """Return the frame carried by ``pdu`` or ``None`` when it is rejected.
+
+        PDUs which do not answer our session (``id_r`` differs from our
+        ``id_s``) or hold no complete frame are dropped.
+        """
+        plain = self._cipher.decrypt(pdu)
+        end = plain.rfind(END, HEADER.size)
+        if len(plain) < HEADER.size or plain[5] != self.id_s or end < 0:
+            self.rejected += 1
+            return None
+        self.id_r = plain[4]
+        self.received += 1
+        return bytes(memoryview(plain)[HEADER.size : end + len(END)])
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return PDU counters."""
+        return {"sent": self.sent, "received": self.received, "rejected": self.rejected}
+
+
+class EncryptedSatel(FramedSatel):
+    """:class:`FramedSatel` speaking the integration key encrypted transport."""
+
+    def __init__(
+        self, host: str, port: int, loop: Any, integration_key: str, **kwargs: Any
+    ) -> None:
+        super().__init__(host, port, loop, **kwargs)
+        # Validate the key up front, the session is created on connect.
+        integration_key_to_aes_key(integration_key)
+        self._integration_key = integration_key
+        self._session: EncryptedSession | None = None
+
+    @property
+    def encryption_stats(self) -> dict[str, int]:
+        """Return PDU counters of the current connection."""
+        return self._session.stats if self._session else {}
+
+    async def connect(self) -> bool:
+        """Connect and start a session with a fresh key schedule and counter."""
+        self._session = EncryptedSession(self._integration_key)
+        return await super().connect()
+
+    async def _send_data(self, data: bytes) -> Any:
+        if self._session is None:
+            _LOGGER.warning("Ignoring data because we're disconnected!")
+            return None
+        return await super()._send_data(self._session.wrap(data))
+
+    async def _read_chunk(self) -> bytes:
+        """Return the frame carried by the next PDU addressed to this session."""
+        if self._session is None:
+            raise ConnectionError("No encrypted session")
+        while True:
+            length = (await self._reader.readexactly(1))[0]
+            frame = self._session.unwrap(await self._reader.readexactly(length))
+            if frame is not None:
+                return frame
+            _LOGGER.debug("Dropped encrypted PDU not addressed to this session")
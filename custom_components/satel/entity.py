@@ -2,21 +2,67 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import (
+    BaseCoordinatorEntity,
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
 
-from .const import DOMAIN
-from . import SatelHub
+from .const import CONF_ZONE_ENTITIES, DEFAULT_ZONE_ENTITIES, DOMAIN
+from . import SatelHub, signal_devices_updated
 
 
 class SatelEntity(CoordinatorEntity):
-    """Representation of a Satel entity using a coordinator."""
+    """Representation of a Satel entity using a coordinator.
+
+    Entities bound to a single zone, output or partition set
+    ``_dispatch_key`` and are then notified by the hub only when that id
+    changes, instead of on every coordinator update.
+    """
+
+    _dispatch_key: tuple[str, int] | None = None
+    # Set while discovery does not find the device of the entity.
+    _missing = False
 
     def __init__(self, hub: SatelHub, coordinator: DataUpdateCoordinator) -> None:
         super().__init__(coordinator)
         self._hub = hub
 
+    @property
+    def available(self) -> bool:
+        """Return whether the panel is reachable and reports the device."""
+        return not self._missing and super().available
+
+    @callback
+    def async_set_missing(self, missing: bool) -> None:
+        """Show the entity unavailable while its device is not discovered."""
+        if missing == self._missing:
+            return
+        self._missing = missing
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Register for state updates."""
+        if self._dispatch_key is None:
+            await super().async_added_to_hass()
+            return
+        # Skip the coordinator-wide listener added by BaseCoordinatorEntity.
+        await super(BaseCoordinatorEntity, self).async_added_to_hass()
+        kind, index = self._dispatch_key
+        self.async_on_remove(
+            self._hub.async_subscribe(kind, index, self._handle_coordinator_update)
+        )
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information for this entity."""
@@ -25,3 +71,62 @@ class SatelEntity(CoordinatorEntity):
             manufacturer="Satel",
             name="Satel Alarm",
         )
+
+
+@callback
+def async_track_devices(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    kind: str,
+    factory: Callable[[dict[str, Any]], list[SatelEntity]],
+) -> None:
+    """Add the entities of every ``kind`` device and follow discovery.
+
+    ``factory`` returns the entities of one device.  When background
+    discovery reports the devices of the panel, entities of new devices are
+    added.  Entities of devices it did not find are shown unavailable
+    rather than removed, keeping their registry entries: a device may only
+    be missing from one discovery.
+    """
+    entities: dict[str, list[SatelEntity]] = {}
+
+    @callback
+    def _async_sync(devices: dict[str, Any]) -> None:
+        fresh = {device["id"]: device for device in devices.get(kind) or []}
+        for device_id, group in entities.items():
+            for entity in group:
+                entity.async_set_missing(device_id not in fresh)
+        added = [
+            entity
+            for device_id, device in fresh.items()
+            if device_id not in entities
+            for entity in entities.setdefault(device_id, factory(device))
+        ]
+        if added:
+            async_add_entities(added)
+
+    _async_sync(entry.runtime_data.devices or {})
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, signal_devices_updated(entry.entry_id), _async_sync
+        )
+    )
+
+
+def zone_entity_layout(entry: ConfigEntry) -> str:
+    """Return whether zones get a binary sensor, a status sensor or both."""
+    return entry.options.get(
+        CONF_ZONE_ENTITIES, entry.data.get(CONF_ZONE_ENTITIES, DEFAULT_ZONE_ENTITIES)
+    )
+
+
+@callback
+def async_remove_entities(
+    hass: HomeAssistant, domain: str, unique_ids: Iterable[str]
+) -> None:
+    """Drop registry entries of entities the current options no longer create."""
+    registry = er.async_get(hass)
+    for unique_id in unique_ids:
+        if entity_id := registry.async_get_entity_id(domain, DOMAIN, unique_id):
+            registry.async_remove(entity_id)
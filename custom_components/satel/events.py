@@ -0,0 +1,52 @@
+"""Bus events fired as soon as the panel reports a zone or output change."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from .const import EVENT_OUTPUT_CHANGED, EVENT_ZONE_VIOLATED
+
+
+class ChangeEvents:
+    """Fire zone violation and output change events from the callbacks.
+
+    Every event gets its own data, as listeners may keep or modify it.
+    Nothing is fired until :meth:`attach` binds the event bus.
+    """
+
+    def __init__(self, host: str) -> None:
+        self._host = host
+        self._fire: Callable[[str, Mapping[str, Any]], None] | None = None
+        self.zone_events = 0
+        self.output_events = 0
+
+    def attach(self, fire: Callable[[str, Mapping[str, Any]], None]) -> None:
+        """Fire events through ``fire``, the bus' fire method."""
+        self._fire = fire
+
+    def zones_violated(self, changed: Iterable[int], values: Mapping[int, Any]) -> None:
+        """Fire an event for every zone of ``changed`` reported violated."""
+        if (fire := self._fire) is None:
+            return
+        host = self._host
+        for zone in changed:
+            if values[zone]:
+                fire(EVENT_ZONE_VIOLATED, {"host": host, "zone": zone})
+                self.zone_events += 1
+
+    def outputs_changed(self, changed: Iterable[int], values: Mapping[int, Any]) -> None:
+        """Fire an event for every output of ``changed`` with its new state."""
+        if (fire := self._fire) is None:
+            return
+        host = self._host
+        for output in changed:
+            fire(
+                EVENT_OUTPUT_CHANGED,
+                {"host": host, "output": output, "on": bool(values[output])},
+            )
+            self.output_events += 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"zone_violated": self.zone_events, "output_changed": self.output_events}
@@ -0,0 +1,117 @@
+"""Hand the connection opened by the config flow over to entry setup.
+
+ETHM-1 modules accept a single client and are slow to release a socket, so
+connecting again right after the config flow closed its connection often
+fails.  The flow parks its connected hub here together with the devices it
+discovered, and setting up the entry claims it instead of connecting.  A
+parked hub keeps its connection alive with version queries and is closed
+when nobody claims it within ``HANDOFF_TIMEOUT``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import SatelHub
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HANDOFF = f"{DOMAIN}_handoff"
+
+HANDOFF_TIMEOUT = 300
+KEEP_ALIVE_INTERVAL = 10
+
+
+@dataclass
+class _ParkedHub:
+    """A connected hub waiting for its config entry."""
+
+    hub: SatelHub
+    settings: dict[str, Any]
+    devices: dict[str, Any]
+    keep_alive: asyncio.Task
+    cancel_expiry: CALLBACK_TYPE
+
+
+@callback
+def async_park_hub(
+    hass: HomeAssistant,
+    hub: SatelHub,
+    settings: dict[str, Any],
+    devices: dict[str, Any],
+) -> None:
+    """Keep ``hub`` connected for the entry created with ``settings``.
+
+    ``settings`` are the arguments the hub was created with; only an entry
+    that would create an identical hub claims it.
+    """
+    host = settings["host"]
+    parked = hass.data.setdefault(DATA_HANDOFF, {})
+    if previous := parked.pop(host, None):
+        hass.async_create_task(_async_close(previous))
+
+    @callback
+    def _expire(_now: Any) -> None:
+        if parked.get(host) is entry:
+            del parked[host]
+            _LOGGER.debug("Closing unclaimed connection to %s", host)
+            hass.async_create_task(_async_close(entry))
+
+    entry = _ParkedHub(
+        hub,
+        settings,
+        devices,
+        hass.async_create_background_task(
+            hub.async_keep_alive(KEEP_ALIVE_INTERVAL), name="satel-handoff-keep-alive"
+        ),
+        async_call_later(
+            hass, HANDOFF_TIMEOUT, HassJob(_expire, cancel_on_shutdown=True)
+        ),
+    )
+    parked[host] = entry
+
+
+async def async_claim_hub(
+    hass: HomeAssistant, settings: dict[str, Any]
+) -> tuple[SatelHub, dict[str, Any]] | None:
+    """Return the parked hub created with ``settings`` and its devices.
+
+    Hubs parked with other settings, or whose connection dropped meanwhile,
+    are closed and ``None`` is returned.
+    """
+    entry = hass.data.get(DATA_HANDOFF, {}).pop(settings["host"], None)
+    if entry is None:
+        return None
+    await _async_stop(entry)
+    if entry.settings != settings or not entry.hub.connected:
+        await entry.hub.async_close()
+        return None
+    return entry.hub, entry.devices
+
+
+async def async_discard_hub(hass: HomeAssistant, host: str) -> None:
+    """Close the hub parked for ``host``, if any."""
+    if entry := hass.data.get(DATA_HANDOFF, {}).pop(host, None):
+        await _async_close(entry)
+
+
+async def _async_stop(entry: _ParkedHub) -> None:
+    entry.cancel_expiry()
+    entry.keep_alive.cancel()
+    with suppress(asyncio.CancelledError):
+        await entry.keep_alive
+
+
+async def _async_close(entry: _ParkedHub) -> None:
+    await _async_stop(entry)
+    await entry.hub.async_close()
@@ -0,0 +1,145 @@
+"""Pipelined reading of zone, output and partition names.
+
+Names are read with the ``0xEE`` command, one query per id.  Instead of
+waiting for every answer before sending the next query, the queries for a
+window of ``PIPELINE_DEPTH`` ids are written at once and the panel's
+answers, which come back in order, are matched to them.  Every id up to the
+limit of the panel model is read: unused expander addresses leave long runs
+of missing ids between used ones.  The panel reports a missing device with
+result ``0x08``; an id answered with any other result is queried again
+rather than taken as missing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from .codec import encode_frame
+
+CMD_READ_NAME = 0xEE
+CMD_RESULT = 0xEF
+
+NAME_PARTITION = 0x00
+NAME_ZONE = 0x01
+NAME_OUTPUT = 0x04
+
+NAME_LENGTH = 16
+PIPELINE_DEPTH = 8
+
+MAX_PARTITIONS = 32
+
+# Zones and outputs of each panel type reported by the version query.
+PANEL_LIMITS = {
+    0: 24,  # INTEGRA 24
+    1: 32,  # INTEGRA 32
+    2: 64,  # INTEGRA 64
+    3: 128,  # INTEGRA 128
+    4: 128,  # INTEGRA 128-WRL SIM300
+    66: 64,  # INTEGRA 64 PLUS
+    67: 128,  # INTEGRA 128 PLUS
+    72: 256,  # INTEGRA 256 PLUS
+    132: 128,  # INTEGRA 128-WRL LEON
+}
+DEFAULT_LIMIT = 256
+
+# Result of ``0xEF`` answering a name query for a device that does not exist.
+RESULT_NO_DEVICE = 0x08
+
+# Times an id answered with another result is queried again.
+MAX_RETRIES = 2
+
+# Answer of a query whose id is queried again.
+_RETRY = object()
+
+
+class NameReader:
+    """Read device names in windows of pipelined queries.
+
+    ``exchange(frames, answered)`` writes ``frames`` to the panel and returns
+    once ``answered`` is done, passing every ``0xEE`` and ``0xEF`` answer read
+    meanwhile to :meth:`handle`; no other command is answered in between.
+    """
+
+    def __init__(
+        self,
+        exchange: Callable[[bytes, asyncio.Future[Any]], Awaitable[object]],
+        encoding: str,
+        depth: int = PIPELINE_DEPTH,
+    ) -> None:
+        self._exchange = exchange
+        self._encoding = encoding
+        self._depth = depth
+        self._pending: deque[tuple[int, int, asyncio.Future]] = deque()
+        self.queries = 0
+
+    def handle(self, msg: bytes) -> None:
+        """Match an answer read from the panel to the query it answers."""
+        pending = self._pending
+        # Answers are only taken while queries of the reader are unanswered.
+        if not pending:
+            return
+        if msg[0] == CMD_RESULT:
+            _, _, future = pending.popleft()
+            if not future.done():
+                missing = msg[1:2] == bytes((RESULT_NO_DEVICE,))
+                future.set_result(None if missing else _RETRY)
+            return
+        if len(msg) < 4 + NAME_LENGTH:
+            return
+        key = (msg[1], msg[2])
+        for index, (kind, number, future) in enumerate(pending):
+            if (kind, number & 0xFF) == key:
+                del pending[index]
+                if not future.done():
+                    future.set_result((msg[3], bytes(msg[4 : 4 + NAME_LENGTH])))
+                return
+
+    async def _query(self, kind: int, numbers: Sequence[int]) -> list[Any]:
+        """Query the names of ``numbers`` in one exchange."""
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in numbers]
+        self._pending.extend(zip(itertools.repeat(kind), numbers, futures))
+        self.queries += len(numbers)
+        frames = b"".join(
+            encode_frame(CMD_READ_NAME, bytes((kind, number & 0xFF)))
+            for number in numbers
+        )
+        try:
+            return await self._exchange(frames, asyncio.gather(*futures))
+        finally:
+            self._pending.clear()
+
+    async def read(self, kind: int, limit: int) -> dict[int, str]:
+        """Return the names of the used devices of ``kind`` up to ``limit``."""
+        names: dict[int, str] = {}
+        queue = list(range(1, limit + 1))
+        retries: dict[int, int] = {}
+        while queue:
+            numbers, queue = queue[: self._depth], queue[self._depth :]
+            for number, answer in zip(numbers, await self._query(kind, numbers)):
+                if answer is _RETRY:
+                    retries[number] = retries.get(number, 0) + 1
+                    if retries[number] > MAX_RETRIES:
+                        raise ConnectionError(
+                            f"No name for device {number} of kind {kind:#04x}"
+                        )
+                    queue.append(number)
+                    continue
+                # Outputs report function 0 when they are not used.
+                if answer is None or (kind == NAME_OUTPUT and answer[0] == 0):
+                    continue
+                names[number] = answer[1].decode(self._encoding, "replace").strip()
+        return dict(sorted(names.items()))
+
+    async def read_all(self, panel_type: int | None = None) -> dict[int, dict[int, str]]:
+        """Read zone, output and partition names."""
+        limit = PANEL_LIMITS.get(panel_type, DEFAULT_LIMIT)
+        return {
+            NAME_ZONE: await self.read(NAME_ZONE, limit),
+            NAME_OUTPUT: await self.read(NAME_OUTPUT, limit),
+            NAME_PARTITION: await self.read(NAME_PARTITION, MAX_PARTITIONS),
+        }
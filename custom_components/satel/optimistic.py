@@ -0,0 +1,133 @@
+"""State shown before the panel confirms a command, rolled back on timeout."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Collection, Hashable, Iterable
+from typing import Any
+
+
+class _Pending:
+    __slots__ = ("accepted", "handle", "reported", "rollback", "started")
+
+    def __init__(
+        self,
+        accepted: Collection[Any],
+        reported: Any,
+        rollback: Callable[[Any], None],
+        started: float,
+        handle: asyncio.TimerHandle,
+    ) -> None:
+        self.accepted = accepted
+        self.reported = reported
+        self.rollback = rollback
+        self.started = started
+        self.handle = handle
+
+
+class PendingCommands:
+    """Track commands whose expected effect is shown before it is confirmed.
+
+    After a command is sent the hub shows its expected effect and calls
+    :meth:`expect`.  Values the panel reports for that id then go through
+    :meth:`reconcile`: an accepted value confirms the command, any other is
+    held back.  Without confirmation within ``timeout`` seconds the last
+    value held back, or the value from before the command, is restored; a
+    command the panel refuses is restored right away with :meth:`reject`.
+    """
+
+    def __init__(
+        self, timeout: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._timeout = timeout
+        self._clock = clock
+        self._pending: dict[Hashable, _Pending] = {}
+        self.confirmed = 0
+        self.rolled_back = 0
+        self._latency_total = 0.0
+        self.last_latency_ms: float | None = None
+        self.max_latency_ms = 0.0
+
+    def expect(
+        self,
+        key: Hashable,
+        accepted: Collection[Any],
+        previous: Any,
+        rollback: Callable[[Any], None],
+    ) -> None:
+        """Wait for a value in ``accepted`` for ``key``.
+
+        ``rollback`` is called with the value to restore on timeout.  A
+        command replacing a pending one keeps its value to restore.
+        """
+        if (replaced := self._pending.pop(key, None)) is not None:
+            replaced.handle.cancel()
+            previous = replaced.reported
+        self._pending[key] = _Pending(
+            accepted,
+            previous,
+            rollback,
+            self._clock(),
+            asyncio.get_running_loop().call_later(self._timeout, self._expire, key),
+        )
+
+    def reconcile(self, key: Hashable, value: Any) -> bool:
+        """Return whether a value reported for ``key`` may be applied."""
+        if (pending := self._pending.get(key)) is None:
+            return True
+        if value not in pending.accepted:
+            pending.reported = value
+            return False
+        del self._pending[key]
+        pending.handle.cancel()
+        latency = (self._clock() - pending.started) * 1000
+        self.confirmed += 1
+        self._latency_total += latency
+        self.last_latency_ms = round(latency, 3)
+        self.max_latency_ms = max(self.max_latency_ms, self.last_latency_ms)
+        return True
+
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._pending
+
+    def discard(self, key: Hashable) -> None:
+        """Stop waiting for ``key`` without rolling it back."""
+        if (pending := self._pending.pop(key, None)) is not None:
+            pending.handle.cancel()
+
+    def reject(self, keys: Iterable[Hashable]) -> None:
+        """Roll the commands pending for ``keys`` back now."""
+        for key in keys:
+            if (pending := self._pending.get(key)) is not None:
+                pending.handle.cancel()
+                self._expire(key)
+
+    def cancel(self) -> None:
+        """Drop every pending command without rolling it back."""
+        for pending in self._pending.values():
+            pending.handle.cancel()
+        self._pending.clear()
+
+    def _expire(self, key: Hashable) -> None:
+        pending = self._pending.pop(key)
+        self.rolled_back += 1
+        pending.rollback(pending.reported)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "confirmed": self.confirmed,
+            "rolled_back": self.rolled_back,
+            "last_latency_ms": self.last_latency_ms,
+            "avg_latency_ms": (
+                round(self._latency_total / self.confirmed, 3)
+                if self.confirmed
+                else None
+            ),
+            "max_latency_ms": self.max_latency_ms,
+        }
@@ -0,0 +1,276 @@
+"""Local ETHM-1 server sharing the hub's panel connection.
+
+The ETHM-1 module accepts a single TCP client, which is the hub.  The proxy
+listens on a local port and speaks the same plain framing to any number of
+clients: queries of the state groups the panel pushes are answered from the
+state the hub keeps up to date from those pushes while they flow, as long as
+the hub tracks every zone or output of the panel they report on.  Everything else is forwarded through
+the hub's connection and the panel's answer is sent back to the client that
+asked.  Clients cannot change what the hub monitors.
+
+Reading the change flags or a state group clears the panel's flags the hub
+polls.  While the hub polls them, clients get the flags the hub read since
+they last asked, and the answers to state reads forwarded to the panel are
+applied to the hub's state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from satel_integra.satel_integra import AlarmState
+
+from .codec import FrameDecoder, Frame, encode_frame
+from .const import DEFAULT_PROXY_HOST
+from .names import DEFAULT_LIMIT, PANEL_LIMITS
+from .scheduler import PRIORITY_ARM, PRIORITY_DISARM, PRIORITY_OUTPUT, PRIORITY_QUERY
+from .state import ATTR_OUTPUTS, PARTITION_QUERIES, QUERY_GROUPS, STATE_QUERIES
+
+if TYPE_CHECKING:
+    from . import SatelHub
+
+_LOGGER = logging.getLogger(__name__)
+
+CMD_VERSION = 0x7E
+CMD_MONITOR = 0x7F
+CMD_RESULT = 0xEF
+
+# State queries whose groups the library's monitoring command has the panel
+# push on every change: zone violations, outputs and every partition group
+# but ARMED_SUPPRESSED.  The others are only known when read.
+PUSHED_QUERIES = frozenset(
+    (0x00, 0x17, 0x0A, 0x2A, 0x0B, 0x0C, 0x0E, 0x0F, 0x10, 0x13, 0x14)
+)
+
+# Library partition state reported by each pushed partition state query.
+PARTITION_GROUPS = {
+    command: AlarmState[name]
+    for command, name in PARTITION_QUERIES.items()
+    if command in PUSHED_QUERIES
+}
+
+# State answers cover 128 ids, or 256 when the query carries one extra byte.
+_MASK_LENGTH = 16
+_LONG_MASK_LENGTH = 32
+_PARTITION_MASK_LENGTH = 4
+
+_READ_SIZE = 1024
+
+
+def _priority(command: int) -> int:
+    """Return the scheduler class a forwarded command is sent with."""
+    if command in (0x84, 0x85):
+        return PRIORITY_DISARM
+    if 0x80 <= command <= 0x83:
+        return PRIORITY_ARM
+    if 0x86 <= command <= 0x9F:
+        return PRIORITY_OUTPUT
+    return PRIORITY_QUERY
+
+
+class _ClientStats:
+    """Traffic counters of one downstream client."""
+
+    __slots__ = (
+        "bytes_in",
+        "bytes_out",
+        "cached",
+        "connected",
+        "failed",
+        "flags",
+        "forwarded",
+        "frames_in",
+        "frames_out",
+        "peer",
+    )
+
+    def __init__(self, peer: str) -> None:
+        self.peer = peer
+        self.connected = time.monotonic()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.frames_in = 0
+        self.frames_out = 0
+        self.cached = 0
+        self.forwarded = 0
+        self.failed = 0
+        # Change flags read by the hub since the client last asked for them.
+        self.flags = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        elapsed = max(time.monotonic() - self.connected, 1e-3)
+        return {
+            "peer": self.peer,
+            "connected_s": round(elapsed, 3),
+            "frames_in": self.frames_in,
+            "frames_out": self.frames_out,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "bytes_in_per_s": round(self.bytes_in / elapsed, 1),
+            "bytes_out_per_s": round(self.bytes_out / elapsed, 1),
+            "cached": self.cached,
+            "forwarded": self.forwarded,
+            "failed": self.failed,
+        }
+
+
+class SatelProxy:
+    """Serve ETHM-1 clients through the hub's single panel connection."""
+
+    def __init__(
+        self, hub: SatelHub, port: int, host: str = DEFAULT_PROXY_HOST
+    ) -> None:
+        self._hub = hub
+        self._host = host
+        self._port = port
+        self._server: asyncio.Server | None = None
+        self._clients: dict[asyncio.Task, _ClientStats] = {}
+        self._unsub_flags: Callable[[], None] | None = None
+        # Length of the change flags answer, known once the hub polled them.
+        self._flags_length: int | None = None
+        self.served = 0
+
+    @property
+    def port(self) -> int | None:
+        """Return the port the proxy listens on."""
+        if self._server is None or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+
+    async def async_start(self) -> None:
+        """Start listening for clients."""
+        self._server = await asyncio.start_server(
+            self._async_serve, self._host, self._port
+        )
+        self._unsub_flags = self._hub.async_listen_change_flags(self._flags_polled)
+        _LOGGER.debug("ETHM-1 proxy listening on %s:%s", self._host, self.port)
+
+    async def async_stop(self) -> None:
+        """Stop listening and disconnect every client."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        if self._unsub_flags is not None:
+            self._unsub_flags()
+            self._unsub_flags = None
+        tasks = list(self._clients)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return per client throughput and answer counters."""
+        return {
+            "port": self.port,
+            "served": self.served,
+            "clients": [stats.as_dict() for stats in self._clients.values()],
+        }
+
+    async def _async_serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        peer = writer.get_extra_info("peername")
+        stats = _ClientStats(f"{peer[0]}:{peer[1]}" if peer else "unknown")
+        task = asyncio.current_task()
+        self._clients[task] = stats
+        self.served += 1
+        decoder = FrameDecoder()
+        try:
+            while data := await reader.read(_READ_SIZE):
+                stats.bytes_in += len(data)
+                for frame in decoder.feed(data):
+                    stats.frames_in += 1
+                    answer = await self._async_answer(frame, stats)
+                    if answer is None:
+                        continue
+                    writer.write(answer)
+                    stats.bytes_out += len(answer)
+                    stats.frames_out += 1
+                    await writer.drain()
+        except (ConnectionError, OSError) as err:
+            _LOGGER.debug("ETHM-1 proxy client %s dropped: %s", stats.peer, err)
+        finally:
+            del self._clients[task]
+            writer.close()
+
+    async def _async_answer(self, frame: Frame, stats: _ClientStats) -> bytes | None:
+        if (cached := self._cached_answer(frame)) is not None:
+            stats.cached += 1
+            return encode_frame(frame.command, cached)
+        if frame.command == CMD_MONITOR and frame.data:
+            # Monitoring is the hub's; acknowledge without touching it.
+            stats.cached += 1
+            return encode_frame(CMD_RESULT, b"\xff")
+        polling = self._hub.polling_changes
+        if frame.command == CMD_MONITOR and polling and self._flags_length:
+            # Reading the flags upstream would hide changes from the hub.
+            stats.cached += 1
+            flags, stats.flags = stats.flags, 0
+            return encode_frame(
+                CMD_MONITOR, flags.to_bytes(self._flags_length, "little")
+            )
+        try:
+            answer = await self._hub.async_request(
+                frame.command,
+                frame.data,
+                (frame.command, CMD_RESULT),
+                priority=_priority(frame.command),
+            )
+        except ConnectionError as err:
+            # Like a busy module: the client times out and retries.
+            _LOGGER.debug("Could not forward %#04x: %s", frame.command, err)
+            stats.failed += 1
+            return None
+        stats.forwarded += 1
+        if polling and frame.command in QUERY_GROUPS:
+            self._hub.apply_state_answer(answer)
+        return encode_frame(answer[0], answer[1:])
+
+    def _flags_polled(self, flags: bytes) -> None:
+        self._flags_length = len(flags)
+        if mask := int.from_bytes(flags, "little"):
+            for stats in self._clients.values():
+                stats.flags |= mask
+
+    def _cached_answer(self, frame: Frame) -> bytes | None:
+        """Return the data answering ``frame`` from the hub's state, if known."""
+        hub = self._hub
+        command = frame.command
+        if command == CMD_VERSION:
+            return bytes.fromhex(hub.fingerprint) if hub.fingerprint else None
+        # Without push updates the state may be stale; ask the panel instead.
+        if not hub.push_healthy or command not in PUSHED_QUERIES:
+            return None
+        if (attr := STATE_QUERIES.get(command)) is not None:
+            length = _LONG_MASK_LENGTH if frame.data else _MASK_LENGTH
+            if not self._tracks_panel(attr, length):
+                return None
+            return hub.state.mask(attr, length)
+        # The library keeps the partition lists of the whole panel.
+        if (group := PARTITION_GROUPS.get(command)) is not None:
+            mask = 0
+            for part in hub.partition_states.get(group, ()):
+                mask |= 1 << (part - 1)
+            return mask.to_bytes(_PARTITION_MASK_LENGTH, "little")
+        return None
+
+    def _tracks_panel(self, attr: str, length: int) -> bool:
+        """Return whether the hub tracks every id a ``length`` byte answer reports.
+
+        The hub only keeps the state of the selected zones and outputs;
+        answering from it would report the others as clear.
+        """
+        hub = self._hub
+        if not hub.fingerprint:
+            return False
+        limit = PANEL_LIMITS.get(int(hub.fingerprint[:2], 16), DEFAULT_LIMIT)
+        ids = hub.monitored_outputs if attr == ATTR_OUTPUTS else hub.monitored_zones
+        return set(range(1, min(limit, length * 8) + 1)).issubset(ids)
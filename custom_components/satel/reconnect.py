@@ -0,0 +1,65 @@
+"""Reconnection delays with exponential backoff and jitter."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Callable
+
+INITIAL_DELAY = 1.0
+BACKOFF_FACTOR = 2.0
+JITTER = 0.25
+
+
+class ReconnectBackoff:
+    """Hand out the delays between reconnection attempts.
+
+    Delays grow by ``factor`` from ``initial`` up to ``maximum`` seconds and
+    up to ``jitter`` of each delay is taken off at random, so a panel that
+    restarts is not hit by every client at the same moment.  After
+    :meth:`reset`, which the hub calls when a healthy session closed, the
+    first attempt is made right away.
+    """
+
+    def __init__(
+        self,
+        maximum: float,
+        initial: float = INITIAL_DELAY,
+        factor: float = BACKOFF_FACTOR,
+        jitter: float = JITTER,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        self._maximum = max(maximum, 0)
+        self._initial = min(initial, self._maximum)
+        self._factor = factor
+        self._jitter = jitter
+        self._rand = rand
+        self._failures = 0
+        self.attempts = 0
+        self.last_delay = 0.0
+
+    def reset(self) -> None:
+        """Make the next attempt immediately."""
+        self._failures = 0
+
+    def next_delay(self) -> float:
+        """Return how long to wait before the next attempt."""
+        failures = self._failures
+        self._failures += 1
+        self.attempts += 1
+        if failures == 0:
+            delay = 0.0
+        else:
+            growth = self._factor ** min(failures - 1, 32)
+            delay = min(self._initial * growth, self._maximum)
+            delay *= 1 - self._jitter * self._rand()
+        self.last_delay = delay
+        return delay
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "attempts": self.attempts,
+            "failures": self._failures,
+            "last_delay": round(self.last_delay, 3),
+            "max_delay": self._maximum,
+        }
@@ -0,0 +1,190 @@
+"""Prioritised queue for commands sent to the panel."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import suppress
+from typing import Any
+
+PRIORITY_DISARM = 0
+PRIORITY_ARM = 1
+PRIORITY_OUTPUT = 2
+PRIORITY_QUERY = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_DISARM: "disarm",
+    PRIORITY_ARM: "arm",
+    PRIORITY_OUTPUT: "output",
+    PRIORITY_QUERY: "query",
+}
+
+
+class _Command:
+    """A queued command and everyone waiting for its result."""
+
+    __slots__ = ("deadline", "futures", "key", "priority", "send", "submitted")
+
+    def __init__(
+        self,
+        priority: int,
+        send: Callable[[], Awaitable[Any]],
+        key: Hashable | None,
+        submitted: float,
+        deadline: float,
+    ) -> None:
+        self.priority = priority
+        self.send = send
+        self.key = key
+        self.submitted = submitted
+        self.deadline = deadline
+        self.futures: list[asyncio.Future] = []
+
+
+class CommandScheduler:
+    """Send commands one at a time, most urgent first.
+
+    Disarming and clearing alarms go before arming, which goes before
+    outputs, and configuration queries come last.  A command queued with
+    the ``key`` of a command still waiting replaces it: only the latest
+    ``set_output`` for an output is sent and every caller gets its result.
+    Commands that cannot complete within their timeout, counted from
+    submission, fail with ``ConnectionError``.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self._timeout = timeout
+        self._queue: list[tuple[int, int, _Command]] = []
+        self._pending: dict[Hashable, _Command] = {}
+        self._sequence = itertools.count()
+        self._runner: asyncio.Task | None = None
+        self.submitted = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.max_depth = 0
+        # Per priority: commands completed, total and worst latency.
+        self._latency: dict[int, list[float]] = {
+            priority: [0, 0.0, 0.0] for priority in PRIORITY_NAMES
+        }
+
+    @property
+    def depth(self) -> int:
+        """Return the number of commands waiting to be sent."""
+        return len(self._queue)
+
+    async def submit(
+        self,
+        priority: int,
+        send: Callable[[], Awaitable[Any]],
+        *,
+        key: Hashable | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Queue ``send`` and return its result once it ran."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        deadline = now + (self._timeout if timeout is None else timeout)
+        future: asyncio.Future = loop.create_future()
+        self.submitted += 1
+
+        command = self._pending.get(key) if key is not None else None
+        if command is not None and command.priority == priority:
+            command.send = send
+            command.deadline = deadline
+            self.coalesced += 1
+        else:
+            command = _Command(priority, send, key, now, deadline)
+            if key is not None:
+                self._pending[key] = command
+            heapq.heappush(self._queue, (priority, next(self._sequence), command))
+            self.max_depth = max(self.max_depth, len(self._queue))
+        command.futures.append(future)
+
+        if self._runner is None or self._runner.done():
+            self._runner = loop.create_task(self._run(), name="satel-commands")
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._queue:
+            _, _, command = heapq.heappop(self._queue)
+            if command.key is not None and self._pending.get(command.key) is command:
+                del self._pending[command.key]
+            result: Any = None
+            error: BaseException | None = None
+            if loop.time() >= command.deadline:
+                self.timeouts += 1
+                error = ConnectionError("Command expired in the queue")
+            else:
+                try:
+                    async with asyncio.timeout_at(command.deadline):
+                        result = await command.send()
+                    self.sent += 1
+                except TimeoutError:
+                    self.timeouts += 1
+                    error = ConnectionError("Command timed out")
+                except asyncio.CancelledError:
+                    self._fail(command, ConnectionError("Command scheduler closed"))
+                    raise
+                except Exception as err:  # pylint: disable=broad-except
+                    self.failures += 1
+                    error = err
+            latency = self._latency[command.priority]
+            elapsed = loop.time() - command.submitted
+            latency[0] += 1
+            latency[1] += elapsed
+            latency[2] = max(latency[2], elapsed)
+            for future in command.futures:
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+
+    @staticmethod
+    def _fail(command: _Command, error: BaseException) -> None:
+        for future in command.futures:
+            if not future.done():
+                future.set_exception(error)
+
+    async def async_close(self) -> None:
+        """Stop sending and fail every queued command."""
+        if self._runner is not None and not self._runner.done():
+            self._runner.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._runner
+        self._runner = None
+        error = ConnectionError("Command scheduler closed")
+        while self._queue:
+            self._fail(heapq.heappop(self._queue)[2], error)
+        self._pending.clear()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth, counters and latency per command class."""
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "latency_ms": {
+                name: _latency_stats(*self._latency[priority])
+                for priority, name in PRIORITY_NAMES.items()
+            },
+        }
+
+
+def _latency_stats(count: float, total: float, worst: float) -> dict[str, Any]:
+    return {
+        "count": int(count),
+        "avg": round(total / count * 1000, 3) if count else None,
+        "max": round(worst * 1000, 3),
+    }
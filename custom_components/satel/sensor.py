@@ -9,7 +9,14 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from . import SatelHub, SatelRuntimeData
-from .entity import SatelEntity
+from .const import ZONE_ENTITIES_BINARY
+from .dispatch import DISPATCH_ZONE
+from .entity import (
+    SatelEntity,
+    async_remove_entities,
+    async_track_devices,
+    zone_entity_layout,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,17 +30,26 @@ async def async_setup_entry(
     devices = data.devices or {}
     coordinator = data.coordinator
 
-    entities: list[SensorEntity] = []
-    zones = devices.get("zones") or []
-    if zones:
-        entities.extend(
-            SatelZoneSensor(hub, coordinator, zone["id"], zone.get("name", zone["id"]))
-            for zone in zones
-        )
-    else:
-        entities.append(SatelStatusSensor(hub, coordinator))
+    if not devices.get("zones"):
+        async_add_entities([SatelStatusSensor(hub, coordinator)])
 
-    async_add_entities(entities)
+    if zone_entity_layout(entry) == ZONE_ENTITIES_BINARY:
+        async_remove_entities(
+            hass,
+            "sensor",
+            (f"satel_zone_status_{zone['id']}" for zone in devices.get("zones") or []),
+        )
+        return
+
+    async_track_devices(
+        hass,
+        entry,
+        async_add_entities,
+        "zones",
+        lambda zone: [
+            SatelZoneSensor(hub, coordinator, zone["id"], zone.get("name", zone["id"]))
+        ],
+    )
 
 
 class SatelZoneSensor(SatelEntity, SensorEntity):
@@ -46,28 +62,15 @@ class SatelZoneSensor(SatelEntity, SensorEntity):
     ) -> None:
         super().__init__(hub, coordinator)
         self._zone_id = zone_id
+        self._zone = int(zone_id)
+        self._record = hub.zone_record(self._zone)
+        self._dispatch_key = (DISPATCH_ZONE, self._zone)
         self._attr_unique_id = f"satel_zone_status_{zone_id}"
         self._attr_translation_placeholders = {"zone": name}
 
     @property
     def native_value(self) -> str | None:
-        data = self.coordinator.data
-        for key in ["tamper", "troubles", "bypass", "alarm_memory"]:
-            value = data.get(key, {}).get(self._zone_id)
-            if isinstance(value, str) and value.upper() == "ON":
-                return "trouble" if key == "troubles" else key
-        zone_state = data.get("zones", {}).get(self._zone_id)
-        return zone_state.lower() if isinstance(zone_state, str) else zone_state
-
-    @property
-    def extra_state_attributes(self) -> dict[str, str | None]:
-        data = self.coordinator.data
-        return {
-            "troubles": data.get("troubles", {}).get(self._zone_id),
-            "tamper": data.get("tamper", {}).get(self._zone_id),
-            "bypass": data.get("bypass", {}).get(self._zone_id),
-            "alarm_memory": data.get("alarm_memory", {}).get(self._zone_id),
-        }
+        return self._record.status
 
 
 class SatelStatusSensor(SatelEntity, SensorEntity):
@@ -81,8 +84,5 @@ class SatelStatusSensor(SatelEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        alarm = self.coordinator.data.get("alarm")
-        if isinstance(alarm, dict):
-            return next(iter(alarm.values()), None)
-        return alarm
+        return next(iter(self.coordinator.data.alarm.values()), None)
 
@@ -0,0 +1,145 @@
+"""Services of the Satel integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ARM_MODES,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_MODE,
+    ATTR_PARTITIONS,
+    ATTR_TURN_OFF,
+    ATTR_TURN_ON,
+    DOMAIN,
+    SERVICE_ARM_PARTITIONS,
+    SERVICE_DISARM_PARTITIONS,
+    SERVICE_SET_OUTPUTS,
+)
+
+if TYPE_CHECKING:
+    from . import SatelHub
+
+_PARTITIONS = vol.All(
+    cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1, max=32))]
+)
+
+DISARM_PARTITIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_PARTITIONS): _PARTITIONS,
+    }
+)
+ARM_PARTITIONS_SCHEMA = DISARM_PARTITIONS_SCHEMA.extend(
+    {vol.Optional(ATTR_MODE, default="away"): vol.In(ARM_MODES)}
+)
+
+_OUTPUTS = vol.All(
+    cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1, max=256))]
+)
+
+SET_OUTPUTS_SCHEMA = vol.All(
+    cv.has_at_least_one_key(ATTR_TURN_ON, ATTR_TURN_OFF),
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+            vol.Optional(ATTR_TURN_ON, default=list): _OUTPUTS,
+            vol.Optional(ATTR_TURN_OFF, default=list): _OUTPUTS,
+        }
+    ),
+)
+
+
+def _hub(hass: HomeAssistant, call: ServiceCall) -> SatelHub:
+    """Return the hub of the entry targeted by ``call``."""
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    entries = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+        and (entry_id is None or entry.entry_id == entry_id)
+    ]
+    if len(entries) != 1:
+        raise ServiceValidationError(
+            "Specify the config_entry_id of a loaded Satel panel"
+        )
+    return entries[0].runtime_data.hub
+
+
+def _response(results: dict[int, dict[str, Any]]) -> ServiceResponse:
+    return {
+        ATTR_PARTITIONS: {
+            str(part): {
+                "state": result["state"].lower() if result["state"] else None,
+                "confirmed": result["confirmed"],
+            }
+            for part, result in results.items()
+        }
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def _arm_partitions(call: ServiceCall) -> ServiceResponse:
+        try:
+            results = await _hub(hass, call).arm_partitions(
+                call.data[ATTR_PARTITIONS], ARM_MODES[call.data[ATTR_MODE]]
+            )
+        except ConnectionError as err:
+            raise HomeAssistantError(f"Failed to arm partitions: {err}") from err
+        return _response(results)
+
+    async def _disarm_partitions(call: ServiceCall) -> ServiceResponse:
+        try:
+            results = await _hub(hass, call).disarm_partitions(
+                call.data[ATTR_PARTITIONS]
+            )
+        except ConnectionError as err:
+            raise HomeAssistantError(f"Failed to disarm partitions: {err}") from err
+        return _response(results)
+
+    async def _set_outputs(call: ServiceCall) -> None:
+        turn_on = set(call.data[ATTR_TURN_ON])
+        turn_off = set(call.data[ATTR_TURN_OFF])
+        if turn_on & turn_off:
+            raise ServiceValidationError(
+                "Outputs cannot be turned on and off in the same call"
+            )
+        outputs = dict.fromkeys(turn_on, True) | dict.fromkeys(turn_off, False)
+        try:
+            await _hub(hass, call).set_outputs(outputs)
+        except ConnectionError as err:
+            raise HomeAssistantError(f"Failed to set outputs: {err}") from err
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ARM_PARTITIONS,
+        _arm_partitions,
+        schema=ARM_PARTITIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DISARM_PARTITIONS,
+        _disarm_partitions,
+        schema=DISARM_PARTITIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_OUTPUTS, _set_outputs, schema=SET_OUTPUTS_SCHEMA
+    )
@@ -0,0 +1,472 @@
+"""Compact state store for Satel zones, outputs and partitions.
+
+The panel reports zone and output states as bitmasks, so the store keeps one
+bit array per attribute indexed by the 1-based Satel id instead of
+dictionaries of ``"ON"``/``"OFF"`` strings.  Entities read the bits through
+the small API shared by :class:`SatelState` and the read-only
+:class:`SatelSnapshot` handed to the coordinator.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
+from typing import Any
+
+from .codec import ids_to_mask, iter_ids
+
+ATTR_VIOLATION = "violation"
+ATTR_TAMPER = "tamper"
+ATTR_TROUBLES = "troubles"
+ATTR_BYPASS = "bypass"
+ATTR_ALARM_MEMORY = "alarm_memory"
+ATTR_OUTPUTS = "outputs"
+
+ZONE_ATTRIBUTES = (
+    ATTR_VIOLATION,
+    ATTR_TAMPER,
+    ATTR_TROUBLES,
+    ATTR_BYPASS,
+    ATTR_ALARM_MEMORY,
+)
+
+# Mapping of the keys used by ``satel_integra`` status callbacks to the
+# attribute they update.
+ZONE_STATUS_KEYS = {
+    "zones": ATTR_VIOLATION,
+    "tamper": ATTR_TAMPER,
+    "troubles": ATTR_TROUBLES,
+    "bypass": ATTR_BYPASS,
+    "alarm_memory": ATTR_ALARM_MEMORY,
+}
+
+# Field of :class:`ZoneRecord` holding each zone attribute.
+ZONE_RECORD_FIELDS = {
+    ATTR_VIOLATION: "violation",
+    ATTR_TAMPER: "tamper",
+    ATTR_TROUBLES: "trouble",
+    ATTR_BYPASS: "bypass",
+    ATTR_ALARM_MEMORY: "alarm_memory",
+}
+
+# Zone and output state queries and the attribute their answer reports.
+STATE_QUERIES = {
+    0x00: ATTR_VIOLATION,
+    0x01: ATTR_TAMPER,
+    0x04: ATTR_ALARM_MEMORY,
+    0x06: ATTR_BYPASS,
+    0x07: ATTR_TROUBLES,
+    0x17: ATTR_OUTPUTS,
+}
+
+# Partition state queries and the name of the library's ``AlarmState`` they
+# report.
+PARTITION_QUERIES = {
+    0x09: "ARMED_SUPPRESSED",
+    0x0A: "ARMED_MODE0",
+    0x2A: "ARMED_MODE1",
+    0x0B: "ARMED_MODE2",
+    0x0C: "ARMED_MODE3",
+    0x0E: "ENTRY_TIME",
+    0x0F: "EXIT_COUNTDOWN_OVER_10",
+    0x10: "EXIT_COUNTDOWN_UNDER_10",
+    0x13: "TRIGGERED",
+    0x14: "TRIGGERED_FIRE",
+}
+
+# State group the traffic of each query is counted under.
+QUERY_GROUPS = {**STATE_QUERIES, **dict.fromkeys(PARTITION_QUERIES, "partitions")}
+
+# Partition state derived from the library's alarm states, by precedence;
+# partitions in none of them are disarmed.
+PARTITION_PRECEDENCE = (
+    ("TRIGGERED", ("TRIGGERED", "TRIGGERED_FIRE")),
+    ("PENDING", ("ENTRY_TIME", "EXIT_COUNTDOWN_OVER_10", "EXIT_COUNTDOWN_UNDER_10")),
+    ("ARMED_HOME", ("ARMED_MODE1",)),
+    ("ARMED_NIGHT", ("ARMED_MODE2",)),
+    ("ARMED_AWAY", ("ARMED_MODE0",)),
+)
+
+MAX_ZONES = 256
+MAX_OUTPUTS = 256
+
+# Pseudo attribute used to track changes of the partition states.
+_ATTR_ALARM = "alarm"
+
+
+class _Bits:
+    """Read API shared by mutable and frozen bit arrays.
+
+    A second array tracks which bits have been reported by the panel so that
+    readers can tell "off" apart from "unknown".
+    """
+
+    __slots__ = ("_known", "_values", "size")
+
+    _values: bytes | bytearray
+    _known: bytes | bytearray
+    size: int
+
+    def get(self, index: int) -> bool | None:
+        """Return the bit for ``index`` or ``None`` when it was never set."""
+        pos = index - 1
+        if pos < 0 or pos >= self.size:
+            return None
+        byte = pos >> 3
+        mask = 1 << (pos & 7)
+        if self._known[byte] & mask:
+            return self._values[byte] & mask != 0
+        return None
+
+    def iter_set(self) -> Iterable[int]:
+        """Yield the ids of all bits currently set."""
+        for byte, value in enumerate(self._values):
+            while value:
+                low = value & -value
+                yield (byte << 3) + low.bit_length()
+                value ^= low
+
+    def to_bytes(self, length: int) -> bytes:
+        """Return the first ``length`` bytes in the panel's bitmask layout."""
+        return bytes(self._values[:length]).ljust(length, b"\0")
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of payload bytes held by the array."""
+        return len(self._values) + len(self._known)
+
+
+class FrozenBits(_Bits):
+    """Immutable bit array shared between snapshots."""
+
+    __slots__ = ()
+
+    def __init__(self, size: int, values: bytes, known: bytes) -> None:
+        self.size = size
+        self._values = values
+        self._known = known
+
+
+class BitArray(_Bits):
+    """Fixed size bit array indexed by 1-based Satel ids."""
+
+    __slots__ = ()
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._values = bytearray((size + 7) >> 3)
+        self._known = bytearray((size + 7) >> 3)
+
+    def set(self, index: int, value: bool) -> bool:
+        """Store ``value`` for ``index`` and return whether it changed."""
+        pos = index - 1
+        if not 0 <= pos < self.size:
+            return False
+        byte, mask = pos >> 3, 1 << (pos & 7)
+        old = self._values[byte]
+        new = old | mask if value else old & ~mask
+        if self._known[byte] & mask and old == new:
+            return False
+        self._values[byte] = new
+        self._known[byte] |= mask
+        return True
+
+    def update(self, values: Mapping[int, Any]) -> list[int]:
+        """Store a batch of ``{id: value}`` items and return the changed ids."""
+        size = self.size
+        data = self._values
+        known = self._known
+        changed: list[int] = []
+        for index, value in values.items():
+            pos = int(index) - 1
+            if pos < 0 or pos >= size:
+                continue
+            byte = pos >> 3
+            mask = 1 << (pos & 7)
+            old = data[byte]
+            new = old | mask if value else old & ~mask
+            if old != new or not known[byte] & mask:
+                data[byte] = new
+                known[byte] |= mask
+                changed.append(pos + 1)
+        return changed
+
+    def copy(self) -> BitArray:
+        """Return an independent copy of the array."""
+        other = BitArray.__new__(BitArray)
+        other.size = self.size
+        other._values = self._values[:]
+        other._known = self._known[:]
+        return other
+
+    def freeze(self) -> FrozenBits:
+        """Return an immutable copy of the array."""
+        return FrozenBits(self.size, bytes(self._values), bytes(self._known))
+
+
+class ZoneRecord:
+    """Flags of one zone and the status derived from them.
+
+    Records are kept up to date by :class:`SatelState` as changes are
+    ingested, so entities read plain attributes on every state write.
+    """
+
+    __slots__ = ("alarm_memory", "bypass", "status", "tamper", "trouble", "violation")
+
+    def __init__(self) -> None:
+        self.violation: bool | None = None
+        self.tamper: bool | None = None
+        self.trouble: bool | None = None
+        self.bypass: bool | None = None
+        self.alarm_memory: bool | None = None
+        self.status: str | None = None
+
+    def set(self, field: str, value: bool | None) -> None:
+        """Store one flag and derive the status again."""
+        setattr(self, field, value)
+        # Tamper, trouble, bypass and alarm memory take precedence over the
+        # violation state, in that order.
+        if self.tamper:
+            self.status = "tamper"
+        elif self.trouble:
+            self.status = "trouble"
+        elif self.bypass:
+            self.status = "bypass"
+        elif self.alarm_memory:
+            self.status = "alarm_memory"
+        elif self.violation is None:
+            self.status = None
+        else:
+            self.status = "on" if self.violation else "off"
+
+
+class PartitionMasks:
+    """Partitions in each of the library's alarm states, kept as bitmasks.
+
+    :meth:`update` takes the partition lists reported per alarm state and
+    derives the state of the partitions whose bits changed, plus those of
+    ``wanted`` not derived yet.
+    """
+
+    __slots__ = ("_derived", "_lists", "_masks")
+
+    def __init__(self) -> None:
+        self._masks: dict[str, int] = {}
+        # The library replaces the list of a state on every frame, so lists
+        # seen before are unchanged.
+        self._lists: dict[str, Any] = {}
+        self._derived = 0
+
+    def update(
+        self, states: Mapping[Any, Iterable[int]], wanted: int = 0
+    ) -> list[tuple[int, str]]:
+        """Apply ``states`` and return the derived state of affected partitions.
+
+        ``states`` maps alarm states, or their names, to partition ids.  With
+        ``wanted`` set only the partitions of that mask are derived.
+        """
+        masks = self._masks
+        lists = self._lists
+        changed = 0
+        for group, ids in states.items():
+            name = getattr(group, "name", group)
+            if lists.get(name) is ids:
+                continue
+            lists[name] = ids
+            mask = ids_to_mask(ids)
+            if mask != masks.get(name, 0):
+                changed |= mask ^ masks.get(name, 0)
+                masks[name] = mask
+        if wanted:
+            changed = (changed | (wanted & ~self._derived)) & wanted
+        if not changed:
+            return []
+        self._derived |= changed
+        precedence = []
+        for derived, names in PARTITION_PRECEDENCE:
+            mask = 0
+            for name in names:
+                mask |= masks.get(name, 0)
+            precedence.append((derived, mask))
+        result = []
+        for partition_id in iter_ids(changed):
+            bit = 1 << (partition_id - 1)
+            for derived, mask in precedence:
+                if mask & bit:
+                    break
+            else:
+                derived = "DISARMED"
+            result.append((partition_id, derived))
+        return result
+
+
+class _StateView:
+    """Read API shared by the live state and its snapshots."""
+
+    __slots__ = ()
+
+    _bits: Mapping[str, _Bits]
+    _alarm: Mapping[int, str]
+
+    @property
+    def alarm(self) -> Mapping[int, str]:
+        """Return the derived alarm state of every known partition."""
+        return self._alarm
+
+    def zone(self, attr: str, zone_id: int) -> bool | None:
+        """Return ``attr`` of the given zone."""
+        return self._bits[attr].get(zone_id)
+
+    def zone_violated(self, zone_id: int) -> bool | None:
+        """Return whether the zone is violated."""
+        return self._bits[ATTR_VIOLATION].get(zone_id)
+
+    def output(self, output_id: int) -> bool | None:
+        """Return whether the output is on."""
+        return self._bits[ATTR_OUTPUTS].get(output_id)
+
+    def partition(self, partition_id: int) -> str | None:
+        """Return the derived alarm state of a partition."""
+        return self._alarm.get(partition_id)
+
+    def mask(self, attr: str, length: int) -> bytes:
+        """Return ``attr`` of every zone or output as a panel bitmask."""
+        return self._bits[attr].to_bytes(length)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of payload bytes held by the bit arrays."""
+        return sum(bits.nbytes for bits in self._bits.values())
+
+
+class SatelSnapshot(_StateView):
+    """Read-only view of :class:`SatelState` at a given version.
+
+    Snapshots share the frozen arrays of attributes that did not change
+    since the previous snapshot, so publishing one only copies what changed.
+    """
+
+    __slots__ = ("_alarm", "_bits", "version")
+
+    def __init__(
+        self,
+        version: int,
+        bits: Mapping[str, FrozenBits],
+        alarm: Mapping[int, str],
+    ) -> None:
+        self.version = version
+        self._bits = bits
+        self._alarm = alarm
+
+
+class SatelState(_StateView):
+    """Current state of the panel as reported by the monitor."""
+
+    __slots__ = ("_alarm", "_bits", "_dirty", "_records", "_snapshot", "version")
+
+    def __init__(self, zones: int = MAX_ZONES, outputs: int = MAX_OUTPUTS) -> None:
+        self._bits: dict[str, BitArray] = {
+            attr: BitArray(zones) for attr in ZONE_ATTRIBUTES
+        }
+        self._bits[ATTR_OUTPUTS] = BitArray(outputs)
+        self._alarm: dict[int, str] = {}
+        self._dirty: set[str] = set()
+        self._records: dict[int, ZoneRecord] = {}
+        self._snapshot: SatelSnapshot | None = None
+        self.version = 0
+
+    def _touch(self, attr: str) -> None:
+        self.version += 1
+        self._dirty.add(attr)
+
+    def zone_record(self, zone_id: int) -> ZoneRecord:
+        """Return the live record of a zone, kept current from now on."""
+        if (record := self._records.get(zone_id)) is None:
+            record = self._records[zone_id] = ZoneRecord()
+            for attr, field in ZONE_RECORD_FIELDS.items():
+                record.set(field, self._bits[attr].get(zone_id))
+        return record
+
+    def _update_records(self, attr: str, changed: Iterable[int]) -> None:
+        records = self._records
+        if not records:
+            return
+        bits = self._bits[attr]
+        field = ZONE_RECORD_FIELDS[attr]
+        for zone_id in changed:
+            if (record := records.get(zone_id)) is not None:
+                record.set(field, bits.get(zone_id))
+
+    def set_zone(self, attr: str, zone_id: int, value: bool) -> bool:
+        """Update ``attr`` of a zone and return whether it changed."""
+        if self._bits[attr].set(zone_id, value):
+            self._touch(attr)
+            self._update_records(attr, (zone_id,))
+            return True
+        return False
+
+    def update_zones(self, attr: str, values: Mapping[int, Any]) -> list[int]:
+        """Update ``attr`` for a batch of zones and return the changed ids."""
+        if changed := self._bits[attr].update(values):
+            self._touch(attr)
+            self._update_records(attr, changed)
+        return changed
+
+    def update_outputs(self, values: Mapping[int, Any]) -> list[int]:
+        """Update a batch of outputs and return the changed ids."""
+        if changed := self._bits[ATTR_OUTPUTS].update(values):
+            self._touch(ATTR_OUTPUTS)
+        return changed
+
+    def set_output(self, output_id: int, value: bool) -> bool:
+        """Update an output and return whether it changed."""
+        if self._bits[ATTR_OUTPUTS].set(output_id, value):
+            self._touch(ATTR_OUTPUTS)
+            return True
+        return False
+
+    def set_partition(self, partition_id: int, state: str) -> bool:
+        """Update a partition state and return whether it changed."""
+        if self._alarm.get(partition_id) == state:
+            return False
+        self._alarm[partition_id] = state
+        self._touch(_ATTR_ALARM)
+        return True
+
+    def snapshot(self) -> SatelSnapshot:
+        """Return a read-only snapshot of the current state.
+
+        The previous snapshot is returned as is when nothing changed, and
+        only the attributes modified since then are frozen again.
+        """
+        previous = self._snapshot
+        if previous is not None and previous.version == self.version:
+            return previous
+        if previous is None:
+            bits = {attr: array.freeze() for attr, array in self._bits.items()}
+            alarm: Mapping[int, str] = MappingProxyType(dict(self._alarm))
+        else:
+            bits = dict(previous._bits)
+            for attr in self._dirty:
+                if attr in bits:
+                    bits[attr] = self._bits[attr].freeze()
+            alarm = (
+                MappingProxyType(dict(self._alarm))
+                if _ATTR_ALARM in self._dirty
+                else previous._alarm
+            )
+        self._dirty.clear()
+        self._snapshot = SatelSnapshot(self.version, MappingProxyType(bits), alarm)
+        return self._snapshot
+
+    def copy(self) -> SatelState:
+        """Return an independent copy of the state."""
+        other = SatelState.__new__(SatelState)
+        other._bits = {attr: bits.copy() for attr, bits in self._bits.items()}
+        other._alarm = self._alarm.copy()
+        other._dirty = set()
+        # Records follow the store they were taken from.
+        other._records = {}
+        other._snapshot = None
+        other.version = self.version
+        return other
@@ -9,7 +9,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from . import SatelHub, SatelRuntimeData
-from .entity import SatelEntity
+from .dispatch import DISPATCH_OUTPUT
+from .entity import SatelEntity, async_track_devices
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,15 +21,19 @@ async def async_setup_entry(
     """Set up Satel switches based on a config entry."""
     data: SatelRuntimeData = entry.runtime_data
     hub: SatelHub = data.hub
-    devices = data.devices or {}
     coordinator = data.coordinator
 
-    entities: list[SwitchEntity] = [
-        SatelOutputSwitch(hub, coordinator, output["id"], output.get("name", output["id"]))
-        for output in devices.get("outputs", [])
-    ]
-
-    async_add_entities(entities)
+    async_track_devices(
+        hass,
+        entry,
+        async_add_entities,
+        "outputs",
+        lambda output: [
+            SatelOutputSwitch(
+                hub, coordinator, output["id"], output.get("name", output["id"])
+            )
+        ],
+    )
 
 
 class SatelOutputSwitch(SatelEntity, SwitchEntity):
@@ -39,15 +44,14 @@ class SatelOutputSwitch(SatelEntity, SwitchEntity):
     def __init__(self, hub: SatelHub, coordinator, output_id: str, name: str) -> None:
         super().__init__(hub, coordinator)
         self._output_id = output_id
+        self._output = int(output_id)
+        self._dispatch_key = (DISPATCH_OUTPUT, self._output)
         self._attr_name = name
         self._attr_unique_id = f"satel_output_{output_id}"
 
     @property
     def is_on(self) -> bool:
-        state = self.coordinator.data.get("outputs", {}).get(self._output_id)
-        if state is None:
-            return False
-        return state.upper() == "ON"
+        return bool(self.coordinator.data.output(self._output))
 
     async def async_turn_on(self, **kwargs) -> None:  # noqa: D401
         """Turn the output on."""
@@ -55,8 +59,6 @@ class SatelOutputSwitch(SatelEntity, SwitchEntity):
             await self._hub.set_output(self._output_id, True)
         except ConnectionError as err:
             _LOGGER.warning("Failed to turn on output %s: %s", self._output_id, err)
-            return
-        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs) -> None:  # noqa: D401
         """Turn the output off."""
@@ -64,6 +66,4 @@ class SatelOutputSwitch(SatelEntity, SwitchEntity):
             await self._hub.set_output(self._output_id, False)
         except ConnectionError as err:
             _LOGGER.warning("Failed to turn off output %s: %s", self._output_id, err)
-            return
-        await self.coordinator.async_request_refresh()
 
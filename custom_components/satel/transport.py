@@ -0,0 +1,67 @@
+"""Protocol library connection reading its frames with the integration codec.
+
+The library reads every frame with ``readuntil`` and checks it with a pure
+Python checksum, dropping the connection on the first damaged frame.  The
+connection here reads whatever the socket delivers and splits it with
+:class:`~.codec.FrameDecoder`; frames completed by the same read are kept
+for the following reads and damaged frames are counted and skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from typing import Any
+
+from satel_integra.satel_integra import AsyncSatel
+
+from .codec import Frame, FrameDecoder
+
+_LOGGER = logging.getLogger(__name__)
+
+READ_SIZE = 4096
+
+
+class FramedSatel(AsyncSatel):
+    """:class:`AsyncSatel` decoding received frames with :class:`FrameDecoder`."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._decoder = FrameDecoder()
+        self._frames: deque[Frame] = deque()
+
+    @property
+    def frame_stats(self) -> dict[str, int]:
+        """Return decoder counters of the current connection."""
+        return self._decoder.stats
+
+    async def connect(self) -> bool:
+        """Connect with an empty receive buffer."""
+        self._decoder = FrameDecoder()
+        self._frames.clear()
+        return await super().connect()
+
+    async def _read_chunk(self) -> bytes:
+        """Return the next received bytes, empty once the panel disconnects."""
+        return await self._reader.read(READ_SIZE)
+
+    async def _read_data(self) -> Any:
+        if not self._reader:
+            return []
+        try:
+            while not self._frames:
+                if not (chunk := await self._read_chunk()):
+                    raise ConnectionError("Connection closed by the panel")
+                self._frames.extend(self._decoder.feed(chunk))
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                "Got exception: %s. Most likely the other side has disconnected!", err
+            )
+            self._writer = None
+            self._reader = None
+            if self._alarm_status_callback:
+                self._alarm_status_callback()
+            return None
+        frame = self._frames.popleft()
+        # The library expects the command byte followed by the data.
+        return bytes((frame.command,)) + frame.data
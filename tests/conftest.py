@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from pathlib import Path
 
@@ -7,3 +8,81 @@ pytest_plugins = ("pytest_homeassistant_custom_component",)
 
 # Ensure custom_components is on the path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.satel.codec import FrameDecoder  # noqa: E402
+from custom_components.satel.state import PARTITION_QUERIES, STATE_QUERIES  # noqa: E402
+
+
+class FakePanel:
+    """Answer frames written to it the way an INTEGRA panel does.
+
+    Each frame is answered a millisecond after it was sent, through the
+    handler installed for the answer's command.  ``reported`` holds the ids
+    each state query reports, ``flags`` the commands flagged as changed
+    until the flags are read, ``names`` the names of each kind by id and
+    ``results`` the ``0xEF`` result of other commands (``0x08`` by default).
+    """
+
+    def __init__(self):
+        self.connected = True
+        self.panel_type = 72
+        self.partition_states = {}
+        self.reported: dict[int, set[int]] = {}
+        self.flags: set[int] = set()
+        self.names: dict[int, dict[int, str]] = {}
+        self.results: dict[int, int] = {}
+        self.received = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._message_handlers = {}
+        self._decoder = FrameDecoder()
+
+    @property
+    def commands(self):
+        return [frame.command for frame in self.received]
+
+    def _reply(self, command, data):
+        self._message_handlers[bytes((command,))](bytes((command,)) + data)
+
+    def _answer(self, frame):
+        self.in_flight -= 1
+        self.received.append(frame)
+        command = frame.command
+        if command == 0x7E:
+            self._reply(0x7E, bytes((self.panel_type,)) + b"1.23")
+        elif command == 0x7F and frame.data:
+            self._reply(0xEF, b"\xff")
+        elif command == 0x7F:
+            mask = sum(1 << flagged for flagged in self.flags)
+            self.flags = set()
+            self._reply(0x7F, mask.to_bytes(6, "little"))
+        elif command in STATE_QUERIES or command in PARTITION_QUERIES:
+            length = 4 if command in PARTITION_QUERIES else 32 if frame.data else 16
+            mask = sum(1 << (i - 1) for i in self.reported.get(command, ()))
+            self._reply(command, mask.to_bytes(length, "little"))
+        elif command == 0xEE:
+            kind, number = frame.data[0], frame.data[1]
+            name = self.names.get(kind, {}).get(number or 256)
+            if name is None:
+                self._reply(0xEF, b"\x08")
+            else:
+                self._reply(
+                    0xEE, bytes((kind, number, 1)) + name.encode().ljust(16, b" ")
+                )
+        else:
+            self._reply(0xEF, bytes((self.results.get(command, 0x08),)))
+
+    def close(self):
+        self.connected = False
+
+    async def _send_data(self, data):
+        for frame in self._decoder.feed(data):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            asyncio.get_running_loop().call_later(0.001, self._answer, frame)
+
+
+@pytest.fixture
+def panel():
+    """Return a simulated panel to set as a hub's connection."""
+    return FakePanel()
@@ -1,5 +1,5 @@
 import logging
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from homeassistant.const import (
@@ -13,8 +13,15 @@ from homeassistant.const import (
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.satel import SatelHub
-from custom_components.satel.alarm_control_panel import SatelAlarmPanel
+from custom_components.satel import SatelHub, SatelRuntimeData
+from custom_components.satel.alarm_control_panel import SatelAlarmPanel, async_setup_entry
+from custom_components.satel.state import SatelState
+
+
+def _alarm(state: str) -> SatelState:
+    data = SatelState()
+    data.set_partition(1, state)
+    return data
 
 
 @pytest.mark.asyncio
@@ -31,7 +38,7 @@ async def test_alarm_panel_states_and_commands(hass):
         update_method=AsyncMock(return_value={}),
         config_entry=MockConfigEntry(domain="satel"),
     )
-    coordinator.data = {"alarm": {"1": "DISARMED"}}
+    coordinator.data = _alarm("DISARMED")
     panel = SatelAlarmPanel(hub, coordinator, "1")
 
     await panel.async_alarm_arm_away()
@@ -43,15 +50,33 @@ async def test_alarm_panel_states_and_commands(hass):
     await panel.async_alarm_disarm()
     hub.disarm_partition.assert_awaited_with("1")
 
-    coordinator.data = {"alarm": {"1": "ARMED_HOME"}}
+    coordinator.data = _alarm("ARMED_HOME")
     assert panel.state == STATE_ALARM_ARMED_HOME
-    coordinator.data = {"alarm": {"1": "ARMED_NIGHT"}}
+    coordinator.data = _alarm("ARMED_NIGHT")
     assert panel.state == STATE_ALARM_ARMED_NIGHT
-    coordinator.data = {"alarm": {"1": "ARMED_AWAY"}}
+    coordinator.data = _alarm("ARMED_AWAY")
     assert panel.state == STATE_ALARM_ARMED_AWAY
-    coordinator.data = {"alarm": {"1": "PENDING"}}
+    coordinator.data = _alarm("PENDING")
     assert panel.state == STATE_ALARM_PENDING
-    coordinator.data = {"alarm": {"1": "TRIGGERED"}}
+    coordinator.data = _alarm("TRIGGERED")
     assert panel.state == STATE_ALARM_TRIGGERED
-    coordinator.data = {"alarm": {"1": "DISARMED"}}
+    coordinator.data = _alarm("DISARMED")
     assert panel.state == STATE_ALARM_DISARMED
+
+
+@pytest.mark.asyncio
+async def test_panels_only_for_discovered_partitions(hass):
+    entry = MockConfigEntry(
+        domain="satel", data={"partitions": [str(i) for i in range(1, 33)]}
+    )
+    entry.runtime_data = SatelRuntimeData(
+        SatelHub("host", 1234, "code"),
+        {"partitions": [{"id": "1", "name": "House"}, {"id": "2", "name": "Garage"}]},
+        None,
+    )
+    add_entities = Mock()
+
+    await async_setup_entry(hass, entry, add_entities)
+
+    panels = add_entities.call_args.args[0]
+    assert [panel.unique_id for panel in panels] == ["satel_alarm_1", "satel_alarm_2"]
@@ -0,0 +1,147 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from homeassistant.const import CONF_HOST, CONF_PORT
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.satel.cache import (
+    DeviceCache,
+    changed_devices,
+    selected_devices,
+)
+from custom_components.satel.const import DEFAULT_HOST, DEFAULT_PORT, DOMAIN
+from custom_components.satel.state import SatelState
+
+DEVICES = {
+    "zones": [{"id": "1", "name": "Hall"}, {"id": "2", "name": "Garage"}],
+    "outputs": [{"id": "3", "name": "Siren"}],
+    "partitions": [{"id": "1", "name": "Partition 1"}],
+}
+
+
+@pytest.mark.asyncio
+async def test_cache_is_stored_per_host(hass):
+    cache = DeviceCache(hass, "10.0.0.1")
+    assert await cache.async_load_last() is None
+
+    await cache.async_save("abc", DEVICES)
+
+    assert await DeviceCache(hass, "10.0.0.1").async_load_last() == ("abc", DEVICES)
+    assert await DeviceCache(hass, "10.0.0.2").async_load_last() is None
+
+    await cache.async_remove()
+    assert await cache.async_load_last() is None
+
+
+def test_changed_devices_lists_added_renamed_and_removed_ids():
+    fresh = {
+        "zones": [{"id": "1", "name": "Hall"}, {"id": "10", "name": "Attic"}],
+        "outputs": [{"id": "3", "name": "Gate"}],
+        "partitions": [{"id": "1", "name": "Partition 1"}],
+    }
+
+    assert changed_devices(DEVICES, DEVICES) == {}
+    assert changed_devices(DEVICES, fresh) == {"zones": ["2", "10"], "outputs": ["3"]}
+
+
+def test_selected_devices_keeps_the_config_flow_choice():
+    selection = {"zones": ["2"], "outputs": []}
+
+    assert selected_devices(DEVICES, selection) == {
+        "zones": [{"id": "2", "name": "Garage"}],
+        "outputs": [],
+        "partitions": [{"id": "1", "name": "Partition 1"}],
+    }
+    assert selected_devices(DEVICES, {}) == DEVICES
+
+
+@pytest.mark.asyncio
+async def test_setup_uses_cache_and_revalidates_in_background(
+    hass, enable_custom_integrations
+):
+    await DeviceCache(hass, DEFAULT_HOST).async_save("abc", DEVICES)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_HOST: DEFAULT_HOST, CONF_PORT: DEFAULT_PORT}
+    )
+    entry.add_to_hass(hass)
+    renamed = {**DEVICES, "outputs": [{"id": "3", "name": "Gate"}]}
+    discover = AsyncMock(return_value=renamed)
+
+    with patch("custom_components.satel.SatelHub.connect", AsyncMock()), \
+        patch(
+            "custom_components.satel.SatelHub.start_monitoring",
+            AsyncMock(return_value=Mock()),
+        ), \
+        patch(
+            "custom_components.satel.SatelHub.async_fingerprint",
+            AsyncMock(return_value="abc"),
+        ), \
+        patch("custom_components.satel.SatelHub.use_devices") as use_devices, \
+        patch("custom_components.satel.SatelHub.discover_devices", discover), \
+        patch(
+            "custom_components.satel.SatelHub.get_overview",
+            AsyncMock(return_value=SatelState()),
+        ), \
+        patch.object(hass.config_entries, "async_schedule_reload") as reload:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        assert entry.runtime_data.devices == DEVICES
+        use_devices.assert_called_once_with(DEVICES)
+        await hass.async_block_till_done()
+
+    discover.assert_awaited_once()
+    reload.assert_called_once_with(entry.entry_id)
+    assert await DeviceCache(hass, DEFAULT_HOST).async_load_last() == ("abc", renamed)
+
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_setup_monitors_only_selected_devices(hass, enable_custom_integrations):
+    await DeviceCache(hass, DEFAULT_HOST).async_save("abc", DEVICES)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_HOST: DEFAULT_HOST,
+            CONF_PORT: DEFAULT_PORT,
+            "zones": ["2"],
+            "outputs": [],
+            "partitions": ["1"],
+        },
+    )
+    entry.add_to_hass(hass)
+    added = {**DEVICES, "zones": [*DEVICES["zones"], {"id": "10", "name": "Attic"}]}
+    selected = {
+        "zones": [{"id": "2", "name": "Garage"}],
+        "outputs": [],
+        "partitions": [{"id": "1", "name": "Partition 1"}],
+    }
+
+    with patch("custom_components.satel.SatelHub.connect", AsyncMock()), \
+        patch(
+            "custom_components.satel.SatelHub.start_monitoring",
+            AsyncMock(return_value=Mock()),
+        ), \
+        patch(
+            "custom_components.satel.SatelHub.async_fingerprint",
+            AsyncMock(return_value="abc"),
+        ), \
+        patch("custom_components.satel.SatelHub.use_devices") as use_devices, \
+        patch(
+            "custom_components.satel.SatelHub.discover_devices",
+            AsyncMock(return_value=added),
+        ), \
+        patch(
+            "custom_components.satel.SatelHub.get_overview",
+            AsyncMock(return_value=SatelState()),
+        ), \
+        patch.object(hass.config_entries, "async_schedule_reload") as reload:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert entry.runtime_data.devices == selected
+        use_devices.assert_called_once_with(selected)
+        # A zone added on the panel is cached but not selected.
+        reload.assert_not_called()
+        assert await DeviceCache(hass, DEFAULT_HOST).async_load_last() == ("abc", added)
+
+        await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,56 @@
+import pytest
+from satel_integra.satel_integra import AlarmState
+
+from custom_components.satel import SatelHub
+from custom_components.satel.changes import ChangePoller
+from custom_components.satel.state import ATTR_TAMPER
+
+
+def test_poller_speeds_up_when_flags_are_set():
+    now = [0.0]
+    poller = ChangePoller(fast=0.5, slow=4, cooldown=2, clock=lambda: now[0])
+    assert poller.interval == 0.5
+
+    intervals = []
+    for _ in range(6):
+        poller.record_poll(False)
+        intervals.append(poller.interval)
+    assert intervals == [0.5, 0.5, 1, 2, 4, 4]
+
+    poller.record_poll(True)
+    assert poller.interval == 0.5
+
+    poller.account("tamper", b"", bytes(17))
+    now[0] = 2
+    assert poller.stats["hot_polls"] == 1
+    assert poller.stats["groups"]["tamper"] == {
+        "commands": 1,
+        "bytes": 30,
+        "commands_per_s": 0.5,
+        "bytes_per_s": 15,
+    }
+
+
+@pytest.mark.asyncio
+async def test_poll_queries_only_flagged_groups(panel):
+    hub = SatelHub("host", 1234, "code", timeout=1)
+    hub._satel = panel
+    hub.set_monitored_zones([1, 2, 3])
+    panel.flags = {0x01, 0x0A}
+    panel.reported = {0x01: {2}, 0x0A: {1}}
+
+    assert await hub.async_poll_changes() == [0x01, 0x0A]
+
+    assert panel.commands == [0x7F, 0x01, 0x0A]
+    assert hub.state.zone(ATTR_TAMPER, 2) is True
+    assert hub.state.zone(ATTR_TAMPER, 1) is False
+    assert panel.partition_states == {AlarmState.ARMED_MODE0: [1]}
+    groups = hub.metrics["changes"]["groups"]
+    assert set(groups) == {"change_flags", "tamper", "partitions"}
+    assert groups["tamper"]["commands"] == 1
+
+    # Nothing flagged: only the flags are read.
+    assert await hub.async_poll_changes() == []
+    assert panel.commands == [0x7F, 0x01, 0x0A, 0x7F]
+    assert hub.metrics["changes"]["polls"] == 2
+    await hub.async_close()
@@ -0,0 +1,59 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.satel.coalesce import UpdateCoalescer
+
+
+@pytest.mark.asyncio
+async def test_requests_in_same_tick_are_merged():
+    flush = MagicMock()
+    coalescer = UpdateCoalescer(flush)
+
+    for _ in range(5):
+        coalescer.schedule()
+    assert coalescer.pending
+    flush.assert_not_called()
+
+    await asyncio.sleep(0)
+
+    flush.assert_called_once()
+    assert coalescer.stats == {
+        "window_ms": 0,
+        "requests": 5,
+        "flushes": 1,
+        "merged": 4,
+    }
+
+
+@pytest.mark.asyncio
+async def test_window_merges_requests_across_ticks():
+    flush = MagicMock()
+    coalescer = UpdateCoalescer(flush, 0.01)
+
+    coalescer.schedule()
+    await asyncio.sleep(0)
+    coalescer.schedule()
+    flush.assert_not_called()
+
+    await asyncio.sleep(0.02)
+
+    flush.assert_called_once()
+    assert coalescer.merged == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_and_cancel():
+    flush = MagicMock()
+    coalescer = UpdateCoalescer(flush, 10)
+
+    coalescer.schedule()
+    coalescer.flush()
+    flush.assert_called_once()
+    assert not coalescer.pending
+
+    coalescer.schedule()
+    coalescer.cancel()
+    await asyncio.sleep(0)
+    flush.assert_called_once()
@@ -0,0 +1,105 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from custom_components.satel.codec import (
+    Frame,
+    FrameDecoder,
+    checksum,
+    encode_frame,
+    ids_to_mask,
+    iter_ids,
+    mask_to_bytes,
+)
+from satel_integra.satel_integra import checksum as lib_checksum
+from custom_components.satel.transport import FramedSatel
+from satel_integra.satel_integra import generate_query, verify_and_strip
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [b"\x00", b"\x7f\x01\xdc\x99\x80\x00\x04\x00\x00\x00", bytes(range(254))],
+)
+def test_checksum_and_encoding_match_library(payload):
+    assert checksum(payload) == lib_checksum(payload)
+    assert encode_frame(payload[0], payload[1:]) == bytes(generate_query(payload))
+
+
+def test_encoding_stuffs_sync_bytes():
+    # satel_integra's generate_query drops the result of the replace call and
+    # never stuffs FE bytes, the panel expects them sent as FE F0.
+    frame = encode_frame(0x17, b"\xfe\x01")
+
+    assert frame.startswith(b"\xfe\xfe\x17\xfe\xf0\x01")
+    assert frame[2:-2].count(b"\xfe") == frame[2:-2].count(b"\xfe\xf0")
+    assert FrameDecoder().feed(frame) == [Frame(0x17, b"\xfe\x01")]
+
+
+def test_decoder_handles_split_and_stuffed_frames():
+    zones = mask_to_bytes(ids_to_mask([1, 8, 9, 255]), 32)
+    stream = (
+        b"\x00\x11garbage"
+        + encode_frame(0x00, zones)
+        + encode_frame(0x17, b"\xfe" + bytes(31))
+        + encode_frame(0xEF, b"\x00")
+    )
+    decoder = FrameDecoder()
+
+    frames = []
+    for index in range(len(stream)):
+        frames.extend(decoder.feed(stream[index : index + 1]))
+
+    assert [frame.command for frame in frames] == [0x00, 0x17, 0xEF]
+    assert list(iter_ids(frames[0].mask)) == [1, 8, 9, 255]
+    assert frames[0].data == verify_and_strip(encode_frame(0x00, zones))[1:]
+    assert list(iter_ids(frames[1].mask)) == [2, 3, 4, 5, 6, 7, 8]
+    assert frames[2] == Frame(0xEF, b"\x00")
+    assert decoder.buffered == 0
+    assert decoder.stats == {"frames": 3, "crc_errors": 0, "discarded_bytes": 9}
+
+
+def test_decoder_drops_frames_with_bad_checksum():
+    good = encode_frame(0x0A, b"\x01\x00\x00\x00")
+    bad = bytearray(good)
+    bad[3] ^= 0x01
+    decoder = FrameDecoder()
+
+    frames = decoder.feed(bytes(bad) + good)
+
+    assert frames == [Frame(0x0A, b"\x01\x00\x00\x00")]
+    assert decoder.crc_errors == 1
+
+
+def test_decoder_discards_oversized_garbage():
+    decoder = FrameDecoder()
+
+    assert decoder.feed(b"\xfe\xfe" + b"\x01" * 300) == []
+    assert decoder.buffered == 0
+    assert decoder.feed(encode_frame(0x17, bytes(16))) == [Frame(0x17, bytes(16))]
+
+
+@pytest.mark.asyncio
+async def test_framed_satel_reads_frames_through_the_decoder():
+    satel = FramedSatel("host", 1234, asyncio.get_running_loop())
+    reader = asyncio.StreamReader()
+    writer = Mock(drain=AsyncMock())
+    with patch("asyncio.open_connection", AsyncMock(return_value=(reader, writer))):
+        assert await satel.connect()
+    damaged = bytearray(encode_frame(0x00, b"\x01"))
+    damaged[-3] ^= 1
+
+    reader.feed_data(
+        encode_frame(0x0A, b"\x05\x00")
+        + bytes(damaged)
+        + encode_frame(0x17, b"\xfe")[:5]
+    )
+    assert await satel._read_data() == b"\x0a\x05\x00"
+    reader.feed_data(encode_frame(0x17, b"\xfe")[5:])
+    assert await satel._read_data() == b"\x17\xfe"
+    assert satel.frame_stats["crc_errors"] == 1
+
+    satel._alarm_status_callback = callback = Mock()
+    reader.feed_eof()
+    assert await satel._read_data() is None
+    callback.assert_called_once()
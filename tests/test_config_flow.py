@@ -11,8 +11,16 @@ from custom_components.satel.const import (
     CONF_TIMEOUT,
     CONF_RECONNECT_DELAY,
     CONF_ENCRYPTION_METHOD,
+    CONF_ENCRYPTION_KEY,
+    CONF_COALESCE_WINDOW,
+    CONF_PROXY_HOST,
+    CONF_PROXY_PORT,
+    CONF_ZONE_ENTITIES,
     DEFAULT_ENCRYPTION_METHOD,
+    ENCRYPTION_METHOD_INTEGRATION_KEY,
+    ZONE_ENTITIES_BINARY,
 )
+from custom_components.satel.state import SatelState
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 pytestmark = [pytest.mark.asyncio, pytest.mark.usefixtures("enable_custom_integrations")]
@@ -30,6 +38,7 @@ async def test_config_flow_full(hass):
         hub.connect = AsyncMock()
         hub.discover_devices = AsyncMock(return_value=devices)
         hub.async_close = AsyncMock()
+        hub.async_keep_alive = AsyncMock()
 
         result = await hass.config_entries.flow.async_init(
             DOMAIN, context={"source": "user"}
@@ -81,6 +90,7 @@ async def test_select_step_uses_selectors(hass):
         hub.connect = AsyncMock()
         hub.discover_devices = AsyncMock(return_value=devices)
         hub.async_close = AsyncMock()
+        hub.async_keep_alive = AsyncMock()
 
         result = await hass.config_entries.flow.async_init(
             DOMAIN, context={"source": "user"}
@@ -109,6 +119,7 @@ async def test_config_flow_cannot_connect(hass):
         hub.connect = AsyncMock(side_effect=ConnectionError)
         hub.discover_devices = AsyncMock()
         hub.async_close = AsyncMock()
+        hub.async_keep_alive = AsyncMock()
 
         result = await hass.config_entries.flow.async_init(
             DOMAIN, context={"source": "user"}
@@ -170,6 +181,11 @@ async def test_options_flow(hass):
             CONF_TIMEOUT: 6,
             CONF_RECONNECT_DELAY: 7,
             CONF_ENCRYPTION_METHOD: DEFAULT_ENCRYPTION_METHOD,
+            CONF_COALESCE_WINDOW: 5,
+            CONF_PROXY_PORT: 7095,
+        CONF_PROXY_HOST: "0.0.0.0",
+            CONF_PROXY_HOST: "0.0.0.0",
+            CONF_ZONE_ENTITIES: ZONE_ENTITIES_BINARY,
         },
     )
 
@@ -179,9 +195,40 @@ async def test_options_flow(hass):
         CONF_TIMEOUT: 6,
         CONF_RECONNECT_DELAY: 7,
         CONF_ENCRYPTION_METHOD: DEFAULT_ENCRYPTION_METHOD,
+        CONF_COALESCE_WINDOW: 5,
+        CONF_PROXY_PORT: 7095,
+        CONF_PROXY_HOST: "0.0.0.0",
+        CONF_ZONE_ENTITIES: ZONE_ENTITIES_BINARY,
     }
 
 
+@pytest.mark.asyncio
+async def test_options_flow_rejects_invalid_encryption_key(hass):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "1.2.3.4", CONF_PORT: 1234, CONF_CODE: "abcd"},
+    )
+    entry.add_to_hass(hass)
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+
+    for key in ({}, {CONF_ENCRYPTION_KEY: "much too long key"}):
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            {CONF_ENCRYPTION_METHOD: ENCRYPTION_METHOD_INTEGRATION_KEY, **key},
+        )
+        assert result["type"] == data_entry_flow.FlowResultType.FORM
+        assert result["errors"] == {CONF_ENCRYPTION_KEY: "invalid_encryption_key"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_ENCRYPTION_METHOD: ENCRYPTION_METHOD_INTEGRATION_KEY,
+            CONF_ENCRYPTION_KEY: "secret",
+        },
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+
+
 async def test_config_flow_runtime_data(hass):
     """Ensure runtime_data is populated after setup."""
     devices = {
@@ -194,6 +241,7 @@ async def test_config_flow_runtime_data(hass):
         hub.connect = AsyncMock()
         hub.discover_devices = AsyncMock(return_value=devices)
         hub.async_close = AsyncMock()
+        hub.async_keep_alive = AsyncMock()
 
         result = await hass.config_entries.flow.async_init(
             DOMAIN, context={"source": "user"}
@@ -222,17 +270,7 @@ async def test_config_flow_runtime_data(hass):
         ), \
         patch(
             "custom_components.satel.SatelHub.get_overview",
-            AsyncMock(
-                return_value={
-                    "alarm": {},
-                    "zones": {},
-                    "outputs": {},
-                    "troubles": {},
-                    "tamper": {},
-                    "bypass": {},
-                    "alarm_memory": {},
-                }
-            ),
+            AsyncMock(return_value=SatelState()),
         ), \
         patch.object(hass.config_entries, "async_forward_entry_setups", AsyncMock()):
         assert await async_setup_entry(hass, entry)
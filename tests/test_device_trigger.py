@@ -0,0 +1,82 @@
+import pytest
+from homeassistant.components.device_automation import DeviceAutomationType
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.helpers import device_registry as dr
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_get_device_automations,
+    async_mock_service,
+)
+
+from custom_components.satel import SatelHub, SatelRuntimeData
+from custom_components.satel.const import (
+    DOMAIN,
+    EVENT_OUTPUT_CHANGED,
+    EVENT_ZONE_VIOLATED,
+)
+
+
+def _panel(hass) -> str:
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    entry.mock_state(hass, ConfigEntryState.LOADED)
+    entry.runtime_data = SatelRuntimeData(
+        hub=SatelHub("panel", 7094),
+        devices={"zones": [{"id": "3", "name": "Door"}], "outputs": [{"id": "5"}]},
+        coordinator=None,
+    )
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, "panel")}
+    )
+    return device.id
+
+
+@pytest.mark.asyncio
+async def test_triggers_for_selected_zones_and_outputs(hass, enable_custom_integrations):
+    device_id = _panel(hass)
+
+    triggers = await async_get_device_automations(
+        hass, DeviceAutomationType.TRIGGER, device_id
+    )
+
+    assert sorted(
+        (trigger["type"], trigger["subtype"])
+        for trigger in triggers
+        if trigger["domain"] == DOMAIN
+    ) == [
+        ("output_turned_off", "5"),
+        ("output_turned_on", "5"),
+        ("zone_violated", "3"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_triggers_follow_panel_events(hass, enable_custom_integrations):
+    device_id = _panel(hass)
+    calls = async_mock_service(hass, "test", "automation")
+    trigger = {"platform": "device", "domain": DOMAIN, "device_id": device_id}
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": [
+                {
+                    "trigger": {**trigger, "type": "zone_violated", "subtype": "3"},
+                    "action": {"service": "test.automation", "data": {"id": "zone"}},
+                },
+                {
+                    "trigger": {**trigger, "type": "output_turned_on", "subtype": "5"},
+                    "action": {"service": "test.automation", "data": {"id": "on"}},
+                },
+            ]
+        },
+    )
+
+    hass.bus.async_fire(EVENT_ZONE_VIOLATED, {"host": "other", "zone": 3})
+    hass.bus.async_fire(EVENT_ZONE_VIOLATED, {"host": "panel", "zone": 3})
+    hass.bus.async_fire(EVENT_OUTPUT_CHANGED, {"host": "panel", "output": 5, "on": False})
+    hass.bus.async_fire(EVENT_OUTPUT_CHANGED, {"host": "panel", "output": 5, "on": True})
+    await hass.async_block_till_done()
+
+    assert [call.data["id"] for call in calls] == ["zone", "on"]
@@ -0,0 +1,20 @@
+import pytest
+from homeassistant.const import CONF_HOST
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.satel import SatelHub, SatelRuntimeData
+from custom_components.satel.const import CONF_CODE, DOMAIN
+from custom_components.satel.diagnostics import async_get_config_entry_diagnostics
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_redacts_code_and_reports_metrics(hass):
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_HOST: "host", CONF_CODE: "1234"})
+    entry.add_to_hass(hass)
+    entry.runtime_data = SatelRuntimeData(SatelHub("host", 1234, "1234"), {}, None)
+
+    diag = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diag["entry"]["data"][CONF_CODE] == "**REDACTED**"
+    assert diag["entry"]["data"][CONF_HOST] == "host"
+    assert diag["metrics"]["coalescer"]["flushes"] == 0
@@ -0,0 +1,115 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from custom_components.satel import SatelHub
+from custom_components.satel.codec import encode_frame
+from custom_components.satel.const import ENCRYPTION_METHOD_INTEGRATION_KEY
+from custom_components.satel.encryption import (
+    EncryptedSatel,
+    EncryptedSession,
+    SatelCipher,
+    integration_key_to_aes_key,
+)
+
+
+def _reference_encrypt(key: str, data: bytes) -> bytes:
+    """Block by block transcription of the algorithm in the protocol manual."""
+    aes = Cipher(algorithms.AES(integration_key_to_aes_key(key)), modes.ECB())
+    encrypt = aes.encryptor().update
+    data = data.ljust(16, b"\x00")
+    cv = encrypt(bytes(16))
+    out = b""
+    for pos in range(0, len(data), 16):
+        block = data[pos : pos + 16]
+        if len(block) == 16:
+            cv = encrypt(bytes(a ^ b for a, b in zip(block, cv)))
+            out += cv
+        else:
+            cv = encrypt(cv)
+            out += bytes(a ^ b for a, b in zip(block, cv))
+    return out
+
+
+def test_integration_key_expansion():
+    assert integration_key_to_aes_key("abc") == (b"abc" + b" " * 9) * 2
+    with pytest.raises(ValueError):
+        integration_key_to_aes_key("0123456789abc")
+
+
+@pytest.mark.parametrize("length", [1, 15, 16, 17, 31, 32, 45])
+def test_cipher_matches_reference_and_round_trips(length):
+    cipher = SatelCipher("secret")
+    data = bytes(range(1, length + 1))
+
+    encrypted = cipher.encrypt(data)
+
+    assert bytes(encrypted) == _reference_encrypt("secret", data)
+    assert bytes(cipher.decrypt(encrypted)) == data.ljust(16, b"\x00")
+
+
+def test_session_rolls_counter_and_echoes_ids():
+    client = EncryptedSession("secret")
+    panel = EncryptedSession("secret")
+    frame = encode_frame(0x00)
+
+    first = client.wrap(frame)
+    second = client.wrap(frame)
+
+    plain = panel._cipher.decrypt(second[1:])
+    assert first[0] == len(first) - 1
+    assert plain[2:4] == b"\x00\x01"
+    assert plain[4] == client.id_s
+
+    # The panel answers with its own id_s and echoes ours as id_r.
+    panel.id_r = client.id_s
+    answer = encode_frame(0x00, bytes(32))
+    pdu = panel.wrap(answer)
+    assert client.unwrap(pdu[1:]) == answer
+    assert client.id_r == panel.id_s
+
+    panel.id_r = (client.id_s + 1) & 0xFF
+    assert client.unwrap(panel.wrap(answer)[1:]) is None
+    assert client.stats == {"sent": 2, "received": 1, "rejected": 1}
+
+
+@pytest.mark.asyncio
+async def test_encrypted_satel_reads_and_writes_pdus():
+    satel = EncryptedSatel("host", 1234, asyncio.get_running_loop(), "secret")
+    reader = asyncio.StreamReader()
+    writer = Mock(drain=AsyncMock())
+    with patch("asyncio.open_connection", AsyncMock(return_value=(reader, writer))):
+        assert await satel.connect()
+
+    await satel._send_data(encode_frame(0x7F))
+    pdu = writer.write.call_args.args[0]
+    panel = EncryptedSession("secret")
+    assert panel._cipher.decrypt(pdu[1:])[6:].startswith(encode_frame(0x7F))
+
+    panel.id_r = satel._session.id_s
+    reader.feed_data(panel.wrap(encode_frame(0x0A, b"\x05\x00\x00\x00")))
+    assert await satel._read_data() == b"\x0a\x05\x00\x00\x00"
+    assert satel.encryption_stats == {"sent": 1, "received": 1, "rejected": 0}
+
+
+@pytest.mark.asyncio
+async def test_hub_selects_encrypted_transport():
+    satel = AsyncMock()
+    satel.connect = AsyncMock(return_value=True)
+    with patch("custom_components.satel.encryption.EncryptedSatel", return_value=satel) as cls:
+        hub = SatelHub(
+            "host",
+            1234,
+            "code",
+            encryption_key="secret",
+            encryption_method=ENCRYPTION_METHOD_INTEGRATION_KEY,
+        )
+        await hub.connect()
+
+    assert cls.call_args.args[3] == "secret"
+
+    hub = SatelHub("host", 1234, encryption_method=ENCRYPTION_METHOD_INTEGRATION_KEY)
+    with pytest.raises(ValueError):
+        await hub.connect()
@@ -9,9 +9,16 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.satel import SatelHub
 from custom_components.satel.binary_sensor import SatelZoneBinarySensor
 from custom_components.satel.sensor import SatelZoneSensor
+from custom_components.satel.state import SatelState
 from custom_components.satel.switch import SatelOutputSwitch
 
 
+def _output(state: bool) -> SatelState:
+    data = SatelState()
+    data.set_output(1, state)
+    return data
+
+
 @pytest.mark.asyncio
 async def test_binary_sensor_unavailable_on_coordinator_error(hass):
     hub = SatelHub("host", 1234, "code")
@@ -65,13 +72,13 @@ async def test_switch_turn_on_handles_connection_error(hass):
         hass,
         logging.getLogger(__name__),
         name="satel",
-        update_method=AsyncMock(return_value={}),
+        update_method=AsyncMock(return_value=SatelState()),
         config_entry=MockConfigEntry(domain="satel"),
     )
     entity = SatelOutputSwitch(hub, coordinator, "1", "Out")
     entity.async_write_ha_state = MagicMock()
     entity.coordinator.async_request_refresh = AsyncMock()
-    coordinator.data = {"outputs": {"1": "OFF"}}
+    coordinator.data = _output(False)
 
     await entity.async_turn_on()
 
@@ -88,14 +95,14 @@ async def test_switch_turn_off_handles_connection_error(hass):
         hass,
         logging.getLogger(__name__),
         name="satel",
-        update_method=AsyncMock(return_value={"outputs": {"1": "ON"}}),
+        update_method=AsyncMock(return_value=_output(True)),
         config_entry=MockConfigEntry(domain="satel"),
     )
     entity = SatelOutputSwitch(hub, coordinator, "1", "Out")
     entity._attr_is_on = True
     entity.async_write_ha_state = MagicMock()
     entity.coordinator.async_request_refresh = AsyncMock()
-    coordinator.data = {"outputs": {"1": "ON"}}
+    coordinator.data = _output(True)
 
     await entity.async_turn_off()
 
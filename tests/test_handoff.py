@@ -0,0 +1,112 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.satel import SatelHub
+from custom_components.satel.cache import DeviceCache
+from custom_components.satel.const import CONF_CODE, DOMAIN
+from custom_components.satel.handoff import (
+    HANDOFF_TIMEOUT,
+    async_claim_hub,
+    async_park_hub,
+)
+from custom_components.satel.state import SatelState
+
+DEVICES = {
+    "zones": [{"id": "1", "name": "Hall"}],
+    "outputs": [],
+    "partitions": [{"id": "1", "name": "House"}],
+}
+OPTIONS = {
+    "user_code": None,
+    "encryption_key": None,
+    "encoding": "utf-8",
+    "update_interval": 0,
+    "timeout": 10,
+    "reconnect_delay": 15,
+    "encryption_method": "none",
+    "coalesce_window": 0,
+}
+SETTINGS = {"host": "10.0.0.1", "port": 7094, "code": "1234", **OPTIONS}
+
+
+def _hub() -> SatelHub:
+    hub = SatelHub("10.0.0.1", 7094, "1234")
+    hub._satel = Mock(connected=True)
+    hub.async_keep_alive = AsyncMock()
+    return hub
+
+
+@pytest.mark.asyncio
+async def test_claim_returns_parked_hub(hass):
+    hub = _hub()
+    async_park_hub(hass, hub, SETTINGS, DEVICES)
+    hub.async_keep_alive.assert_called_once()
+
+    assert await async_claim_hub(hass, SETTINGS) == (hub, DEVICES)
+    assert await async_claim_hub(hass, SETTINGS) is None
+    hub._satel.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_claim_with_other_settings_closes_hub(hass):
+    hub = _hub()
+    satel = hub._satel
+    async_park_hub(hass, hub, SETTINGS, DEVICES)
+
+    assert await async_claim_hub(hass, {**SETTINGS, "code": "9999"}) is None
+    satel.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_unclaimed_hub_is_closed(hass):
+    hub = _hub()
+    satel = hub._satel
+    async_park_hub(hass, hub, SETTINGS, DEVICES)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=HANDOFF_TIMEOUT + 1))
+    await hass.async_block_till_done()
+
+    satel.close.assert_called_once()
+    assert await async_claim_hub(hass, SETTINGS) is None
+
+
+@pytest.mark.asyncio
+async def test_setup_takes_over_flow_connection(hass, enable_custom_integrations):
+    hub = _hub()
+    hub.fingerprint = "abc"
+    async_park_hub(hass, hub, SETTINGS, DEVICES)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "10.0.0.1", CONF_PORT: 7094, CONF_CODE: "1234"},
+    )
+    entry.add_to_hass(hass)
+
+    with patch("custom_components.satel.SatelHub.connect", AsyncMock()) as connect, \
+        patch(
+            "custom_components.satel.SatelHub.start_monitoring",
+            AsyncMock(return_value=Mock()),
+        ), \
+        patch("custom_components.satel.SatelHub.discover_devices", AsyncMock()) as discover, \
+        patch(
+            "custom_components.satel.SatelHub.get_overview",
+            AsyncMock(return_value=SatelState()),
+        ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        connect.assert_not_awaited()
+        discover.assert_not_awaited()
+        assert entry.runtime_data.hub is hub
+        assert entry.runtime_data.devices == DEVICES
+        assert hub.monitored_zones == [1]
+        assert await DeviceCache(hass, "10.0.0.1").async_load_last() == ("abc", DEVICES)
+
+        await hass.config_entries.async_unload(entry.entry_id)
@@ -1,19 +1,51 @@
+import asyncio
 import logging
-from unittest.mock import AsyncMock, patch
+import time
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
 
 from custom_components.satel import SatelHub
+from custom_components.satel.codec import FrameDecoder, encode_frame
+from custom_components.satel.const import (
+    DEFAULT_RESYNC_INTERVAL,
+    EVENT_OUTPUT_CHANGED,
+    EVENT_ZONE_VIOLATED,
+)
+from custom_components.satel.dispatch import DISPATCH_OUTPUT, DISPATCH_ZONE
+from custom_components.satel.names import NAME_ZONE
+from custom_components.satel.state import (
+    ATTR_BYPASS,
+    ATTR_TAMPER,
+    ATTR_TROUBLES,
+    ATTR_VIOLATION,
+    STATE_QUERIES,
+)
 from satel_integra.satel_integra import AlarmState
 
 
+def _answer_commands(satel, result=0x00, before=None):
+    """Answer every frame written to ``satel`` with the ``0xEF`` ``result``."""
+    satel._message_handlers = {}
+
+    async def _send_data(data):
+        if before is not None:
+            before(data)
+        satel._message_handlers[b"\xef"](bytes((0xEF, result)))
+
+    satel._send_data = AsyncMock(side_effect=_send_data)
+
+
 @pytest.mark.asyncio
 async def test_connect_failure():
     satel = AsyncMock()
     satel.connect = AsyncMock(return_value=False)
-    with patch("custom_components.satel.AsyncSatel", return_value=satel):
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
         hub = SatelHub("host", 1234, "code")
         with pytest.raises(ConnectionError):
             await hub.connect()
@@ -24,8 +56,9 @@ async def test_monitoring_updates_state(hass):
     satel = AsyncMock()
     satel.connect = AsyncMock(return_value=True)
     satel.monitor_status = AsyncMock()
+    satel.close = Mock()
     satel.partition_states = {}
-    with patch("custom_components.satel.AsyncSatel", return_value=satel):
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
         hub = SatelHub("host", 1234, "code")
         await hub.connect()
         coordinator = DataUpdateCoordinator(
@@ -54,30 +87,48 @@ async def test_monitoring_updates_state(hass):
         output_cb({"outputs": {2: 1}})
         satel.partition_states = {AlarmState.TRIGGERED: [1]}
         alarm_cb()
+        # Nothing changed, merged all the same.
+        output_cb({"outputs": {2: 1}})
+        await hass.async_block_till_done()
+
+        assert hub.metrics["coalescer"]["flushes"] == 1
+        assert hub.metrics["coalescer"]["merged"] == 3
+        # Without a flush pending an unchanged report schedules nothing.
+        output_cb({"outputs": {2: 1}})
+        await hass.async_block_till_done()
+        assert hub.metrics["coalescer"]["requests"] == 4
+        assert coordinator.data.zone(ATTR_VIOLATION, 1) is True
+        assert coordinator.data.output(2) is True
+        assert coordinator.data.partition(1) == "TRIGGERED"
+        assert coordinator.data.zone(ATTR_TAMPER, 1) is True
+        assert coordinator.data.zone(ATTR_BYPASS, 1) is True
+        assert coordinator.data.zone(ATTR_TROUBLES, 1) is False
+        assert coordinator.data.zone(ATTR_VIOLATION, 2) is None
 
-        assert coordinator.data["zones"]["1"] == "ON"
-        assert coordinator.data["outputs"]["2"] == "ON"
-        assert coordinator.data["alarm"]["1"] == "TRIGGERED"
-        assert coordinator.data["tamper"]["1"] == "ON"
-        assert coordinator.data["bypass"]["1"] == "ON"
-        assert coordinator.data["troubles"]["1"] == "OFF"
+        await hub.async_close()
 
 
 @pytest.mark.asyncio
 async def test_partition_commands():
     satel = AsyncMock()
     satel.connect = AsyncMock(return_value=True)
-    with patch("custom_components.satel.AsyncSatel", return_value=satel):
-        hub = SatelHub("host", 1234, "code")
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
+        hub = SatelHub("host", 1234, "1234")
         await hub.connect()
-        satel.arm = AsyncMock()
-        satel.disarm = AsyncMock()
+        satel.close = Mock()
+        _answer_commands(satel)
+        code = bytes.fromhex("1234FFFFFFFFFFFF")
         await hub.arm_home(2)
-        satel.arm.assert_awaited_with("code", [2], mode=1)
+        satel._send_data.assert_awaited_with(encode_frame(0x81, code + b"\x02\0\0\0"))
         await hub.arm_night(3)
-        satel.arm.assert_awaited_with("code", [3], mode=2)
+        satel._send_data.assert_awaited_with(encode_frame(0x82, code + b"\x04\0\0\0"))
         await hub.disarm_partition(4)
-        satel.disarm.assert_awaited_with("code", [4])
+        satel._send_data.assert_awaited_with(encode_frame(0x84, code + b"\x08\0\0\0"))
+        # The library cannot address the last partition.
+        await hub.clear_alarm(32)
+        satel._send_data.assert_awaited_with(encode_frame(0x85, code + b"\0\0\0\x80"))
+        assert hub.metrics["commands"]["sent"] == 4
+        await hub.async_close()
 
 
 @pytest.mark.asyncio
@@ -96,8 +147,8 @@ async def test_discover_devices_reads_names():
 
     assert devices["zones"] == [{"id": "1", "name": "Zone 1"}]
     assert devices["outputs"] == [{"id": "2", "name": "Out 2"}]
-    assert hub.monitored_zones == [1]
-    assert hub.monitored_outputs == [2]
+    assert hub.monitored_zones == []
+    assert hub.monitored_outputs == []
 
 
 @pytest.mark.asyncio
@@ -109,3 +160,439 @@ async def test_discover_devices_missing_helpers():
     with pytest.raises(RuntimeError, match="incompatible"):
         await hub.discover_devices()
 
+
+
+@pytest.mark.asyncio
+async def test_monitoring_dispatches_only_changed_ids(hass):
+    satel = AsyncMock()
+    satel.connect = AsyncMock(return_value=True)
+    satel.monitor_status = AsyncMock()
+    satel.close = Mock()
+    satel.partition_states = {}
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
+        hub = SatelHub("host", 1234, "code")
+        await hub.connect()
+        coordinator = DataUpdateCoordinator(
+            hass,
+            logging.getLogger(__name__),
+            name="satel",
+            update_method=hub.get_overview,
+            config_entry=MockConfigEntry(domain="satel"),
+        )
+        await coordinator.async_refresh()
+        await hub.start_monitoring(hass, coordinator)
+        zone_cb = satel.monitor_status.call_args.kwargs["zone_changed_callback"]
+        output_cb = satel.monitor_status.call_args.kwargs["output_changed_callback"]
+
+        zone_1, zone_2, output_1 = Mock(), Mock(), Mock()
+        hub.async_subscribe(DISPATCH_ZONE, 1, zone_1)
+        unsub = hub.async_subscribe(DISPATCH_ZONE, 2, zone_2)
+        hub.async_subscribe(DISPATCH_OUTPUT, 1, output_1)
+
+        zone_cb({"zones": {1: 1, 2: 0}})
+        await hass.async_block_till_done()
+        zone_1.assert_called_once()
+        zone_2.assert_called_once()
+        output_1.assert_not_called()
+
+        zone_cb({"zones": {1: 0, 2: 0}})
+        await hass.async_block_till_done()
+        assert zone_1.call_count == 2
+        assert zone_2.call_count == 1
+
+        unsub()
+        zone_cb({"zones": {1: 0, 2: 1}})
+        output_cb({"outputs": {1: 0}})
+        await hass.async_block_till_done()
+        assert zone_1.call_count == 2
+        assert zone_2.call_count == 1
+        output_1.assert_called_once()
+        assert coordinator.data.zone_violated(2) is True
+
+        await hub.async_close()
+
+
+@pytest.mark.asyncio
+async def test_get_overview_resyncs_only_when_push_is_stale(hass):
+    satel = AsyncMock()
+    satel.connect = AsyncMock(return_value=True)
+    satel.monitor_status = AsyncMock()
+    satel.close = Mock()
+    satel.connected = True
+    satel.partition_states = {}
+    satel._message_handlers = {}
+    decoder = FrameDecoder()
+    writes = []
+
+    async def _send_data(data):
+        # Answer every state query of the batch with an empty group.
+        writes.append(data)
+        for frame in decoder.feed(data):
+            length = 16 if frame.command in STATE_QUERIES else 4
+            satel._message_handlers[bytes((frame.command,))](
+                bytes((frame.command,)) + bytes(length)
+            )
+
+    satel._send_data = AsyncMock(side_effect=_send_data)
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
+        hub = SatelHub("host", 1234, "code")
+        await hub.connect()
+
+        # Monitor not running yet: nothing to resync into.
+        await hub.get_overview()
+        satel._send_data.assert_not_awaited()
+
+        hub._monitor_task = Mock(done=Mock(return_value=False))
+        await hub.get_overview()
+        # One batched write through the command scheduler.
+        assert len(writes) == 1
+        assert hub.metrics["commands"]["sent"] == 1
+        assert satel._message_handlers == {}
+
+        satel._send_data.reset_mock()
+        hub._last_frame = time.monotonic()
+        assert hub.push_healthy
+        await hub.get_overview()
+        satel._send_data.assert_not_awaited()
+
+        hub._last_frame -= DEFAULT_RESYNC_INTERVAL + 1
+        assert not hub.push_healthy
+        satel.connected = False
+        with pytest.raises(UpdateFailed):
+            await hub.get_overview()
+        assert hub.metrics["push"]["resyncs"] == 1
+
+
+@pytest.mark.asyncio
+async def test_monitoring_ignores_partitions_not_in_use(hass):
+    satel = AsyncMock()
+    satel.connect = AsyncMock(return_value=True)
+    satel.monitor_status = AsyncMock()
+    satel.close = Mock()
+    satel.connected = True
+    satel.partition_states = {}
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
+        hub = SatelHub("host", 1234, "code")
+        await hub.connect()
+        hub.use_devices({"partitions": [{"id": "1", "name": "House"}]})
+        coordinator = DataUpdateCoordinator(
+            hass,
+            logging.getLogger(__name__),
+            name="satel",
+            update_method=hub.get_overview,
+            config_entry=MockConfigEntry(domain="satel"),
+        )
+        await coordinator.async_refresh()
+        await hub.start_monitoring(hass, coordinator)
+        alarm_cb = satel.monitor_status.call_args.kwargs["alarm_status_callback"]
+
+        satel.partition_states = {AlarmState.ARMED_MODE0: [1, 2]}
+        alarm_cb()
+
+        assert hub.state.partition(1) == "ARMED_AWAY"
+        assert hub.state.partition(2) is None
+        await hub.async_close()
+
+
+@pytest.mark.asyncio
+async def test_arm_is_shown_until_the_panel_confirms(hass):
+    satel = AsyncMock()
+    satel.connect = AsyncMock(return_value=True)
+    satel.monitor_status = AsyncMock()
+    satel.close = Mock()
+    satel.connected = True
+    satel.partition_states = {}
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
+        hub = SatelHub("host", 1234, "1234")
+        await hub.connect()
+        hub.use_devices({"partitions": [{"id": "1", "name": "House"}]})
+        coordinator = DataUpdateCoordinator(
+            hass,
+            logging.getLogger(__name__),
+            name="satel",
+            update_method=hub.get_overview,
+            config_entry=MockConfigEntry(domain="satel"),
+        )
+        await coordinator.async_refresh()
+        await hub.start_monitoring(hass, coordinator)
+        alarm_cb = satel.monitor_status.call_args.kwargs["alarm_status_callback"]
+        _answer_commands(satel)
+
+        await hub.arm(1)
+        satel._send_data.assert_awaited_once_with(
+            encode_frame(0x80, bytes.fromhex("1234FFFFFFFFFFFF") + b"\x01\0\0\0")
+        )
+        assert hub.state.partition(1) == "ARMED_AWAY"
+
+        # Still disarmed on the panel: held back until confirmed.
+        alarm_cb()
+        assert hub.state.partition(1) == "ARMED_AWAY"
+
+        satel.partition_states = {AlarmState.EXIT_COUNTDOWN_OVER_10: [1]}
+        alarm_cb()
+        assert hub.state.partition(1) == "PENDING"
+        assert hub.metrics["confirmations"]["confirmed"] == 1
+        await hub.async_close()
+
+
+@pytest.mark.asyncio
+async def test_alarms_and_rejected_commands_are_not_held_back(hass):
+    satel = AsyncMock()
+    satel.connect = AsyncMock(return_value=True)
+    satel.monitor_status = AsyncMock()
+    satel.close = Mock()
+    satel.connected = True
+    satel.partition_states = {}
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
+        hub = SatelHub("host", 1234, "1234")
+        await hub.connect()
+        hub.use_devices({"partitions": [{"id": "1"}, {"id": "2"}]})
+        coordinator = DataUpdateCoordinator(
+            hass,
+            logging.getLogger(__name__),
+            name="satel",
+            update_method=hub.get_overview,
+            config_entry=MockConfigEntry(domain="satel"),
+        )
+        await coordinator.async_refresh()
+        await hub.start_monitoring(hass, coordinator)
+        alarm_cb = satel.monitor_status.call_args.kwargs["alarm_status_callback"]
+        satel.partition_states = {AlarmState.ARMED_MODE0: [2]}
+        alarm_cb()
+
+        # An alarm while the disarm waits for confirmation is shown at once.
+        _answer_commands(satel)
+        await hub.disarm(1)
+        assert hub.state.partition(1) == "DISARMED"
+        satel.partition_states = {AlarmState.TRIGGERED: [1]}
+        alarm_cb()
+        assert hub.state.partition(1) == "TRIGGERED"
+        assert hub.metrics["confirmations"]["pending"] == 0
+
+        # A wrong user code: the panel's result restores the state right away.
+        _answer_commands(satel, result=0x01)
+        await hub.disarm(2)
+        assert hub.state.partition(2) == "ARMED_AWAY"
+        assert hub.metrics["confirmations"]["rolled_back"] == 1
+        results = await hub.arm_partitions([1])
+        assert results == {1: {"state": "TRIGGERED", "confirmed": False}}
+        await hub.async_close()
+
+
+@pytest.mark.asyncio
+async def test_arm_partitions_sends_one_command_and_confirms(hass):
+    satel = AsyncMock()
+    satel.connect = AsyncMock(return_value=True)
+    satel.monitor_status = AsyncMock()
+    satel.close = Mock()
+    satel.connected = True
+    satel.partition_states = {}
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
+        hub = SatelHub("host", 1234, "1234", timeout=1)
+        await hub.connect()
+        # Partition 32 is not in use, its state is derived once commanded.
+        hub.use_devices({"partitions": [{"id": "1"}, {"id": "3"}]})
+        coordinator = DataUpdateCoordinator(
+            hass,
+            logging.getLogger(__name__),
+            name="satel",
+            update_method=hub.get_overview,
+            config_entry=MockConfigEntry(domain="satel"),
+        )
+        await coordinator.async_refresh()
+        await hub.start_monitoring(hass, coordinator)
+        alarm_cb = satel.monitor_status.call_args.kwargs["alarm_status_callback"]
+
+        def _armed(frame):
+            # The panel only arms partitions 1, 3 and 32.
+            satel.partition_states = {AlarmState.ARMED_MODE1: [1, 3, 32]}
+            alarm_cb()
+
+        code = bytes.fromhex("1234FFFFFFFFFFFF")
+        _answer_commands(satel, before=_armed)
+        results = await hub.arm_partitions(["3", 1, 32], mode=1)
+        satel._send_data.assert_awaited_once_with(
+            encode_frame(0x81, code + b"\x05\0\0\x80")
+        )
+        assert results == {
+            1: {"state": "ARMED_HOME", "confirmed": True},
+            3: {"state": "ARMED_HOME", "confirmed": True},
+            32: {"state": "ARMED_HOME", "confirmed": True},
+        }
+
+        _answer_commands(satel)
+        results = await hub.disarm_partitions([1, 2])
+        satel._send_data.assert_awaited_once_with(
+            encode_frame(0x84, code + b"\x03\0\0\0")
+        )
+        assert results == {
+            1: {"state": "ARMED_HOME", "confirmed": False},
+            2: {"state": None, "confirmed": False},
+        }
+
+        await hub.async_close()
+
+
+@pytest.mark.asyncio
+async def test_disarm_is_not_held_behind_discovery(panel):
+    panel.names = {NAME_ZONE: {1: "Hall"}}
+    panel.results = {0x84: 0x00}
+    hub = SatelHub("host", 1234, "1234", timeout=1)
+    hub._satel = panel
+
+    discovery = asyncio.create_task(hub.discover_devices())
+    while len(panel.received) < 16:
+        await asyncio.sleep(0.001)
+    await hub.disarm(1)
+
+    # The disarm went out between two windows of name queries.
+    assert not discovery.done()
+    assert hub.state.partition(1) == "DISARMED"
+    devices = await discovery
+    assert devices["zones"] == [{"id": "1", "name": "Hall"}]
+    assert panel.commands.count(0x84) == 1
+    assert hub.metrics["confirmations"]["rolled_back"] == 0
+    await hub.async_close()
+
+
+@pytest.mark.asyncio
+async def test_command_results_are_matched_to_their_commands(panel):
+    # The panel rejects the output command and accepts the arming.
+    panel.results = {0x88: 0x02, 0x80: 0x00}
+    hub = SatelHub("host", 1234, "1234", timeout=1)
+    hub._satel = panel
+    hub.state.set_output(1, False)
+
+    await asyncio.gather(hub.set_outputs({1: True}), hub.arm(1))
+
+    assert sorted(panel.commands) == [0x80, 0x88]
+    assert hub.state.output(1) is False
+    assert hub.state.partition(1) == "ARMED_AWAY"
+    assert hub.metrics["confirmations"]["rolled_back"] == 1
+    await hub.async_close()
+
+
+@pytest.mark.asyncio
+async def test_events_fire_before_entities_update(hass):
+    satel = AsyncMock()
+    satel.connect = AsyncMock(return_value=True)
+    satel.monitor_status = AsyncMock()
+    satel.close = Mock()
+    satel.partition_states = {}
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
+        hub = SatelHub("host", 1234, "1234")
+        await hub.connect()
+        coordinator = DataUpdateCoordinator(
+            hass,
+            logging.getLogger(__name__),
+            name="satel",
+            update_method=hub.get_overview,
+            config_entry=MockConfigEntry(domain="satel"),
+        )
+        await coordinator.async_refresh()
+        hub.use_devices({"zones": [{"id": "1"}], "outputs": [{"id": "2"}]})
+        await hub.start_monitoring(hass, coordinator)
+        zone_cb = satel.monitor_status.call_args.kwargs["zone_changed_callback"]
+        output_cb = satel.monitor_status.call_args.kwargs["output_changed_callback"]
+        violated = async_capture_events(hass, EVENT_ZONE_VIOLATED)
+        changed = async_capture_events(hass, EVENT_OUTPUT_CHANGED)
+        entity = Mock()
+        hub.async_subscribe(DISPATCH_ZONE, 1, entity)
+
+        zone_cb({"zones": {1: 1}})
+        assert [event.data for event in violated] == [{"host": "host", "zone": 1}]
+        entity.assert_not_called()
+        await hass.async_block_till_done()
+        entity.assert_called_once()
+
+        # Restores and tamper reports fire nothing.
+        zone_cb({"zones": {1: 0}, "tamper": {1: 1}})
+        zone_cb({"zones": {1: 1}})
+        assert len(violated) == 2
+        # Each event has its own data.
+        assert violated[0].data == violated[1].data
+        assert violated[0].data is not violated[1].data
+
+        output_cb({"outputs": {2: 1}})
+        _answer_commands(satel)
+        # Shown on at once, reported changed once the panel confirms.
+        await hub.set_outputs({2: False})
+        await hass.async_block_till_done()
+        assert [event.data["on"] for event in changed] == [True]
+        output_cb({"outputs": {2: 0}})
+        await hass.async_block_till_done()
+        assert [event.data for event in changed][1:] == [
+            {"host": "host", "output": 2, "on": False}
+        ]
+        assert hub.metrics["events"] == {"zone_violated": 2, "output_changed": 2}
+
+        await hub.async_close()
+
+
+@pytest.mark.asyncio
+async def test_set_outputs_sends_one_frame_per_state(hass):
+    satel = AsyncMock()
+    satel.connect = AsyncMock(return_value=True)
+    satel.monitor_status = AsyncMock()
+    satel.close = Mock()
+    satel.partition_states = {}
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
+        hub = SatelHub("host", 1234, "1234")
+        await hub.connect()
+        coordinator = DataUpdateCoordinator(
+            hass,
+            logging.getLogger(__name__),
+            name="satel",
+            update_method=hub.get_overview,
+            config_entry=MockConfigEntry(domain="satel"),
+        )
+        await coordinator.async_refresh()
+        await hub.start_monitoring(hass, coordinator)
+        listener = Mock()
+        for output in (1, 9, 10):
+            hub.async_subscribe(DISPATCH_OUTPUT, output, listener)
+        _answer_commands(satel)
+
+        await hub.set_outputs({1: True, "9": True, 10: False})
+        await hass.async_block_till_done()
+
+        code = bytes.fromhex("1234FFFFFFFFFFFF")
+        assert [call.args[0] for call in satel._send_data.await_args_list] == [
+            encode_frame(0x88, code + b"\x01\x01" + bytes(14)),
+            encode_frame(0x89, code + b"\x00\x02" + bytes(14)),
+        ]
+        assert listener.call_count == 3
+        assert coordinator.data.output(9) is True
+        assert coordinator.data.output(10) is False
+
+        satel._send_data.reset_mock()
+        await hub.set_outputs({200: True})
+        mask = (1 << 199).to_bytes(32, "little")
+        satel._send_data.assert_awaited_once_with(encode_frame(0x88, code + mask))
+
+        await hub.async_close()
+
+
+@pytest.mark.asyncio
+async def test_query_returns_answer_read_by_monitor():
+    satel = AsyncMock()
+    satel.connect = AsyncMock(return_value=True)
+    satel._message_handlers = {}
+
+    async def _send(frame):
+        # The monitor loop hands the answer to the registered handler.
+        assert frame == encode_frame(0x7E)
+        satel._message_handlers[b"\x7e"](b"\x7e\x01" + b"1.23 2020-01-01")
+
+    satel._send_data = AsyncMock(side_effect=_send)
+    with patch("custom_components.satel.transport.FramedSatel", return_value=satel):
+        hub = SatelHub("host", 1234, "code", timeout=1)
+        await hub.connect()
+
+        assert await hub.async_fingerprint() == (b"\x01" + b"1.23 2020-01-01").hex()
+        assert satel._message_handlers == {}
+
+        satel._send_data = AsyncMock()
+        with pytest.raises(ConnectionError):
+            await hub.async_query(0x7E)
+        assert await hub.async_fingerprint() is None
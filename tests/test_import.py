@@ -0,0 +1,44 @@
+"""Keep the protocol stack off the integration's import path."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+DEFERRED = (
+    "satel_integra",
+    "custom_components.satel.encryption",
+    "custom_components.satel.proxy",
+    "custom_components.satel.transport",
+)
+
+
+def _imported(*modules):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "[us]" not in line
+    }
+
+
+def test_loading_the_integration_defers_the_protocol_stack():
+    imported = _imported(
+        "custom_components.satel",
+        "custom_components.satel.config_flow",
+        "custom_components.satel.alarm_control_panel",
+        "custom_components.satel.binary_sensor",
+        "custom_components.satel.sensor",
+        "custom_components.satel.switch",
+        "custom_components.satel.diagnostics",
+    )
+
+    assert "custom_components.satel.config_flow" in imported
+    assert not [name for name in imported if name.startswith(DEFERRED)]
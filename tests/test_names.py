@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from custom_components.satel import SatelHub
+from custom_components.satel.codec import FrameDecoder
+from custom_components.satel.names import (
+    NAME_OUTPUT,
+    NAME_PARTITION,
+    NAME_ZONE,
+    NameReader,
+)
+
+
+@pytest.mark.asyncio
+async def test_discover_devices_reads_names_in_a_pipeline(panel):
+    panel.names = {
+        NAME_ZONE: {1: "Hall", 2: "Garage", 256: "Attic"},
+        NAME_OUTPUT: {3: "Siren"},
+        NAME_PARTITION: {1: "House", 2: "Garage"},
+    }
+    hub = SatelHub("host", 1234, "code", timeout=1)
+    hub._satel = panel
+
+    devices = await hub.discover_devices()
+
+    assert devices["zones"] == [
+        {"id": "1", "name": "Hall"},
+        {"id": "2", "name": "Garage"},
+        {"id": "256", "name": "Attic"},
+    ]
+    assert devices["outputs"] == [{"id": "3", "name": "Siren"}]
+    assert devices["partitions"] == [
+        {"id": "1", "name": "House"},
+        {"id": "2", "name": "Garage"},
+    ]
+    # Monitoring waits for the selection to be applied.
+    assert hub.monitored_zones == []
+    assert hub.monitored_partitions == frozenset()
+    # Several queries were in flight and every zone of the panel was read,
+    # past the long run of unused zones before zone 256.
+    assert panel.max_in_flight > 1
+    zones = [
+        frame.data[1]
+        for frame in panel.received
+        if frame.command == 0xEE and frame.data[0] == NAME_ZONE
+    ]
+    assert len(zones) == 256
+    assert panel._message_handlers == {}
+
+
+@pytest.mark.asyncio
+async def test_discover_devices_stops_at_panel_limit(panel):
+    # INTEGRA 24 has 24 zones.
+    panel.panel_type = 0
+    panel.names = {NAME_ZONE: {i: f"Zone {i}" for i in range(1, 33)}}
+    hub = SatelHub("host", 1234, "code", timeout=1)
+    hub._satel = panel
+
+    devices = await hub.discover_devices()
+
+    assert [zone["id"] for zone in devices["zones"]] == [str(i) for i in range(1, 25)]
+
+
+@pytest.mark.asyncio
+async def test_unused_outputs_and_result_frames():
+    writes = []
+
+    async def _exchange(frames, answered):
+        writes.append(frames)
+        return await answered
+
+    reader = NameReader(_exchange, "utf-8", depth=4)
+    task = asyncio.create_task(reader.read(NAME_OUTPUT, 2))
+    while not writes:
+        await asyncio.sleep(0)
+    # Both queries of the window go out in one write.
+    assert [frame.data for frame in FrameDecoder().feed(writes[0])] == [
+        bytes((NAME_OUTPUT, 1)),
+        bytes((NAME_OUTPUT, 2)),
+    ]
+    # A result other than "no such device" does not drop output 1.
+    reader.handle(b"\xef\xff")
+    reader.handle(bytes((0xEE, NAME_OUTPUT, 2, 0)) + b"Unused".ljust(16))
+    while len(writes) < 2:
+        await asyncio.sleep(0)
+    assert [frame.data for frame in FrameDecoder().feed(writes[1])] == [
+        bytes((NAME_OUTPUT, 1))
+    ]
+    reader.handle(bytes((0xEE, NAME_OUTPUT, 1, 5)) + "Światło".encode().ljust(16, b" "))
+    # Answers with no query of the reader waiting are not taken.
+    reader.handle(b"\xef\x08")
+
+    assert await task == {1: "Światło"}
+
+
+@pytest.mark.asyncio
+async def test_doubtful_answers_are_retried_then_fail():
+    queries = []
+
+    async def _exchange(frames, answered):
+        for frame in FrameDecoder().feed(frames):
+            queries.append(frame.data[1])
+            # Busy: the panel answers every query with "other error".
+            reader.handle(b"\xef\x02")
+        return await answered
+
+    reader = NameReader(_exchange, "utf-8", depth=4)
+    with pytest.raises(ConnectionError):
+        await reader.read(NAME_ZONE, 2)
+    assert queries == [1, 2, 1, 2, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_missing_answer_raises_connection_error(panel):
+    hub = SatelHub("host", 1234, "code", timeout=0.05)
+    hub._satel = panel
+
+    async def _silent(frame):
+        return None
+
+    panel._send_data = _silent
+    with pytest.raises(ConnectionError):
+        await hub.discover_devices()
+    assert panel._message_handlers == {}
@@ -5,8 +5,16 @@ import pytest
 import logging
 
 from custom_components.satel import SatelHub, SatelRuntimeData
-from custom_components.satel.const import DOMAIN
+from custom_components.satel.const import (
+    CONF_ZONE_ENTITIES,
+    DOMAIN,
+    ZONE_ENTITIES_BINARY,
+    ZONE_ENTITIES_STATUS,
+)
 from custom_components.satel import binary_sensor, sensor, switch
+from custom_components.satel.state import SatelState
+from homeassistant.const import EntityCategory
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -25,15 +33,7 @@ async def test_binary_sensor_setup_entry(hass, enable_custom_integrations):
     devices = await hub.discover_devices()
 
     async def _update():
-        return {
-            "alarm": {},
-            "zones": {},
-            "outputs": {},
-            "troubles": {},
-            "tamper": {},
-            "bypass": {},
-            "alarm_memory": {},
-        }
+        return SatelState()
 
     coordinator = DataUpdateCoordinator(
         hass,
@@ -49,8 +49,22 @@ async def test_binary_sensor_setup_entry(hass, enable_custom_integrations):
 
     add_entities.assert_called_once()
     entities = add_entities.call_args[0][0]
-    assert len(entities) == 1
-    assert entities[0].unique_id == "satel_zone_1"
+    assert [entity.unique_id for entity in entities] == [
+        "satel_zone_1",
+        "satel_zone_tamper_1",
+        "satel_zone_troubles_1",
+        "satel_zone_bypass_1",
+        "satel_zone_alarm_memory_1",
+    ]
+    assert not entities[0].extra_state_attributes
+    assert [entity.entity_registry_enabled_default for entity in entities] == [
+        True,
+        False,
+        False,
+        False,
+        False,
+    ]
+    assert entities[1].entity_category == EntityCategory.DIAGNOSTIC
 
 
 @pytest.mark.asyncio
@@ -67,15 +81,7 @@ async def test_sensor_setup_entry(hass, enable_custom_integrations):
     devices = await hub.discover_devices()
 
     async def _update2():
-        return {
-            "alarm": {},
-            "zones": {},
-            "outputs": {},
-            "troubles": {},
-            "tamper": {},
-            "bypass": {},
-            "alarm_memory": {},
-        }
+        return SatelState()
 
     coordinator = DataUpdateCoordinator(
         hass,
@@ -109,15 +115,7 @@ async def test_switch_setup_entry(hass, enable_custom_integrations):
     devices = await hub.discover_devices()
 
     async def _update3():
-        return {
-            "outputs": {"1": "OFF"},
-            "zones": {},
-            "alarm": {},
-            "troubles": {},
-            "tamper": {},
-            "bypass": {},
-            "alarm_memory": {},
-        }
+        return SatelState()
 
     coordinator = DataUpdateCoordinator(
         hass,
@@ -135,3 +133,40 @@ async def test_switch_setup_entry(hass, enable_custom_integrations):
     entities = add_entities.call_args[0][0]
     assert len(entities) == 1
     assert entities[0].unique_id == "satel_output_1"
+
+
+@pytest.mark.asyncio
+async def test_zone_entity_layouts(hass, enable_custom_integrations):
+    devices = {"zones": [{"id": "1", "name": "Zone"}], "outputs": [], "partitions": []}
+    registry = er.async_get(hass)
+
+    async def _setup(layout):
+        entry = MockConfigEntry(domain=DOMAIN, options={CONF_ZONE_ENTITIES: layout})
+        entry.add_to_hass(hass)
+        coordinator = DataUpdateCoordinator(
+            hass,
+            logging.getLogger(__name__),
+            name="satel",
+            update_method=AsyncMock(return_value=SatelState()),
+            config_entry=entry,
+        )
+        entry.runtime_data = SatelRuntimeData(
+            SatelHub("host", 1234, "code"), devices, coordinator
+        )
+        added = []
+        await binary_sensor.async_setup_entry(hass, entry, added.extend)
+        await sensor.async_setup_entry(hass, entry, added.extend)
+        return [entity.unique_id for entity in added]
+
+    registry.async_get_or_create("sensor", DOMAIN, "satel_zone_status_1")
+    binary = await _setup(ZONE_ENTITIES_BINARY)
+    assert "satel_zone_1" in binary
+    assert "satel_zone_status_1" not in binary
+    assert "satel_zone_tamper_1" in binary
+    # The status sensor created with another layout is removed.
+    assert registry.async_get_entity_id("sensor", DOMAIN, "satel_zone_status_1") is None
+
+    status = await _setup(ZONE_ENTITIES_STATUS)
+    assert "satel_zone_1" not in status
+    assert "satel_zone_status_1" in status
+    assert "satel_zone_tamper_1" in status
@@ -0,0 +1,206 @@
+import asyncio
+import time
+
+import pytest
+from satel_integra.satel_integra import AlarmState
+
+from custom_components.satel import SatelHub
+from custom_components.satel.codec import FrameDecoder, encode_frame
+from custom_components.satel.proxy import SatelProxy
+from custom_components.satel.state import ATTR_VIOLATION
+
+
+class Client:
+    """A downstream ETHM-1 client connected to the proxy."""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._decoder = FrameDecoder()
+
+    @classmethod
+    async def connect(cls, proxy):
+        return cls(*await asyncio.open_connection("127.0.0.1", proxy.port))
+
+    async def request(self, command, data=b""):
+        self._writer.write(encode_frame(command, data))
+        await self._writer.drain()
+        while True:
+            chunk = await asyncio.wait_for(self._reader.read(1024), 1)
+            assert chunk
+            if frames := self._decoder.feed(chunk):
+                return frames[0]
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+@pytest.fixture
+async def proxy(socket_enabled, panel):
+    # The proxy serves real TCP clients on the loopback interface by default.
+    panel.partition_states = {AlarmState.ARMED_MODE0: [1, 3]}
+    panel.reported = {0x00: {5}}
+    panel.results = {0x88: 0x00, 0x89: 0x00}
+    hub = SatelHub("host", 1234, "code", timeout=1)
+    hub._satel = panel
+    proxy = SatelProxy(hub, 0)
+    await proxy.async_start()
+    yield proxy
+    await proxy.async_stop()
+    await hub.async_close()
+
+
+def _push_healthy(hub):
+    hub._monitor_task = asyncio.get_running_loop().create_future()
+    hub._last_frame = time.monotonic()
+
+
+def _polling(hub):
+    _push_healthy(hub)
+    hub._poll_task = asyncio.get_running_loop().create_future()
+
+
+@pytest.mark.asyncio
+async def test_listens_on_loopback_by_default(proxy):
+    assert [sock.getsockname()[0] for sock in proxy._server.sockets] == ["127.0.0.1"]
+
+
+@pytest.mark.asyncio
+async def test_reads_forwarded_without_push_updates(proxy):
+    panel = proxy._hub._satel
+    client = await Client.connect(proxy)
+
+    frame = await client.request(0x00)
+
+    assert frame.command == 0x00
+    assert frame.mask == 1 << 4
+    assert panel.commands == [0x00]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_answered_from_pushed_state(proxy):
+    hub = proxy._hub
+    panel = hub._satel
+    _push_healthy(hub)
+    # An INTEGRA 256 PLUS with every zone selected.
+    hub.fingerprint = "48" + b"1.23".hex()
+    hub.set_monitored_zones(list(range(1, 257)))
+    hub.state.update_zones(ATTR_VIOLATION, {2: 1, 200: 1})
+    client = await Client.connect(proxy)
+
+    zones = await client.request(0x00)
+    all_zones = await client.request(0x00, b"\xff")
+    armed = await client.request(0x0A)
+
+    assert zones.data == (1 << 1).to_bytes(16, "little")
+    assert all_zones.data == ((1 << 1) | (1 << 199)).to_bytes(32, "little")
+    assert armed.data == b"\x05\x00\x00\x00"
+    assert panel.received == []
+
+    # Neither pushed by the panel nor read by the hub: asked upstream.
+    panel.reported = {0x09: {2}}
+    suppressed = await client.request(0x09)
+    await client.request(0x01)
+    assert suppressed.data == b"\x02\x00\x00\x00"
+    assert panel.commands == [0x09, 0x01]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_of_unselected_devices_forwarded(proxy):
+    hub = proxy._hub
+    panel = hub._satel
+    _push_healthy(hub)
+    hub.fingerprint = "48" + b"1.23".hex()
+    hub.set_monitored_zones(list(range(1, 129)))
+    client = await Client.connect(proxy)
+
+    # Zones 1-128 are all selected; zone 5, violated, is known to the hub.
+    hub.state.update_zones(ATTR_VIOLATION, {5: 1})
+    zones = await client.request(0x00)
+    assert panel.received == []
+    # Zones above 128 are not, so the panel answers for them.
+    all_zones = await client.request(0x00, b"\xff")
+    await client.request(0x17)
+
+    assert zones.mask == all_zones.mask == 1 << 4
+    assert panel.commands == [0x00, 0x17]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_forwarded_and_monitoring_left_alone(proxy):
+    hub = proxy._hub
+    panel = hub._satel
+    _push_healthy(hub)
+    first = await Client.connect(proxy)
+    second = await Client.connect(proxy)
+
+    results = await asyncio.gather(
+        first.request(0x88, b"\x12\x34" + bytes(16)),
+        second.request(0x89, b"\x12\x34" + bytes(16)),
+    )
+    monitor = await first.request(0x7F, b"\xff" * 12)
+
+    assert [frame.command for frame in results] == [0xEF, 0xEF]
+    assert [frame.data for frame in results] == [b"\x00", b"\x00"]
+    assert monitor == (0xEF, b"\xff")
+    assert sorted(panel.commands) == [0x88, 0x89]
+    assert panel._message_handlers == {}
+
+    stats = proxy.stats["clients"]
+    assert len(stats) == 2
+    assert sum(client["forwarded"] for client in stats) == 2
+    assert sum(client["cached"] for client in stats) == 1
+    assert all(client["bytes_out_per_s"] > 0 for client in stats)
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_stop_disconnects_clients(proxy):
+    client = await Client.connect(proxy)
+    await client.request(0x7E)
+    assert proxy.served == 1
+
+    await proxy.async_stop()
+
+    assert proxy.stats["clients"] == []
+    assert await client._reader.read(1024) == b""
+
+
+@pytest.mark.asyncio
+async def test_change_flags_left_to_the_polling_hub(proxy):
+    hub = proxy._hub
+    panel = hub._satel
+    client = await Client.connect(proxy)
+
+    # Before the hub polls, the flags are read from the panel.
+    await client.request(0x7F)
+    assert panel.commands == [0x7F]
+
+    _polling(hub)
+    hub.fingerprint = "48" + b"1.23".hex()
+    hub.set_monitored_zones([1, 2, 130])
+    panel.flags = {0x00}
+    panel.reported = {0x00: {2, 130}}
+    assert await hub.async_poll_changes() == [0x00]
+    panel.received.clear()
+
+    flagged = await client.request(0x7F)
+    cleared = await client.request(0x7F)
+    # Not every zone is selected: the read goes to the panel and the
+    # hub keeps the answer, whose flag it cleared.
+    panel.reported = {0x00: {1, 130}}
+    zones = await client.request(0x00, b"\xff")
+
+    assert flagged == (0x7F, (1 << 0x00).to_bytes(6, "little"))
+    assert cleared == (0x7F, bytes(6))
+    assert zones.mask == (1 << 0) | (1 << 129)
+    assert panel.commands == [0x00]
+    assert hub.state.zone_violated(1) is True
+    assert hub.state.zone_violated(2) is False
+    assert hub.state.zone_violated(130) is True
+    await client.close()
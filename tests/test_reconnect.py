@@ -0,0 +1,125 @@
+import asyncio
+import logging
+
+import pytest
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.satel import SatelHub
+from custom_components.satel.codec import FrameDecoder, encode_frame
+from custom_components.satel.reconnect import ReconnectBackoff
+
+
+def test_backoff_grows_to_cap_with_jitter():
+    backoff = ReconnectBackoff(10, initial=1, jitter=0.5, rand=lambda: 0.0)
+    assert [backoff.next_delay() for _ in range(7)] == [0, 1, 2, 4, 8, 10, 10]
+
+    jittered = ReconnectBackoff(10, initial=1, jitter=0.5, rand=lambda: 1.0)
+    assert [jittered.next_delay() for _ in range(4)] == [0, 0.5, 1, 2]
+
+
+def test_backoff_reset_retries_immediately():
+    backoff = ReconnectBackoff(30, rand=lambda: 0.0)
+    for _ in range(4):
+        backoff.next_delay()
+    backoff.reset()
+
+    assert backoff.next_delay() == 0
+    assert backoff.next_delay() == 1
+    assert backoff.stats["attempts"] == 6
+
+
+class PanelServer:
+    """A panel on the loopback interface answering state queries."""
+
+    def __init__(self):
+        self.connections = 0
+        self.queries = []
+        self.tampered = 0
+        self.armed = 0
+        self._writers = []
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.drop()
+        self._server.close()
+        await self._server.wait_closed()
+
+    def drop(self):
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
+
+    def _answer(self, command, data):
+        if command == 0x7F:
+            # Nothing changed, or monitoring accepted.
+            return encode_frame(0x7F, bytes(6)) if not data else encode_frame(0xEF, b"\xff")
+        self.queries.append(command)
+        length = 32 if data else 16
+        if command == 0x01:
+            return encode_frame(command, self.tampered.to_bytes(length, "little"))
+        if command == 0x0A:
+            return encode_frame(command, self.armed.to_bytes(4, "little"))
+        if command in (0x00, 0x04, 0x06, 0x07, 0x17):
+            return encode_frame(command, bytes(length))
+        return encode_frame(command, bytes(4))
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        self._writers.append(writer)
+        decoder = FrameDecoder()
+        while data := await reader.read(1024):
+            for frame in decoder.feed(data):
+                writer.write(self._answer(frame.command, frame.data))
+        writer.close()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_resyncs_state_missed_while_down(hass, socket_enabled):
+    panel = PanelServer()
+    port = await panel.start()
+    hub = SatelHub("127.0.0.1", port, "code", timeout=2, reconnect_delay=1)
+    await hub.connect()
+    hub.set_monitored_zones([1, 2, 3])
+    hub.set_monitored_partitions([1, 2])
+    coordinator = DataUpdateCoordinator(
+        hass,
+        logging.getLogger(__name__),
+        name="satel",
+        update_method=hub.get_overview,
+        config_entry=MockConfigEntry(domain="satel"),
+    )
+    await coordinator.async_refresh()
+    await hub.start_monitoring(hass, coordinator)
+    await asyncio.sleep(0.05)
+
+    # The panel changes while the link is down.
+    panel.tampered = 0b100
+    panel.armed = 0b10
+    panel.drop()
+    for _ in range(100):
+        await asyncio.sleep(0.02)
+        if hub.metrics["reconnect"]["time_to_consistent_ms"] is not None:
+            break
+    await hass.async_block_till_done()
+
+    reconnect = hub.metrics["reconnect"]
+    assert panel.connections == 2
+    assert reconnect["reconnects"] == 1
+    assert reconnect["disconnected"] is False
+    assert reconnect["time_to_consistent_ms"] > 0
+    # One batch covering every state group.
+    assert sorted(panel.queries) == sorted(
+        [0x00, 0x01, 0x04, 0x06, 0x07, 0x17]
+        + [0x09, 0x0A, 0x2A, 0x0B, 0x0C, 0x0E, 0x0F, 0x10, 0x13, 0x14]
+    )
+    assert coordinator.data.zone("tamper", 3) is True
+    assert coordinator.data.zone("tamper", 1) is False
+    assert coordinator.data.partition(2) == "ARMED_AWAY"
+    assert hub.push_healthy
+
+    await hub.async_close()
+    await panel.stop()
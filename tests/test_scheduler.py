@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from custom_components.satel.scheduler import (
+    PRIORITY_ARM,
+    PRIORITY_DISARM,
+    PRIORITY_OUTPUT,
+    CommandScheduler,
+)
+
+
+def _recorder(sent: list, name: str, delay: float = 0):
+    async def _send() -> str:
+        await asyncio.sleep(delay)
+        sent.append(name)
+        return name
+
+    return _send
+
+
+@pytest.mark.asyncio
+async def test_commands_run_by_priority_and_outputs_coalesce():
+    scheduler = CommandScheduler(timeout=5)
+    sent: list[str] = []
+
+    first = asyncio.ensure_future(
+        scheduler.submit(PRIORITY_OUTPUT, _recorder(sent, "out1"), key=("output", 1))
+    )
+    await asyncio.sleep(0)
+    queued = [
+        scheduler.submit(PRIORITY_OUTPUT, _recorder(sent, "out2 on"), key=("output", 2)),
+        scheduler.submit(PRIORITY_ARM, _recorder(sent, "arm")),
+        scheduler.submit(PRIORITY_OUTPUT, _recorder(sent, "out2 off"), key=("output", 2)),
+        scheduler.submit(PRIORITY_DISARM, _recorder(sent, "disarm")),
+    ]
+
+    results = await asyncio.gather(first, *queued)
+
+    assert sent == ["out1", "disarm", "arm", "out2 off"]
+    assert results == ["out1", "out2 off", "arm", "out2 off", "disarm"]
+    stats = scheduler.stats
+    assert stats["submitted"] == 5
+    assert stats["sent"] == 4
+    assert stats["coalesced"] == 1
+    assert stats["max_depth"] == 3
+    assert stats["depth"] == 0
+    assert stats["latency_ms"]["output"]["count"] == 2
+    assert stats["latency_ms"]["disarm"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_command_timeout_and_failure():
+    scheduler = CommandScheduler(timeout=5)
+    sent: list[str] = []
+
+    with pytest.raises(ConnectionError):
+        await scheduler.submit(
+            PRIORITY_OUTPUT, _recorder(sent, "slow", delay=1), timeout=0.01
+        )
+
+    async def _broken() -> None:
+        raise OSError("boom")
+
+    with pytest.raises(OSError):
+        await scheduler.submit(PRIORITY_ARM, _broken)
+
+    assert sent == []
+    assert scheduler.stats["timeouts"] == 1
+    assert scheduler.stats["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_close_fails_queued_commands():
+    scheduler = CommandScheduler(timeout=5)
+    sent: list[str] = []
+
+    running = asyncio.ensure_future(
+        scheduler.submit(PRIORITY_OUTPUT, _recorder(sent, "slow", delay=1))
+    )
+    waiting = asyncio.ensure_future(
+        scheduler.submit(PRIORITY_OUTPUT, _recorder(sent, "next"))
+    )
+    await asyncio.sleep(0)
+
+    await scheduler.async_close()
+
+    for future in (running, waiting):
+        with pytest.raises(ConnectionError):
+            await future
+    assert sent == []
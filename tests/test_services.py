@@ -0,0 +1,118 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.satel.const import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    DOMAIN,
+    SERVICE_ARM_PARTITIONS,
+    SERVICE_DISARM_PARTITIONS,
+    SERVICE_SET_OUTPUTS,
+)
+from custom_components.satel.state import SatelState
+
+
+async def _setup(hass, host=DEFAULT_HOST):
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_HOST: host, CONF_PORT: DEFAULT_PORT})
+    entry.add_to_hass(hass)
+    with patch("custom_components.satel.SatelHub.connect", AsyncMock()), \
+        patch(
+            "custom_components.satel.SatelHub.start_monitoring",
+            AsyncMock(return_value=Mock()),
+        ), \
+        patch(
+            "custom_components.satel.SatelHub.discover_devices",
+            AsyncMock(return_value={"zones": [], "outputs": []}),
+        ), \
+        patch(
+            "custom_components.satel.SatelHub.get_overview",
+            AsyncMock(return_value=SatelState()),
+        ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return entry
+
+
+@pytest.mark.asyncio
+async def test_partition_services(hass, enable_custom_integrations):
+    entry = await _setup(hass)
+    hub = entry.runtime_data.hub
+    hub.arm_partitions = AsyncMock(
+        return_value={
+            1: {"state": "ARMED_NIGHT", "confirmed": True},
+            2: {"state": "DISARMED", "confirmed": False},
+        }
+    )
+    hub.disarm_partitions = AsyncMock(
+        return_value={4: {"state": "DISARMED", "confirmed": True}}
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_ARM_PARTITIONS,
+        {"partitions": ["1", 2], "mode": "night"},
+        blocking=True,
+        return_response=True,
+    )
+    hub.arm_partitions.assert_awaited_once_with([1, 2], 2)
+    assert response == {
+        "partitions": {
+            "1": {"state": "armed_night", "confirmed": True},
+            "2": {"state": "disarmed", "confirmed": False},
+        }
+    }
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_DISARM_PARTITIONS,
+        {"partitions": 4, "config_entry_id": entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+    hub.disarm_partitions.assert_awaited_once_with([4])
+    assert response == {"partitions": {"4": {"state": "disarmed", "confirmed": True}}}
+
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_set_outputs_service(hass, enable_custom_integrations):
+    entry = await _setup(hass)
+    hub = entry.runtime_data.hub
+    hub.set_outputs = AsyncMock()
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_OUTPUTS,
+        {"turn_on": [1, "2"], "turn_off": 3},
+        blocking=True,
+    )
+    hub.set_outputs.assert_awaited_once_with({1: True, 2: True, 3: False})
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_OUTPUTS,
+            {"turn_on": [1], "turn_off": [1]},
+            blocking=True,
+        )
+
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_partition_services_need_entry_when_ambiguous(hass, enable_custom_integrations):
+    first = await _setup(hass, "10.0.0.1")
+    second = await _setup(hass, "10.0.0.2")
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DISARM_PARTITIONS, {"partitions": [1]}, blocking=True
+        )
+
+    for entry in (first, second):
+        await hass.config_entries.async_unload(entry.entry_id)
@@ -1,8 +1,10 @@
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
+from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.satel.const import (
@@ -14,11 +16,26 @@ from custom_components.satel.const import (
     CONF_TIMEOUT,
     CONF_RECONNECT_DELAY,
     CONF_ENCRYPTION_METHOD,
+    CONF_COALESCE_WINDOW,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_TIMEOUT,
     DEFAULT_RECONNECT_DELAY,
     DEFAULT_ENCRYPTION_METHOD,
+    ENCRYPTION_METHOD_INTEGRATION_KEY,
 )
+from custom_components.satel.cache import DeviceCache
+from custom_components.satel.state import SatelState
+
+
+def _overview(
+    alarm: dict[int, str] | None = None, outputs: dict[int, bool] | None = None
+) -> SatelState:
+    data = SatelState()
+    for part, state in (alarm or {}).items():
+        data.set_partition(part, state)
+    for output, state in (outputs or {}).items():
+        data.set_output(output, state)
+    return data
 
 
 @pytest.mark.asyncio
@@ -38,21 +55,13 @@ async def test_setup_creates_entities(hass, enable_custom_integrations):
         ), \
         patch(
             "custom_components.satel.SatelHub.get_overview",
-            AsyncMock(
-                return_value={
-                    "alarm": {"1": "TRIGGERED"},
-                    "zones": {},
-                    "outputs": {},
-                    "troubles": {},
-                    "tamper": {},
-                    "bypass": {},
-                    "alarm_memory": {},
-                }
-            ),
+            AsyncMock(return_value=_overview(alarm={1: "TRIGGERED"})),
         ):
         assert await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
 
+    assert entry.runtime_data.coordinator.update_interval is None
+
     state = hass.states.get("binary_sensor.satel_alarm")
     assert state is not None
     assert state.state == "on"
@@ -73,6 +82,7 @@ async def test_switch_services(hass, enable_custom_integrations):
             "custom_components.satel.SatelHub.start_monitoring",
             AsyncMock(return_value=Mock()),
         ), \
+        patch("custom_components.satel.SatelHub.use_devices"), \
         patch(
             "custom_components.satel.SatelHub.discover_devices",
             AsyncMock(
@@ -86,51 +96,11 @@ async def test_switch_services(hass, enable_custom_integrations):
             "custom_components.satel.SatelHub.get_overview",
             AsyncMock(
                 side_effect=[
-                    {
-                        "alarm": {"1": "READY"},
-                        "zones": {},
-                        "outputs": {"1": "OFF"},
-                        "troubles": {},
-                        "tamper": {},
-                        "bypass": {},
-                        "alarm_memory": {},
-                    },
-                    {
-                        "alarm": {"1": "READY"},
-                        "zones": {},
-                        "outputs": {"1": "ON"},
-                        "troubles": {},
-                        "tamper": {},
-                        "bypass": {},
-                        "alarm_memory": {},
-                    },
-                    {
-                        "alarm": {"1": "READY"},
-                        "zones": {},
-                        "outputs": {"1": "ON"},
-                        "troubles": {},
-                        "tamper": {},
-                        "bypass": {},
-                        "alarm_memory": {},
-                    },
-                    {
-                        "alarm": {"1": "READY"},
-                        "zones": {},
-                        "outputs": {"1": "OFF"},
-                        "troubles": {},
-                        "tamper": {},
-                        "bypass": {},
-                        "alarm_memory": {},
-                    },
-                    {
-                        "alarm": {"1": "READY"},
-                        "zones": {},
-                        "outputs": {"1": "OFF"},
-                        "troubles": {},
-                        "tamper": {},
-                        "bypass": {},
-                        "alarm_memory": {},
-                    },
+                    _overview(alarm={1: "READY"}, outputs={1: False}),
+                    _overview(alarm={1: "READY"}, outputs={1: True}),
+                    _overview(alarm={1: "READY"}, outputs={1: True}),
+                    _overview(alarm={1: "READY"}, outputs={1: False}),
+                    _overview(alarm={1: "READY"}, outputs={1: False}),
                 ]
             ),
         ), \
@@ -171,6 +141,7 @@ async def test_setup_uses_options(hass, enable_custom_integrations):
             CONF_TIMEOUT: 2,
             CONF_RECONNECT_DELAY: 3,
             CONF_ENCRYPTION_METHOD: DEFAULT_ENCRYPTION_METHOD,
+            CONF_COALESCE_WINDOW: 4,
         },
     )
     entry.add_to_hass(hass)
@@ -180,17 +151,8 @@ async def test_setup_uses_options(hass, enable_custom_integrations):
         hub.connect = AsyncMock()
         hub.start_monitoring = AsyncMock(return_value=Mock())
         hub.discover_devices = AsyncMock(return_value={"zones": [], "outputs": []})
-        hub.get_overview = AsyncMock(
-            return_value={
-                "alarm": {},
-                "zones": {},
-                "outputs": {},
-                "troubles": {},
-                "tamper": {},
-                "bypass": {},
-                "alarm_memory": {},
-            }
-        )
+        hub.async_fingerprint = AsyncMock(return_value=None)
+        hub.get_overview = AsyncMock(return_value=SatelState())
         hub.async_close = AsyncMock()
         hub.host = DEFAULT_HOST
 
@@ -208,6 +170,7 @@ async def test_setup_uses_options(hass, enable_custom_integrations):
         timeout=2,
         reconnect_delay=3,
         encryption_method=DEFAULT_ENCRYPTION_METHOD,
+        coalesce_window=4,
     )
 
 
@@ -230,17 +193,7 @@ async def test_monitor_task_cancelled_on_unload(hass, enable_custom_integrations
         ), \
         patch(
             "custom_components.satel.SatelHub.get_overview",
-            AsyncMock(
-                return_value={
-                    "alarm": {},
-                    "zones": {},
-                    "outputs": {},
-                    "troubles": {},
-                    "tamper": {},
-                    "bypass": {},
-                    "alarm_memory": {},
-                }
-            ),
+            AsyncMock(return_value=SatelState()),
         ):
         assert await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
@@ -268,3 +221,98 @@ async def test_setup_connection_error_raises_not_ready(hass, enable_custom_integ
             await async_setup_entry(hass, entry)
 
     mock_close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_setup_invalid_encryption_key_is_not_retried(hass, enable_custom_integrations):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_HOST: DEFAULT_HOST,
+            CONF_PORT: DEFAULT_PORT,
+            CONF_ENCRYPTION_METHOD: ENCRYPTION_METHOD_INTEGRATION_KEY,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    from custom_components.satel import async_setup_entry
+
+    with pytest.raises(ConfigEntryError):
+        await async_setup_entry(hass, entry)
+
+
+@pytest.mark.asyncio
+async def test_setup_discovers_devices_in_background(hass, enable_custom_integrations):
+    """Entities come from the cache at once; discovery then adds and retires them."""
+    await DeviceCache(hass, DEFAULT_HOST).async_save(
+        "abc",
+        {
+            "zones": [{"id": "1", "name": "Hall"}, {"id": "2", "name": "Garage"}],
+            "outputs": [],
+            "partitions": [],
+        },
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_HOST: DEFAULT_HOST, CONF_PORT: DEFAULT_PORT})
+    entry.add_to_hass(hass)
+    release = asyncio.Event()
+    fresh = {
+        "zones": [{"id": "1", "name": "Hall"}, {"id": "3", "name": "Attic"}],
+        "outputs": [],
+        "partitions": [],
+    }
+
+    async def _discover():
+        await release.wait()
+        return fresh
+
+    def _zone_ids() -> set[str]:
+        return {
+            entity.unique_id
+            for entity in er.async_entries_for_config_entry(
+                er.async_get(hass), entry.entry_id
+            )
+            if entity.domain == "binary_sensor" and entity.entity_category is None
+        }
+
+    with patch("custom_components.satel.SatelHub.connect", AsyncMock()), \
+        patch(
+            "custom_components.satel.SatelHub.start_monitoring",
+            AsyncMock(return_value=Mock()),
+        ), \
+        patch(
+            "custom_components.satel.SatelHub.async_fingerprint",
+            AsyncMock(return_value="abc"),
+        ), \
+        patch("custom_components.satel.SatelHub.use_devices"), \
+        patch("custom_components.satel.SatelHub.discover_devices", side_effect=_discover), \
+        patch(
+            "custom_components.satel.SatelHub.get_overview",
+            AsyncMock(return_value=SatelState()),
+        ), \
+        patch.object(hass.config_entries, "async_schedule_reload") as reload:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        assert _zone_ids() == {"satel_zone_1", "satel_zone_2"}
+
+        release.set()
+        await hass.async_block_till_done()
+
+        # Zone 2 keeps its registry entry, shown unavailable.
+        assert _zone_ids() == {"satel_zone_1", "satel_zone_2", "satel_zone_3"}
+        registry = er.async_get(hass)
+        gone = registry.async_get_entity_id("binary_sensor", DOMAIN, "satel_zone_2")
+        assert hass.states.get(gone).state == "unavailable"
+        kept = registry.async_get_entity_id("binary_sensor", DOMAIN, "satel_zone_1")
+        assert hass.states.get(kept).state != "unavailable"
+        reload.assert_not_called()
+        assert entry.runtime_data.devices == fresh
+        assert set(entry.runtime_data.hub.metrics["startup_ms"]) == {
+            "connect",
+            "first_refresh",
+            "monitoring",
+            "load_devices",
+            "platforms",
+            "discovery",
+        }
+
+        await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,141 @@
+import pytest
+
+from custom_components.satel.state import (
+    ATTR_BYPASS,
+    ATTR_OUTPUTS,
+    ATTR_TAMPER,
+    ATTR_VIOLATION,
+    BitArray,
+    PartitionMasks,
+    SatelState,
+)
+
+
+def test_bit_array_tracks_known_bits():
+    bits = BitArray(16)
+
+    assert bits.get(1) is None
+    assert bits.set(1, False)
+    assert bits.get(1) is False
+    assert not bits.set(1, False)
+    assert bits.set(1, True)
+    assert bits.get(1) is True
+    assert bits.set(16, True)
+    assert bits.get(16) is True
+    assert bits.get(2) is None
+
+
+def test_bit_array_ignores_out_of_range_ids():
+    bits = BitArray(8)
+
+    assert not bits.set(0, True)
+    assert not bits.set(9, True)
+    assert bits.get(0) is None
+    assert bits.get(9) is None
+
+
+def test_partition_masks_derive_changed_partitions_only():
+    masks = PartitionMasks()
+
+    assert masks.update({"ARMED_MODE0": [1, 2], "TRIGGERED": []}) == [
+        (1, "ARMED_AWAY"),
+        (2, "ARMED_AWAY"),
+    ]
+    assert masks.update({"ARMED_MODE0": [1, 2], "TRIGGERED": [2]}) == [
+        (2, "TRIGGERED"),
+    ]
+    assert masks.update({"ARMED_MODE0": [1, 2], "TRIGGERED": [2]}) == []
+    # Partitions gone from every list are disarmed.
+    assert masks.update({"ARMED_MODE0": [], "TRIGGERED": [2]}) == [
+        (1, "DISARMED"),
+        (2, "TRIGGERED"),
+    ]
+
+
+def test_partition_masks_cover_wanted_partitions():
+    masks = PartitionMasks()
+
+    assert masks.update({"ARMED_MODE1": [3, 4]}, wanted=0b101) == [
+        (1, "DISARMED"),
+        (3, "ARMED_HOME"),
+    ]
+    assert masks.update({"ARMED_MODE1": [4]}, wanted=0b101) == [(3, "DISARMED")]
+
+
+def test_state_copy_is_independent():
+    state = SatelState()
+    state.set_zone(ATTR_VIOLATION, 3, True)
+    state.set_output(200, True)
+    state.set_partition(1, "ARMED_AWAY")
+
+    copy = state.copy()
+    state.set_zone(ATTR_VIOLATION, 3, False)
+    state.set_zone(ATTR_TAMPER, 3, True)
+    state.set_partition(1, "DISARMED")
+
+    assert copy.zone_violated(3) is True
+    assert copy.zone(ATTR_TAMPER, 3) is None
+    assert copy.output(200) is True
+    assert copy.partition(1) == "ARMED_AWAY"
+    assert not state.set_partition(1, "DISARMED")
+
+
+def test_zone_record_follows_ingested_changes():
+    state = SatelState()
+    state.set_zone(ATTR_VIOLATION, 5, True)
+
+    record = state.zone_record(5)
+    assert state.zone_record(5) is record
+    assert record.violation is True
+    assert record.tamper is None
+    assert record.status == "on"
+
+    state.update_zones(ATTR_BYPASS, {5: True, 6: True})
+    assert record.bypass is True
+    assert record.status == "bypass"
+
+    state.set_zone(ATTR_TAMPER, 5, True)
+    assert record.status == "tamper"
+
+    state.update_zones(ATTR_TAMPER, {5: False})
+    state.update_zones(ATTR_BYPASS, {5: False})
+    state.set_zone(ATTR_VIOLATION, 5, False)
+    assert record.status == "off"
+    assert state.zone_record(6).status == "bypass"
+
+
+def test_snapshot_is_versioned_and_shares_unchanged_attributes():
+    state = SatelState()
+    state.set_zone(ATTR_VIOLATION, 1, True)
+    state.set_output(2, True)
+
+    first = state.snapshot()
+    assert state.snapshot() is first
+    assert first.zone_violated(1) is True
+    assert first.output(2) is True
+
+    state.set_output(2, True)
+    assert state.snapshot() is first
+
+    state.set_zone(ATTR_VIOLATION, 1, False)
+    state.set_partition(1, "ARMED_AWAY")
+    second = state.snapshot()
+
+    assert second is not first
+    assert second.version > first.version
+    assert first.zone_violated(1) is True
+    assert second.zone_violated(1) is False
+    assert first.partition(1) is None
+    assert second.partition(1) == "ARMED_AWAY"
+    assert second._bits[ATTR_OUTPUTS] is first._bits[ATTR_OUTPUTS]
+    assert second._bits[ATTR_VIOLATION] is not first._bits[ATTR_VIOLATION]
+
+
+def test_snapshot_is_read_only():
+    state = SatelState()
+    state.set_partition(1, "DISARMED")
+    snapshot = state.snapshot()
+
+    with pytest.raises(TypeError):
+        snapshot.alarm[1] = "TRIGGERED"  # type: ignore[index]
+    assert not hasattr(snapshot, "set_zone")
@@ -1,6 +1,6 @@
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
 import logging
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
@@ -10,51 +10,62 @@ from custom_components.satel import SatelHub
 from custom_components.satel.switch import SatelOutputSwitch
 
 
-@pytest.mark.asyncio
-async def test_turn_on_requests_refresh(hass):
-    hub = SatelHub("host", 1234, "code")
-    hub.set_output = AsyncMock()
+def _switch(hass, hub, state: bool) -> SatelOutputSwitch:
+    hub._satel = AsyncMock()
+    hub._satel.close = Mock()
+    # The panel accepts every command.
+    hub._satel._message_handlers = {}
+    hub._satel.set_output.side_effect = lambda *args: hub._satel._message_handlers[
+        b"\xef"
+    ](b"\xef\x00")
+    hub.state.set_output(1, state)
     coordinator = DataUpdateCoordinator(
         hass,
         logging.getLogger(__name__),
         name="satel",
-        update_method=AsyncMock(return_value={"outputs": {"1": "OFF"}}),
+        update_method=AsyncMock(return_value=hub.state.snapshot()),
         config_entry=MockConfigEntry(domain="satel"),
     )
-    switch = SatelOutputSwitch(hub, coordinator, "1", "Out")
-    switch.async_write_ha_state = MagicMock()
-    async def refresh():
-        coordinator.data = {"outputs": {"1": "ON"}}
-    switch.coordinator.async_request_refresh = AsyncMock(side_effect=refresh)
-    coordinator.data = {"outputs": {"1": "OFF"}}
+    coordinator.data = hub.state.snapshot()
+    hub._coordinator = coordinator
+    return SatelOutputSwitch(hub, coordinator, "1", "Out")
+
+
+@pytest.mark.asyncio
+async def test_turn_on_is_shown_until_confirmed(hass):
+    hub = SatelHub("host", 1234, "code")
+    switch = _switch(hass, hub, False)
 
     await switch.async_turn_on()
+    await asyncio.sleep(0)
 
+    hub._satel.set_output.assert_awaited_once_with("code", 1, True)
     assert switch.is_on
-    switch.async_write_ha_state.assert_not_called()
-    switch.coordinator.async_request_refresh.assert_called_once()
+    # A report from before the command does not flip the switch back.
+    hub._apply_outputs({1: 0})
+    assert hub.state.output(1) is True
+    hub._apply_outputs({1: 1})
+
+    confirmations = hub.metrics["confirmations"]
+    assert confirmations["confirmed"] == 1
+    assert confirmations["pending"] == 0
+    assert confirmations["last_latency_ms"] >= 0
+    hub._apply_outputs({1: 0})
+    assert hub.state.output(1) is False
+    await hub.async_close()
 
 
 @pytest.mark.asyncio
-async def test_turn_off_requests_refresh(hass):
-    hub = SatelHub("host", 1234, "code")
-    hub.set_output = AsyncMock()
-    coordinator = DataUpdateCoordinator(
-        hass,
-        logging.getLogger(__name__),
-        name="satel",
-        update_method=AsyncMock(return_value={"outputs": {"1": "ON"}}),
-        config_entry=MockConfigEntry(domain="satel"),
-    )
-    switch = SatelOutputSwitch(hub, coordinator, "1", "Out")
-    switch.async_write_ha_state = MagicMock()
-    async def refresh_off():
-        coordinator.data = {"outputs": {"1": "OFF"}}
-    switch.coordinator.async_request_refresh = AsyncMock(side_effect=refresh_off)
-    coordinator.data = {"outputs": {"1": "ON"}}
+async def test_unconfirmed_turn_off_is_rolled_back(hass):
+    hub = SatelHub("host", 1234, "code", timeout=0.05)
+    switch = _switch(hass, hub, True)
 
     await switch.async_turn_off()
-
+    await asyncio.sleep(0)
     assert not switch.is_on
-    switch.async_write_ha_state.assert_not_called()
-    switch.coordinator.async_request_refresh.assert_called_once()
+
+    await asyncio.sleep(0.1)
+
+    assert switch.is_on
+    assert hub.metrics["confirmations"]["rolled_back"] == 1
+    await hub.async_close()
@@ -1,33 +1,43 @@
 from unittest.mock import MagicMock
 
 from custom_components.satel.sensor import SatelZoneSensor
+from custom_components.satel.state import (
+    ATTR_ALARM_MEMORY,
+    ATTR_BYPASS,
+    ATTR_TAMPER,
+    ATTR_TROUBLES,
+    ATTR_VIOLATION,
+    ZONE_ATTRIBUTES,
+    SatelState,
+)
 
 
 def test_zone_sensor_native_value_precedence():
     hub = MagicMock()
     coordinator = MagicMock()
-    coordinator.data = {
-        "zones": {"1": "ON"},
-        "tamper": {"1": "OFF"},
-        "troubles": {"1": "OFF"},
-        "bypass": {"1": "OFF"},
-        "alarm_memory": {"1": "OFF"},
-    }
+    coordinator.data = SatelState()
+    hub.zone_record = coordinator.data.zone_record
     sensor = SatelZoneSensor(hub, coordinator, "1", "Zone")
 
+    assert sensor.native_value is None
+
+    for attr in ZONE_ATTRIBUTES:
+        coordinator.data.set_zone(attr, 1, False)
+    coordinator.data.set_zone(ATTR_VIOLATION, 1, True)
+
     assert sensor.native_value == "on"
 
-    coordinator.data["tamper"]["1"] = "ON"
+    coordinator.data.set_zone(ATTR_TAMPER, 1, True)
     assert sensor.native_value == "tamper"
 
-    coordinator.data["tamper"]["1"] = "OFF"
-    coordinator.data["troubles"]["1"] = "ON"
+    coordinator.data.set_zone(ATTR_TAMPER, 1, False)
+    coordinator.data.set_zone(ATTR_TROUBLES, 1, True)
     assert sensor.native_value == "trouble"
 
-    coordinator.data["troubles"]["1"] = "OFF"
-    coordinator.data["bypass"]["1"] = "ON"
+    coordinator.data.set_zone(ATTR_TROUBLES, 1, False)
+    coordinator.data.set_zone(ATTR_BYPASS, 1, True)
     assert sensor.native_value == "bypass"
 
-    coordinator.data["bypass"]["1"] = "OFF"
-    coordinator.data["alarm_memory"]["1"] = "ON"
+    coordinator.data.set_zone(ATTR_BYPASS, 1, False)
+    coordinator.data.set_zone(ATTR_ALARM_MEMORY, 1, True)
     assert sensor.native_value == "alarm_memory"